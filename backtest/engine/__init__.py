@@ -0,0 +1,4 @@
+# fx_trader/backtest/engine/__init__.py
+from .njit_runner import build_signals, run_njit_backtest, simulate
+
+__all__ = ["build_signals", "run_njit_backtest", "simulate"]
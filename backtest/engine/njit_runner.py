@@ -0,0 +1,147 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from backtest.kernels import cached_indicator, make_bollinger, make_ema_crossover, make_rsi
+from utils._njit import njit
+
+# Columns of the trades array returned by `simulate`
+TRADE_DTYPE = np.dtype([
+    ("entry_idx", np.int64),
+    ("exit_idx", np.int64),
+    ("entry_price", np.float64),
+    ("exit_price", np.float64),
+    ("size", np.float64),
+    ("pnl", np.float64),
+    ("pnlcomm", np.float64),
+])
+
+
+@njit(cache=True)
+def simulate(open_, close, signal, cash, comm_rate, slip_rate, stake):
+    """
+    Long-only event loop over precomputed signals.
+
+    signal[i] is +1 (buy), -1 (sell/close) or 0, evaluated at the close of bar i
+    and filled at open[i + 1] adjusted by slippage, like a Backtrader market
+    order. A new signal is ignored while an order is pending. Returns
+    (equity, trades) where trades is a (n_trades, 7) float array laid out as
+    TRADE_DTYPE.
+    """
+    n = close.size
+    equity = np.empty(n)
+    trades = np.empty((n // 2 + 1, 7))
+    n_trades = 0
+    position = 0.0
+    entry_price = 0.0
+    entry_comm = 0.0
+    entry_idx = 0
+    pending = 0
+    for i in range(n):
+        if pending > 0 and position == 0.0:
+            price = open_[i] * (1.0 + slip_rate)
+            entry_comm = price * stake * comm_rate
+            cash -= price * stake + entry_comm
+            position = stake
+            entry_price = price
+            entry_idx = i
+        elif pending < 0 and position > 0.0:
+            price = open_[i] * (1.0 - slip_rate)
+            exit_comm = price * position * comm_rate
+            cash += price * position - exit_comm
+            pnl = (price - entry_price) * position
+            trades[n_trades, 0] = entry_idx
+            trades[n_trades, 1] = i
+            trades[n_trades, 2] = entry_price
+            trades[n_trades, 3] = price
+            trades[n_trades, 4] = position
+            trades[n_trades, 5] = pnl
+            trades[n_trades, 6] = pnl - entry_comm - exit_comm
+            n_trades += 1
+            position = 0.0
+        pending = 0
+
+        s = signal[i]
+        if s > 0 and position == 0.0:
+            pending = 1
+        elif s < 0 and position > 0.0:
+            pending = -1
+        equity[i] = cash + position * close[i]
+    return equity, trades[:n_trades]
+
+
+def build_signals(
+    strategy_name: str, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None
+) -> np.ndarray:
+    """Builds the +1/-1/0 signal array equivalent to the Backtrader strategy's next()."""
+    params = params or {}
+    close = df["close"].to_numpy()  # float32 frames go to the kernels as-is
+
+    if strategy_name == "EMACrossover":
+        kernel = make_ema_crossover(params.get("ema_short_period", 10),
+                                    params.get("ema_long_period", 30))
+        return cached_indicator(kernel, close)
+
+    if strategy_name == "RSI":
+        rsi = cached_indicator(make_rsi(params.get("rsi_period", 14)), close)
+        return np.where(rsi < params.get("rsi_oversold", 30), 1.0,
+                        np.where(rsi > params.get("rsi_overbought", 70), -1.0, 0.0))
+
+    if strategy_name == "BollingerBands":
+        mid, top, bot = cached_indicator(
+            make_bollinger(params.get("bb_period", 20), params.get("bb_devfactor", 2.0)), close)
+        return np.where(close < bot, 1.0,
+                        np.where((close > mid) | (close > top), -1.0, 0.0))
+
+    raise ValueError(f"No njit signal builder for strategy '{strategy_name}'.")
+
+
+def run_njit_backtest(
+    strategy_name: str,
+    df: pd.DataFrame,
+    params: Optional[Dict[str, Any]] = None,
+    cash: float = 100000.0,
+    comm_bps: float = 2.0,
+    slippage_bps: float = 0.0,
+    stake: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Runs `strategy_name` on `df` with the compiled simulator.
+    Returns the same result layout as backtest.vectorized.simulate_ema_crossover.
+    """
+    signal = build_signals(strategy_name, df, params)
+    equity_arr, trades_arr = simulate(
+        df["open"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        signal,
+        float(cash),
+        comm_bps / 10000.0,
+        slippage_bps / 10000.0,
+        float(stake),
+    )
+
+    trades = np.empty(len(trades_arr), dtype=TRADE_DTYPE)
+    for col, name in enumerate(TRADE_DTYPE.names):
+        trades[name] = trades_arr[:, col]
+
+    index = df.index
+    equity = pd.Series(equity_arr, index=index, name="equity")
+    daily = equity.resample("D").last().dropna()
+    return {
+        "final_value": float(equity_arr[-1]) if len(equity_arr) else cash,
+        "equity": equity,
+        "returns": daily.pct_change().fillna(0.0),
+        "trades": [
+            {
+                "entry_time": index[t["entry_idx"]],
+                "exit_time": index[t["exit_idx"]],
+                "entry_price": float(t["entry_price"]),
+                "exit_price": float(t["exit_price"]),
+                "size": float(t["size"]),
+                "pnl": float(t["pnl"]),
+                "pnlcomm": float(t["pnlcomm"]),
+            }
+            for t in trades
+        ],
+    }
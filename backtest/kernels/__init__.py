@@ -0,0 +1,25 @@
+# fx_trader/backtest/kernels/__init__.py
+import numpy as np
+
+from ._bbands import bollinger_bands
+from ._cache import cached_indicator, clear_indicator_cache
+from ._ema import ema_crossover_fused
+from ._rsi import rsi_wilder
+from ._specialized import make_bollinger, make_ema_crossover, make_rsi
+from ._streaming import bollinger_step, ema_step, rsi_from_averages, rsi_wilder_step
+
+__all__ = ["bollinger_bands", "bollinger_step", "cached_indicator",
+           "clear_indicator_cache", "ema_crossover_fused", "ema_step", "rsi_from_averages",
+           "make_bollinger", "make_ema_crossover", "make_rsi",
+           "rsi_wilder", "rsi_wilder_step"]
+
+# Compile (or load from the on-disk cache) once at import on a tiny input, so
+# sweep worker processes reuse the cached machine code instead of re-JITting.
+_warmup = np.arange(4, dtype=np.float64)
+rsi_wilder(_warmup, 2)
+bollinger_bands(_warmup, 2, 2.0)
+ema_crossover_fused(_warmup, 1, 2)
+rsi_wilder_step(0.0, 0.0, 0.0, 2)
+ema_step(0.0, 0.0, 0.5)
+bollinger_step(_warmup[:2].copy(), 0, 0.0, 0.0, 0.0, 2.0)
+del _warmup
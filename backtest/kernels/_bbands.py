@@ -0,0 +1,45 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def bollinger_bands(close, period, devfactor):
+    """
+    Bollinger Bands (SMA +/- devfactor * population stddev) in O(N).
+
+    Keeps a running sum and sum of squares over a circular buffer of the last
+    `period` closes instead of re-reducing every window. Returns (mid, top, bot);
+    the first `period - 1` values are NaN. float32 input is upcast on read so
+    the sum of squares keeps float64 precision.
+    """
+    n = close.size
+    mid = np.full(n, np.nan)
+    top = np.full(n, np.nan)
+    bot = np.full(n, np.nan)
+    if n < period:
+        return mid, top, bot
+
+    buf = np.empty(period)
+    s = 0.0
+    sumsq = 0.0
+    for i in range(period):
+        x = np.float64(close[i])
+        buf[i] = x
+        s += x
+        sumsq += x * x
+    for i in range(period - 1, n):
+        if i >= period:
+            new = np.float64(close[i])
+            j = i % period
+            old = buf[j]
+            buf[j] = new
+            s += new - old
+            sumsq += new * new - old * old
+        mean = s / period
+        var = sumsq / period - mean * mean
+        std = np.sqrt(max(var, 0.0))
+        mid[i] = mean
+        top[i] = mean + devfactor * std
+        bot[i] = mean - devfactor * std
+    return mid, top, bot
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+_MAXSIZE = 64
+
+# key -> (close array kept alive, kernel result)
+_results: "OrderedDict[Tuple[Any, ...], Tuple[np.ndarray, Any]]" = OrderedDict()
+
+
+def _freeze(result: Any) -> Any:
+    """Marks result arrays read-only since they are shared between callers."""
+    for arr in (result if isinstance(result, tuple) else (result,)):
+        if isinstance(arr, np.ndarray):
+            arr.flags.writeable = False
+    return result
+
+
+def cached_indicator(kernel: Callable, close: np.ndarray, *args: Any) -> Any:
+    """
+    Returns kernel(close, *args), memoized on the identity of the close buffer.
+
+    The key uses the array's data pointer rather than id(close): every
+    `df["close"].to_numpy()` call returns a new view object over the same
+    buffer. The entry holds a reference to `close`, so the buffer cannot be
+    freed and its address reused while cached. Inputs are assumed not to be
+    mutated in place. Up to 64 results are kept (LRU).
+    """
+    key = (kernel, close.__array_interface__['data'][0],
+           close.shape, close.strides, close.dtype.str, args)
+    hit = _results.get(key)
+    if hit is not None:
+        _results.move_to_end(key)
+        return hit[1]
+
+    result = _freeze(kernel(close, *args))
+    _results[key] = (close, result)
+    if len(_results) > _MAXSIZE:
+        _results.popitem(last=False)
+    return result
+
+
+def clear_indicator_cache() -> None:
+    """Drops all memoized indicator arrays."""
+    _results.clear()
@@ -0,0 +1,47 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def ema_crossover_fused(close, short_period, long_period):
+    """
+    Short EMA, long EMA and their crossover in a single pass over `close`.
+
+    Mirrors Backtrader's ExponentialMovingAverage (seeded with the SMA of the
+    first `period` closes) and CrossOver (compares against the last non-zero
+    difference). Only the int8 signal array is kept: +1 when the short EMA
+    crosses above the long one, -1 when it crosses below, 0 otherwise.
+    """
+    n = close.size
+    signals = np.zeros(n, dtype=np.int8)
+    alpha_s = 2.0 / (short_period + 1)
+    alpha_l = 2.0 / (long_period + 1)
+    ema_s = 0.0  # Holds the running sum until the SMA seed is taken
+    ema_l = 0.0
+    prev_diff = 0.0  # Last non-zero ema_s - ema_l
+    for i in range(n):
+        x = np.float64(close[i])
+        if i < short_period:
+            ema_s += x
+            if i == short_period - 1:
+                ema_s /= short_period
+        else:
+            ema_s = ema_s * (1.0 - alpha_s) + x * alpha_s
+        if i < long_period:
+            ema_l += x
+            if i == long_period - 1:
+                ema_l /= long_period
+        else:
+            ema_l = ema_l * (1.0 - alpha_l) + x * alpha_l
+
+        if i >= long_period - 1:
+            diff = ema_s - ema_l
+            if i >= long_period:
+                if diff > 0.0 and prev_diff < 0.0:
+                    signals[i] = 1
+                elif diff < 0.0 and prev_diff > 0.0:
+                    signals[i] = -1
+            if diff != 0.0:
+                prev_diff = diff
+    return signals
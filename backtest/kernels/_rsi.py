@@ -0,0 +1,34 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def rsi_wilder(close, period):
+    """
+    Wilder-smoothed RSI over the full close array in a single pass.
+    The first `period` values are NaN, as with Backtrader's indicator warm-up.
+    float32 input is accepted; differences and averages are taken in float64.
+    """
+    n = close.size
+    out = np.empty(n)
+    out[:] = np.nan
+    if n <= period:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        d = np.float64(close[i]) - np.float64(close[i - 1])
+        gain += d if d > 0 else 0.0
+        loss += -d if d < 0 else 0.0
+    avg_g = gain / period
+    avg_l = loss / period
+    out[period] = 100 - 100 / (1 + avg_g / max(avg_l, 1e-12))
+    for i in range(period + 1, n):
+        d = np.float64(close[i]) - np.float64(close[i - 1])
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        avg_g = (avg_g * (period - 1) + g) / period
+        avg_l = (avg_l * (period - 1) + l) / period
+        out[i] = 100 - 100 / (1 + avg_g / max(avg_l, 1e-12))
+    return out
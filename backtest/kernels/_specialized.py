@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+from utils._njit import njit
+
+from ._bbands import bollinger_bands
+from ._ema import ema_crossover_fused
+from ._rsi import rsi_wilder
+
+
+# Each factory returns a kernel with its periods captured by closure. Numba
+# freezes closure variables as compile-time constants, so after inlining the
+# generic kernel LLVM can fold the divisions and the circular-buffer modulus.
+# The lru_cache keeps one compiled kernel per unique parameter set in a
+# process; Numba's on-disk cache key includes the closure values.
+
+
+@lru_cache(maxsize=32)
+def make_rsi(period: int):
+    """Wilder RSI kernel specialized for a fixed `period`: kernel(close)."""
+    @njit(cache=True)
+    def _rsi(close):
+        return rsi_wilder(close, period)
+    return _rsi
+
+
+@lru_cache(maxsize=32)
+def make_bollinger(period: int, devfactor: float):
+    """Bollinger Bands kernel specialized for fixed parameters: kernel(close) -> (mid, top, bot)."""
+    @njit(cache=True)
+    def _bollinger(close):
+        return bollinger_bands(close, period, devfactor)
+    return _bollinger
+
+
+@lru_cache(maxsize=32)
+def make_ema_crossover(short_period: int, long_period: int):
+    """Fused EMA crossover kernel specialized for fixed periods: kernel(close) -> signals."""
+    @njit(cache=True)
+    def _ema_crossover(close):
+        return ema_crossover_fused(close, short_period, long_period)
+    return _ema_crossover
@@ -0,0 +1,54 @@
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True)
+def rsi_from_averages(avg_g, avg_l):
+    """RSI value from Wilder average gain/loss."""
+    return 100 - 100 / (1 + avg_g / max(avg_l, 1e-12))
+
+
+@njit(cache=True)
+def rsi_wilder_step(avg_g, avg_l, diff, period):
+    """
+    Advances Wilder RSI state by one close-to-close difference.
+    Returns (avg_g, avg_l, rsi); seed the averages with the simple mean of the
+    first `period` gains/losses, as rsi_wilder does.
+    """
+    g = diff if diff > 0 else 0.0
+    l = -diff if diff < 0 else 0.0
+    avg_g = (avg_g * (period - 1) + g) / period
+    avg_l = (avg_l * (period - 1) + l) / period
+    return avg_g, avg_l, rsi_from_averages(avg_g, avg_l)
+
+
+@njit(cache=True)
+def ema_step(prev, x, alpha):
+    """One EMA update: alpha * x + (1 - alpha) * prev (alpha = 2 / (period + 1))."""
+    return alpha * x + (1.0 - alpha) * prev
+
+
+@njit(cache=True)
+def bollinger_step(buf, count, s, sumsq, x, devfactor):
+    """
+    Pushes close `x` into the circular buffer `buf` (length = period, updated in
+    place) given `count` closes seen so far. Returns (s, sumsq, mid, top, bot);
+    the bands are NaN until the buffer is full, as in bollinger_bands.
+    """
+    period = buf.size
+    x = np.float64(x)
+    j = count % period
+    if count >= period:
+        old = buf[j]
+        s += x - old
+        sumsq += x * x - old * old
+    else:
+        s += x
+        sumsq += x * x
+    buf[j] = x
+    if count + 1 < period:
+        return s, sumsq, np.nan, np.nan, np.nan
+    mean = s / period
+    std = np.sqrt(max(sumsq / period - mean * mean, 0.0))
+    return s, sumsq, mean, mean + devfactor * std, mean - devfactor * std
@@ -1,33 +1,47 @@
 import argparse
+import glob
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
 
 import backtrader as bt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import quantstats as qs
 from backtrader.feeds import PandasData
 
-from config import settings
+from config import export_settings_for_workers, settings
 from config.trading_params import TradingParameters
 # For fetching live-like data
 from data_ingest.oanda_client import OandaClient
 from backtest.strategies import STRATEGY_MAPPING
+from backtest.engine import run_njit_backtest
+from backtest.vectorized import simulate_ema_crossover
 from utils.logging import configure_logging, get_logger
 
 # Dask for parallelization (optional, more complex setup)
 # import dask
 # from dask.distributed import Client
 
-configure_logging()
 logger = get_logger(__name__)
 
+# Only these columns are read from Parquet files (column projection)
+OHLCV_COLUMNS = ['time', 'open', 'high', 'low', 'close', 'volume']
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
 
 class PandasDataFX(PandasData):
     """
     Custom PandasData feed for FX data, ensuring correct column names.
     Assumes 'time' is the index or a column.
+    PandasData already defines the OHLCV lines; redeclaring them here would add
+    duplicate lines that the broker never sees filled.
     """
-    lines = ('open', 'high', 'low', 'close', 'volume')
     params = (
         ('datetime', None),  # If 'time' is not the index, specify column name or index
         ('open', 'open'),
@@ -39,6 +53,141 @@ class PandasDataFX(PandasData):
     )
 
 
+def _normalize_time_index(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the index to a sorted, tz-naive UTC DatetimeIndex.
+    String timestamps (OANDA emits RFC3339, e.g. 2023-01-02T03:04:05.000000000Z)
+    go through pandas' vectorized ISO8601 parser rather than per-element inference.
+    """
+    index = dataframe.index
+    if not isinstance(index, pd.DatetimeIndex):
+        index = pd.to_datetime(index, format='ISO8601', utc=True, cache=True)
+    if index.tz is not None:
+        index = index.tz_convert(None)
+    dataframe.index = index
+    if not index.is_monotonic_increasing:
+        dataframe = dataframe.sort_index()
+    return dataframe
+
+
+def _compact_ohlcv(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stores prices as float32 and volume as int32, halving the frame's memory.
+    FX quotes carry at most 5 decimals, well within float32's ~7 significant
+    digits. Kernels upcast to float64 internally where precision matters.
+    """
+    dtypes = {c: np.float32 for c in PRICE_COLUMNS if c in dataframe.columns}
+    if 'volume' in dataframe.columns and dataframe['volume'].notna().all():
+        dtypes['volume'] = np.int32
+    return dataframe.astype(dtypes, copy=False)
+
+
+def _read_parquet_range(
+    data_path: str, start_date: datetime, end_date: datetime
+) -> pd.DataFrame:
+    """
+    Reads only the OHLCV columns of a Parquet file, memory-mapped.
+    When 'time' is stored as a timestamp, the date range is pushed down as a
+    row-group filter so rows outside the window are never decoded.
+    """
+    time_type = pq.read_schema(data_path).field('time').type
+    filters = None
+    if pa.types.is_timestamp(time_type):
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        if time_type.tz is not None:
+            start, end = start.tz_localize(time_type.tz), end.tz_localize(time_type.tz)
+        filters = [('time', '>=', start), ('time', '<=', end)]
+
+    table = pq.read_table(data_path, columns=OHLCV_COLUMNS,
+                          filters=filters, memory_map=True)
+    dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    if 'time' in dataframe.columns:  # Ensure 'time' is index
+        dataframe.set_index('time', inplace=True)
+    dataframe = _normalize_time_index(dataframe)
+    if filters is None:
+        # Binary search on the sorted index instead of a boolean mask scan
+        dataframe = dataframe.loc[start_date:end_date]
+    return dataframe
+
+
+def _csv_to_parquet(data_path: str) -> Optional[str]:
+    """
+    One-shot conversion of a CSV data file to a sibling zstd Parquet file.
+    Returns the Parquet path, or None if it could not be written.
+    """
+    parquet_path = f"{os.path.splitext(data_path)[0]}.parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(data_path):
+        return parquet_path
+    logger.warning(
+        f"CSV input is deprecated; converting {data_path} to {parquet_path} (one-time).")
+    try:
+        _normalize_time_index(pd.read_csv(data_path, index_col='time')).to_parquet(
+            parquet_path, compression='zstd')
+    except OSError as e:
+        logger.warning(f"Could not write {parquet_path}: {e}. Reading CSV directly.")
+        return None
+    return parquet_path
+
+
+def _load_dataframe(
+    data_path: str, start_date_str: str, end_date_str: str
+) -> Optional[pd.DataFrame]:
+    """
+    Loads OHLCV data from a CSV/Parquet file, filters it to the date range and
+    stores it with compact dtypes (see _compact_ohlcv).
+    """
+    logger.info(f"Loading data from file: {data_path}")
+    start_date = datetime.fromisoformat(start_date_str)
+    end_date = datetime.fromisoformat(end_date_str)
+
+    if data_path.endswith(".csv"):
+        parquet_path = _csv_to_parquet(data_path)
+        if parquet_path is None:
+            dataframe = pd.read_csv(
+                data_path, index_col='time', usecols=OHLCV_COLUMNS)
+            return _compact_ohlcv(_normalize_time_index(dataframe).loc[start_date:end_date])
+        data_path = parquet_path
+    elif not data_path.endswith(".parquet"):
+        logger.error(f"Unsupported data file format: {data_path}")
+        return None
+
+    return _compact_ohlcv(_read_parquet_range(data_path, start_date, end_date))
+
+
+def _build_cerebro(
+    StrategyClass: type,
+    dataframe: pd.DataFrame,
+    strat_params: Dict[str, Any],
+    initial_cash: float,
+    commission_bps: float,
+    data_name: str,
+    extra_analyzers: Optional[Dict[str, Any]] = None,
+) -> bt.Cerebro:
+    """Creates a Cerebro instance with the strategy, data feed, broker and analyzers."""
+    cerebro = bt.Cerebro()
+    cerebro.addstrategy(StrategyClass, **strat_params)
+
+    data_feed = PandasDataFX(dataname=dataframe, name=data_name)
+    cerebro.adddata(data_feed)
+
+    # Set initial cash and commission
+    cerebro.broker.setcash(initial_cash)
+    # Commission in percentage, e.g., 0.0002 for 2 BPS
+    cerebro.broker.setcommission(commission=commission_bps / 10000.0)
+
+    # Analyzers
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="tradeanalyzer")
+    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name="sharpe",
+                        timeframe=bt.TimeFrame.Days, annualize=True)
+    cerebro.addanalyzer(bt.analyzers.DrawDown, _name="drawdown")
+    cerebro.addanalyzer(bt.analyzers.PyFolio,
+                        _name='pyfolio')  # For QuantStats
+    for name, (analyzer_cls, analyzer_kwargs) in (extra_analyzers or {}).items():
+        cerebro.addanalyzer(analyzer_cls, _name=name, **analyzer_kwargs)
+    return cerebro
+
+
 def run_backtest(
     strategy_name: str,
     data_path: Optional[str] = None,  # Path to CSV/Parquet data file
@@ -48,44 +197,34 @@ def run_backtest(
     end_date_str: str = "2023-01-01",
     initial_cash: float = 100000.0,
     commission_bps: float = 2.0,  # Commission in basis points (0.01%)
-    slippage_bps: int = settings.TRADING.SLIPPAGE_TOLERANCE_BPS,  # From config
+    slippage_bps: Optional[int] = None,  # Defaults to settings.TRADING.SLIPPAGE_TOLERANCE_BPS
     output_dir: str = "backtest_results",
     strategy_params: Optional[dict] = None,
     plot_results: bool = True,
+    # name -> (AnalyzerClass, kwargs); only the Backtrader engine runs them
+    extra_analyzers: Optional[Dict[str, Any]] = None,
+    engine: str = "backtrader",  # "backtrader", "njit" or "vectorized" (EMACrossover only)
+    # Already-loaded OHLCV data (e.g. a shared-memory view); skips data_path/instrument
+    dataframe: Optional[pd.DataFrame] = None,
+    report: str = "html",  # "none", "summary" or "html"
 ):
     if strategy_name not in STRATEGY_MAPPING:
         logger.error(
             f"Strategy '{strategy_name}' not found. Available: {list(STRATEGY_MAPPING.keys())}")
         return
 
-    StrategyClass = STRATEGY_MAPPING[strategy_name]
-
-    cerebro = bt.Cerebro()
-
-    # Add Strategy
     strat_params = strategy_params if strategy_params else {}
-    cerebro.addstrategy(StrategyClass, **strat_params)
+    if slippage_bps is None:
+        slippage_bps = settings.TRADING.SLIPPAGE_TOLERANCE_BPS
 
     # Data Loading
-    if data_path:
-        logger.info(f"Loading data from file: {data_path}")
-        if data_path.endswith(".csv"):
-            dataframe = pd.read_csv(
-                data_path, index_col='time', parse_dates=True)
-        elif data_path.endswith(".parquet"):
-            dataframe = pd.read_parquet(data_path)
-            if 'time' in dataframe.columns:  # Ensure 'time' is index
-                dataframe.set_index('time', inplace=True)
-            dataframe.index = pd.to_datetime(dataframe.index)
-        else:
-            logger.error(f"Unsupported data file format: {data_path}")
-            return
+    if dataframe is not None:
+        logger.info("Using provided DataFrame; skipping data loading.")
 
-        # Filter by date range if specified
-        start_date = datetime.fromisoformat(start_date_str)
-        end_date = datetime.fromisoformat(end_date_str)
-        dataframe = dataframe[(dataframe.index >= start_date)
-                              & (dataframe.index <= end_date)]
+    elif data_path:
+        dataframe = _load_dataframe(data_path, start_date_str, end_date_str)
+        if dataframe is None:
+            return
 
     elif instrument:  # Fetch from OANDA
         logger.info(
@@ -117,13 +256,60 @@ def run_backtest(
             "DataFrame is empty after loading/filtering. Cannot run backtest.")
         return
 
-    data_feed = PandasDataFX(dataname=dataframe, name=instrument or "DATA")
-    cerebro.adddata(data_feed)
+    output_prefix = f"{output_dir}/{strategy_name}_{instrument or 'custom_data'}_{start_date_str}_to_{end_date_str}"
 
-    # Set initial cash and commission
-    cerebro.broker.setcash(initial_cash)
-    # Commission in percentage, e.g., 0.0002 for 2 BPS
-    cerebro.broker.setcommission(commission=commission_bps / 10000.0)
+    logger.info(
+        f"Running {engine} backtest for {strategy_name} on {instrument or data_path}...")
+    result = run_backtest_core(
+        strategy_name, dataframe, strat_params, initial_cash, commission_bps,
+        slippage_bps=slippage_bps,
+        engine=engine,
+        extra_analyzers=extra_analyzers,
+        data_name=instrument or "DATA",
+        plot_path=f"{output_prefix}_plot.png" if plot_results else None,
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info("Backtest complete. Generating reports...")
+    generate_reports(result, output_prefix, report)
+    return result
+
+
+def run_backtest_core(
+    strategy_name: str,
+    dataframe: pd.DataFrame,
+    strat_params: Dict[str, Any],
+    initial_cash: float,
+    commission_bps: float,
+    slippage_bps: float = 0.0,
+    engine: str = "backtrader",
+    extra_analyzers: Optional[Dict[str, Any]] = None,
+    data_name: str = "DATA",
+    plot_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Runs one backtest and returns a picklable result without building reports:
+    {"strategy_name", "final_value", "returns" (daily, tz-naive), "trades"
+    (list of dicts or None), "analyzers" (plain dicts)}.
+    """
+    if engine == "njit":
+        result = run_njit_backtest(strategy_name, dataframe, strat_params, initial_cash,
+                                   commission_bps, slippage_bps)
+        return _array_result(strategy_name, result)
+
+    if engine == "vectorized":
+        if strategy_name != "EMACrossover":
+            raise ValueError(f"The vectorized engine only supports EMACrossover, got '{strategy_name}'")
+        result = simulate_ema_crossover(
+            dataframe,
+            short=strat_params.get("ema_short_period", 10),
+            long=strat_params.get("ema_long_period", 30),
+            cash=initial_cash,
+            comm_bps=commission_bps,
+        )
+        return _array_result(strategy_name, result)
+
+    cerebro = _build_cerebro(STRATEGY_MAPPING[strategy_name](), dataframe, strat_params,
+                             initial_cash, commission_bps, data_name, extra_analyzers)
 
     # Add Slippage (Backtrader's built-in slippage is basic)
     # For more realistic slippage, custom slippage models are needed.
@@ -136,66 +322,234 @@ def run_backtest(
     logger.info(
         f"Slippage tolerance from config: {slippage_bps} BPS (manual application or custom slippage model needed for precise effect).")
 
-    # Analyzers
-    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="tradeanalyzer")
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name="sharpe",
-                        timeframe=bt.TimeFrame.Days, annualization=252)
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name="drawdown")
-    cerebro.addanalyzer(bt.analyzers.PyFolio,
-                        _name='pyfolio')  # For QuantStats
-
-    # Run backtest
-    logger.info(
-        f"Running backtest for {strategy_name} on {instrument or data_path}...")
     results = cerebro.run()
     strat_instance = results[0]
 
-    # Output results
-    os.makedirs(output_dir, exist_ok=True)
-    output_prefix = f"{output_dir}/{strategy_name}_{instrument or 'custom_data'}_{start_date_str}_to_{end_date_str}"
+    returns, _, _, _ = strat_instance.analyzers.getbyname('pyfolio').get_pf_items()
+    returns.index = returns.index.tz_convert(None)  # QuantStats expects tz-naive
 
-    logger.info("Backtest complete. Generating reports...")
-    logger.info(f"Final Portfolio Value: {cerebro.broker.getvalue():.2f}")
+    analyzers = {
+        name: _to_plain(strat_instance.analyzers.getbyname(name).get_analysis())
+        for name in ["sharpe", "drawdown", "tradeanalyzer", *(extra_analyzers or {})]
+    }
+    trade_analysis = analyzers["tradeanalyzer"]
 
-    # QuantStats report
-    try:
-        portfolio_stats = strat_instance.analyzers.getbyname('pyfolio')
-        returns, positions, transactions, gross_lev = portfolio_stats.get_pf_items()
-        returns.index = returns.index.tz_convert(
-            None)  # QuantStats expects tz-naive
+    # Plotting (optional)
+    if plot_path:
+        try:
+            # Ensure matplotlib backend is suitable (e.g., Agg for non-GUI environments)
+            # import matplotlib
+            # matplotlib.use('Agg')
+            figure = cerebro.plot(style='candlestick',
+                                  barup='green', bardown='red')[0][0]
+            figure.savefig(plot_path)
+            logger.info(f"Backtrader plot saved to {plot_path}")
+        except Exception as e:
+            logger.error(
+                f"Error generating plot: {e}. Ensure plotting libraries are correctly installed and configured.")
+
+    return {
+        "strategy_name": strategy_name,
+        "final_value": cerebro.broker.getvalue(),
+        "returns": returns,
+        "trades": trade_analysis.get("trades") or None,
+        "analyzers": analyzers,
+    }
+
+
+def _array_result(strategy_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Adapts a vectorized/njit engine result to the run_backtest_core layout."""
+    return {
+        "strategy_name": strategy_name,
+        "final_value": result["final_value"],
+        "returns": result["returns"],
+        "trades": result["trades"] or None,
+        "analyzers": {},
+    }
+
+
+def result_sharpe(result: Dict[str, Any]) -> float:
+    """Sharpe ratio of a run: the analyzer value if present, else computed from returns."""
+    sharpe = result["analyzers"].get("sharpe", {}).get("sharperatio")
+    if sharpe is None:
+        sharpe = qs.stats.sharpe(result["returns"])
+    return float(sharpe) if sharpe is not None and np.isfinite(sharpe) else float("-inf")
+
+
+def select_top_k(results: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+    """Returns the `k` runs with the highest Sharpe ratio, best first."""
+    return sorted(results, key=result_sharpe, reverse=True)[:k]
+
+
+def write_trades(trades: List[Dict[str, Any]], path: str) -> None:
+    """Writes a list of trade dicts straight to a zstd Parquet file (no DataFrame round-trip)."""
+    pq.write_table(pa.Table.from_pylist(list(trades)), path, compression='zstd')
+
+
+def read_trades(pattern: str) -> pa.Table:
+    """Reads every trades Parquet file matching `pattern` (e.g. a sweep's output) as one table."""
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise FileNotFoundError(f"No trade files match {pattern}")
+    return pq.read_table(paths)
 
+
+def generate_reports(result: Dict[str, Any], output_prefix: str, report: str = "html") -> None:
+    """
+    Post-processes a run_backtest_core result.
+    report: "none" (final value only), "summary" (key QuantStats stats, no HTML)
+    or "html" (full QuantStats HTML report plus the trades Parquet file).
+    """
+    strategy_name = result["strategy_name"]
+    logger.info(f"Final Portfolio Value: {result['final_value']:.2f}")
+    if report == "none":
+        return
+
+    returns = result["returns"]
+    if report == "summary":
+        trades = result["analyzers"].get("tradeanalyzer", {}).get("total", {}).get(
+            "closed", len(result["trades"] or []))
+        logger.info(
+            f"{strategy_name} summary:\n"
+            f"  Sharpe:        {result_sharpe(result):.3f}\n"
+            f"  Sortino:       {qs.stats.sortino(returns):.3f}\n"
+            f"  CAGR:          {qs.stats.cagr(returns):.2%}\n"
+            f"  Max Drawdown:  {qs.stats.max_drawdown(returns):.2%}\n"
+            f"  Volatility:    {qs.stats.volatility(returns):.2%}\n"
+            f"  Win Rate:      {qs.stats.win_rate(returns):.2%}\n"
+            f"  Total Return:  {qs.stats.comp(returns):.2%}\n"
+            f"  Closed Trades: {trades}")
+        return
+
+    try:
         qs.reports.html(
             returns, output=f"{output_prefix}_quantstats_report.html", title=f"{strategy_name} Backtest")
         logger.info(
             f"QuantStats report saved to {output_prefix}_quantstats_report.html")
 
         # Save structured results (example: trade list)
-        trade_analysis = strat_instance.analyzers.tradeanalyzer.get_analysis()
-        if trade_analysis and 'trades' in trade_analysis and trade_analysis.trades:
-            trades_df = pd.DataFrame(trade_analysis.trades)
-            trades_df.to_csv(f"{output_prefix}_trades.csv", index=False)
-            logger.info(f"Trades list saved to {output_prefix}_trades.csv")
+        if result["trades"]:
+            write_trades(result["trades"], f"{output_prefix}_trades.parquet")
+            logger.info(f"Trades list saved to {output_prefix}_trades.parquet")
 
     except Exception as e:
         logger.error(
             f"Error generating QuantStats report or saving trades: {e}")
 
-    # Plotting (optional)
-    if plot_results:
-        try:
-            # Ensure matplotlib backend is suitable (e.g., Agg for non-GUI environments)
-            # import matplotlib
-            # matplotlib.use('Agg')
-            figure = cerebro.plot(style='candlestick',
-                                  barup='green', bardown='red')[0][0]
-            figure.savefig(f"{output_prefix}_plot.png")
-            logger.info(f"Backtrader plot saved to {output_prefix}_plot.png")
-        except Exception as e:
-            logger.error(
-                f"Error generating plot: {e}. Ensure plotting libraries are correctly installed and configured.")
+
+def _to_plain(obj: Any) -> Any:
+    """Recursively converts Backtrader AutoOrderedDict analyses into plain dicts."""
+    if isinstance(obj, dict):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    return obj
+
+
+# Set in each grid worker by _init_grid_worker
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_DATAFRAME: Optional[pd.DataFrame] = None
+
+
+def _dataframe_to_shared_memory(dataframe: pd.DataFrame) -> shared_memory.SharedMemory:
+    """Serializes `dataframe` as an Arrow IPC stream into a new shared memory block."""
+    table = pa.Table.from_pandas(dataframe, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    payload = sink.getvalue()
+
+    shm = shared_memory.SharedMemory(create=True, size=payload.size)
+    shm.buf[:payload.size] = memoryview(payload).cast("B")
+    return shm
+
+
+def _init_grid_worker(shm_name: str, size: int) -> None:
+    """
+    ProcessPoolExecutor initializer: maps the parent's Arrow IPC block once per
+    worker. Columns are views onto the shared buffer, so no per-task pickling
+    or disk I/O happens.
+    """
+    global _WORKER_SHM, _WORKER_DATAFRAME
+    # Pool workers share the parent's resource tracker; the parent unlinks
+    _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+    reader = pa.ipc.open_stream(pa.py_buffer(_WORKER_SHM.buf[:size]))
+    _WORKER_DATAFRAME = reader.read_all().to_pandas(split_blocks=True)
+
+
+def _run_grid_worker(
+    strategy_name: str,
+    params: Dict[str, Any],
+    initial_cash: float,
+    commission_bps: float,
+) -> Dict[str, Any]:
+    """
+    Runs a single backtest in a worker process on the shared DataFrame.
+    Only a lightweight, picklable result dict is returned (never the Cerebro object).
+    """
+    result = run_backtest_core(strategy_name, _WORKER_DATAFRAME, params,
+                               initial_cash, commission_bps)
+    return {"params": params, **result}
+
+
+def run_backtest_grid(
+    strategy_name: str,
+    data_path: str,
+    param_grid: List[Dict[str, Any]],
+    start_date_str: str = "2022-01-01",
+    end_date_str: str = "2023-01-01",
+    initial_cash: float = 100000.0,
+    commission_bps: float = 2.0,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Runs one backtest per parameter set in `param_grid` across worker processes.
+
+    The data file is read once in the parent and shared with the workers
+    through an Arrow IPC block in shared memory. Plotting is never done in
+    workers (matplotlib is not fork-safe); results come back in completion
+    order, one dict per successful run.
+    """
+    if strategy_name not in STRATEGY_MAPPING:
+        logger.error(
+            f"Strategy '{strategy_name}' not found. Available: {list(STRATEGY_MAPPING.keys())}")
+        return []
+
+    # Workers read the already-validated settings as JSON instead of the YAML
+    export_settings_for_workers()
+
+    dataframe = _load_dataframe(data_path, start_date_str, end_date_str)
+    if dataframe is None or dataframe.empty:
+        logger.error(f"No data loaded from {data_path} for grid run.")
+        return []
+    shm = _dataframe_to_shared_memory(dataframe)
+    del dataframe
+
+    results: List[Dict[str, Any]] = []
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 initializer=_init_grid_worker,
+                                 initargs=(shm.name, shm.size)) as executor:
+            futures = {
+                executor.submit(_run_grid_worker, strategy_name, params,
+                                initial_cash, commission_bps): params
+                for params in param_grid
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                params = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Grid run failed for params {params}: {e}")
+                logger.info(f"Grid progress: {done}/{len(futures)} (params: {params})")
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
 
 
 if __name__ == "__main__":
+    # Configured here rather than at import: it reads settings, which would
+    # make importing this module require the OANDA credentials
+    configure_logging()
     parser = argparse.ArgumentParser(description="Run Backtrader Backtest")
     parser.add_argument("--strategy", type=str, required=True,
                         choices=list(STRATEGY_MAPPING.keys()), help="Strategy name")
@@ -218,8 +572,18 @@ if __name__ == "__main__":
     parser.add_argument("--plot", action="store_true",
                         help="Generate and save plot")
     # Example for strategy-specific params: --strategy_params '{"ema_short_period": 10, "ema_long_period": 50}'
+    parser.add_argument("--engine", type=str, default="backtrader", choices=["backtrader", "njit", "vectorized"],
+                        help="Simulation engine. 'njit' runs a Numba-compiled loop over precomputed signals; "
+                             "'vectorized' is a pandas/NumPy EMACrossover simulator (neither produces plots).")
+    parser.add_argument("--report", type=str, default="html", choices=["none", "summary", "html"],
+                        help="Post-processing: none, a short stats summary, or the full QuantStats HTML report")
+    parser.add_argument("--top_k", type=int, default=1,
+                        help="With --param_grid, only the top K runs by Sharpe get reports")
     parser.add_argument("--strategy_params", type=str,
                         help="JSON string of strategy parameters")
+    # Example: --param_grid '[{"ema_short_period": 10}, {"ema_short_period": 20}]'
+    parser.add_argument("--param_grid", type=str,
+                        help="JSON list of strategy parameter sets to run in parallel (requires --data_path)")
 
     args = parser.parse_args()
 
@@ -232,6 +596,31 @@ if __name__ == "__main__":
                 f"Invalid JSON for strategy_params: {args.strategy_params}")
             exit(1)
 
+    if args.param_grid:
+        try:
+            param_grid = json.loads(args.param_grid)
+        except json.JSONDecodeError:
+            logger.error(f"Invalid JSON for param_grid: {args.param_grid}")
+            exit(1)
+        grid_results = run_backtest_grid(
+            strategy_name=args.strategy,
+            data_path=args.data_path,
+            param_grid=[{**strategy_custom_params, **p} for p in param_grid],
+            start_date_str=args.start_date,
+            end_date_str=args.end_date,
+            initial_cash=args.cash,
+            commission_bps=args.commission_bps,
+        )
+        for res in grid_results:
+            logger.info(
+                f"Params: {res['params']} - Final Value: {res['final_value']:.2f}")
+        os.makedirs(args.output_dir, exist_ok=True)
+        for rank, res in enumerate(select_top_k(grid_results, args.top_k), start=1):
+            logger.info(f"Top {rank}: {res['params']} (Sharpe {result_sharpe(res):.3f})")
+            generate_reports(
+                res, f"{args.output_dir}/{args.strategy}_grid_top{rank}", args.report)
+        exit(0)
+
     run_backtest(
         strategy_name=args.strategy,
         data_path=args.data_path,
@@ -244,4 +633,6 @@ if __name__ == "__main__":
         output_dir=args.output_dir,
         strategy_params=strategy_custom_params,
         plot_results=args.plot,
+        engine=args.engine,
+        report=args.report,
     )
@@ -1,8 +1,25 @@
 # fx_trader/backtest/strategies/__init__.py
-from .bollinger_bands_strategy import BollingerBandsStrategy
-from .ema_crossover_strategy import EMACrossoverStrategy
-from .rsi_strategy import RSIStrategy
+from importlib import import_module
 
-# To make it easy to get strategy class by name
-STRATEGY_MAPPING = {"EMACrossover": EMACrossoverStrategy,
-                    "RSI": RSIStrategy, "BollingerBands": BollingerBandsStrategy}
+# Strategy modules (and backtrader with them) are imported on first use only.
+_STRATEGY_CLASSES = {
+    "EMACrossoverStrategy": "backtest.strategies.ema_crossover_strategy",
+    "RSIStrategy": "backtest.strategies.rsi_strategy",
+    "BollingerBandsStrategy": "backtest.strategies.bollinger_bands_strategy",
+}
+
+
+def _lazy(class_name: str):
+    return lambda: getattr(import_module(_STRATEGY_CLASSES[class_name]), class_name)
+
+
+# To make it easy to get strategy class by name: STRATEGY_MAPPING[name]() -> class
+STRATEGY_MAPPING = {"EMACrossover": _lazy("EMACrossoverStrategy"),
+                    "RSI": _lazy("RSIStrategy"), "BollingerBands": _lazy("BollingerBandsStrategy")}
+
+
+def __getattr__(name: str):
+    # Keeps `from backtest.strategies import RSIStrategy` working lazily
+    if name in _STRATEGY_CLASSES:
+        return _lazy(name)()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,59 @@
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from utils.logging import get_logger
+
+# Backtrader encodes datetimes as days since 0001-01-01 (proleptic ordinal);
+# subtracting the ordinal of 1970-01-01 gives days since the Unix epoch.
+_BT_UNIX_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+class BufferedLogMixin:
+    """
+    Strategy logging without per-bar I/O.
+
+    log() only records (bar datetime as a float, %-format string, args); the
+    lines are formatted and emitted in a single logger call from stop(), after
+    the Backtrader event loop has finished. Nothing is recorded unless
+    `printlog` (or `doprint`) is set and INFO is enabled for the strategy's
+    module logger.
+    """
+
+    _log_buf: Optional[List[Tuple[object, str, tuple]]] = None
+    _log_enabled: bool = False
+
+    def log(self, txt: str, *args: object, dt: object = None, doprint: bool = False) -> None:
+        if not (self.params.printlog or doprint):
+            return
+        if self._log_buf is None:
+            self._log_buf = []
+            self._log_enabled = logging.getLogger(
+                type(self).__module__).isEnabledFor(logging.INFO)
+            self._dt_line = self.datas[0].datetime
+        if self._log_enabled:
+            self._log_buf.append((self._dt_line[0] if dt is None else dt, txt, args))
+
+    def flush_log(self) -> None:
+        """Emits the buffered log lines and clears the buffer."""
+        buf = self._log_buf
+        if not buf:
+            return
+        self._log_buf = []
+        # Timestamps are converted and formatted in one vectorized pass
+        days = np.array([bt.date2num(dt) if isinstance(dt, datetime) else dt
+                         for dt, _, _ in buf], dtype=np.float64)
+        stamps = pd.to_datetime(days - _BT_UNIX_EPOCH_ORDINAL, unit='D').round('s').strftime(
+            '%Y-%m-%dT%H:%M:%S')
+        lines = "\n".join(
+            f"{stamp} - {txt % args if args else txt}"
+            for stamp, (_, txt, args) in zip(stamps, buf)
+        )
+        get_logger(type(self).__module__).info(lines)
+
+    def stop(self) -> None:
+        self.flush_log()
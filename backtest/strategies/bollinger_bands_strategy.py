@@ -1,69 +1,70 @@
 import backtrader as bt
+import numpy as np
 
-from utils.logging import get_logger
+from backtest.kernels import make_bollinger
+from backtest.strategies.base import BufferedLogMixin
 
-logger = get_logger(__name__)
 
-
-class BollingerBandsStrategy(bt.Strategy):
+class BollingerBandsStrategy(BufferedLogMixin, bt.Strategy):
     params = (
         ("bb_period", 20),
         ("bb_devfactor", 2.0),  # Standard deviations
-        ("printlog", True),
+        ("printlog", False),
     )
 
     def __init__(self):
         self.dataclose = self.datas[0].close
         self.order = None
-        self.bollinger = bt.indicators.BollingerBands(
-            period=self.params.bb_period, devfactor=self.params.bb_devfactor
-        )
-
-    def log(self, txt: str, dt: object = None, doprint: bool = False) -> None:
-        if self.params.printlog or doprint:
-            dt = dt or self.datas[0].datetime.datetime(0)
-            logger.info(f"{dt.isoformat()} - {txt}")
+        # Bands are computed once over the preloaded close array
+        close = np.asarray(self.datas[0].close.array, dtype=np.float64)
+        self._bb_mid, self._bb_top, self._bb_bot = make_bollinger(
+            self.params.bb_period, self.params.bb_devfactor)(close)
+        # Signal masks: next() becomes a table lookup. NaN warm-up bands
+        # compare False, so no signal fires before the bands exist.
+        self._close_arr = close
+        self._entry = (close < self._bb_bot).astype(np.uint8)
+        self._exit = ((close > self._bb_mid) | (close > self._bb_top)).astype(np.uint8)
 
     def notify_order(self, order: bt.Order) -> None:
         if order.status in [order.Submitted, order.Accepted]:
             return
         if order.status in [order.Completed]:
             if order.isbuy():
-                self.log(f"BUY EXECUTED, Price: {order.executed.price:.5f}")
+                self.log("BUY EXECUTED, Price: %.5f", order.executed.price)
             elif order.issell():
-                self.log(f"SELL EXECUTED, Price: {order.executed.price:.5f}")
+                self.log("SELL EXECUTED, Price: %.5f", order.executed.price)
             self.bar_executed = len(self)
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
             self.log(
-                f"Order Canceled/Margin/Rejected: {order.Status[order.status]}")
+                "Order Canceled/Margin/Rejected: %s", order.Status[order.status])
         self.order = None
 
     def notify_trade(self, trade: bt.Trade) -> None:
         if not trade.isclosed:
             return
         self.log(
-            f"OPERATION PROFIT, GROSS {trade.pnl:.2f}, NET {trade.pnlcomm:.2f}")
+            "OPERATION PROFIT, GROSS %.2f, NET %.2f", trade.pnl, trade.pnlcomm)
 
     def next(self):
         if self.order:
             return
 
+        i = len(self) - 1
+
         # Example: Mean Reversion Strategy
-        if not self.position:  # Not in the market
-            # Price closes below lower band
-            if self.dataclose[0] < self.bollinger.lines.bot[0]:
+        # Entry (close below lower band) and exit (close above middle or upper
+        # band) are mutually exclusive, so one mask lookup decides the bar.
+        if self._entry[i]:
+            if not self.position:  # Not in the market
                 self.log(
-                    f"BUY CREATE (Mean Reversion), Close: {self.dataclose[0]:.5f}, BBot: {self.bollinger.lines.bot[0]:.5f}")
+                    "BUY CREATE (Mean Reversion), Close: %.5f, BBot: %.5f", self._close_arr[i], self._bb_bot[i])
                 self.order = self.buy()
-        else:  # In the market
-            # Exit if price touches middle band or upper band
-            if self.position.size > 0:  # If long
-                if self.dataclose[0] > self.bollinger.lines.mid[0] or self.dataclose[0] > self.bollinger.lines.top[0]:
-                    self.log(
-                        f"SELL CREATE (Mean Reversion Exit), Close: {self.dataclose[0]:.5f}, BMid: {self.bollinger.lines.mid[0]:.5f}")
-                    self.order = self.sell()
-            # Add logic for short positions if strategy supports them
-            # elif self.position.size < 0: # If short
-            #     if self.dataclose[0] > self.bollinger.lines.mid[0] or self.dataclose[0] < self.bollinger.lines.bot[0]:
-            #         self.log(f"BUY CREATE (Mean Reversion Exit - Cover Short), Close: {self.dataclose[0]:.5f}")
-            #         self.order = self.buy() # Cover short
+        elif self._exit[i] and self.position.size > 0:  # If long
+            self.log(
+                "SELL CREATE (Mean Reversion Exit), Close: %.5f, BMid: %.5f", self._close_arr[i], self._bb_mid[i])
+            self.order = self.sell()
+        # Add logic for short positions if strategy supports them
+        # elif self.position.size < 0: # If short
+        #     if self.dataclose[0] > self.bollinger.lines.mid[0] or self.dataclose[0] < self.bollinger.lines.bot[0]:
+        #         self.log("BUY CREATE (Mean Reversion Exit - Cover Short), Close: %.5f", self.dataclose[0])
+        #         self.order = self.buy() # Cover short
@@ -1,15 +1,15 @@
 import backtrader as bt
+import numpy as np
 
-from utils.logging import get_logger
+from backtest.kernels import make_ema_crossover
+from backtest.strategies.base import BufferedLogMixin
 
-logger = get_logger(__name__)
 
-
-class EMACrossoverStrategy(bt.Strategy):
+class EMACrossoverStrategy(BufferedLogMixin, bt.Strategy):
     params = (
         ("ema_short_period", 10),
         ("ema_long_period", 30),
-        ("printlog", True),  # For logging trades
+        ("printlog", False),  # For logging trades
     )
 
     def __init__(self):
@@ -18,19 +18,11 @@ class EMACrossoverStrategy(bt.Strategy):
         self.buyprice = None
         self.buycomm = None
 
-        self.ema_short = bt.indicators.ExponentialMovingAverage(
-            self.datas[0], period=self.params.ema_short_period
-        )
-        self.ema_long = bt.indicators.ExponentialMovingAverage(
-            self.datas[0], period=self.params.ema_long_period
-        )
-        self.crossover = bt.indicators.CrossOver(self.ema_short, self.ema_long)
-
-    def log(self, txt: str, dt: object = None, doprint: bool = False) -> None:
-        """Logging function for this strategy"""
-        if self.params.printlog or doprint:
-            dt = dt or self.datas[0].datetime.datetime(0)
-            logger.info(f"{dt.isoformat()} - {txt}")
+        # Both EMAs and their crossover come from one fused pass over the
+        # preloaded closes (same values as bt EMA + CrossOver)
+        close = np.asarray(self.datas[0].close.array, dtype=np.float64)
+        self._cross = make_ema_crossover(
+            self.params.ema_short_period, self.params.ema_long_period)(close)
 
     def notify_order(self, order: bt.Order) -> None:
         if order.status in [order.Submitted, order.Accepted]:
@@ -39,34 +31,35 @@ class EMACrossoverStrategy(bt.Strategy):
         if order.status in [order.Completed]:
             if order.isbuy():
                 self.log(
-                    f"BUY EXECUTED, Price: {order.executed.price:.5f}, Cost: {order.executed.value:.2f}, Comm: {order.executed.comm:.2f}")
+                    "BUY EXECUTED, Price: %.5f, Cost: %.2f, Comm: %.2f", order.executed.price, order.executed.value, order.executed.comm)
                 self.buyprice = order.executed.price
                 self.buycomm = order.executed.comm
             elif order.issell():
                 self.log(
-                    f"SELL EXECUTED, Price: {order.executed.price:.5f}, Cost: {order.executed.value:.2f}, Comm: {order.executed.comm:.2f}")
+                    "SELL EXECUTED, Price: %.5f, Cost: %.2f, Comm: %.2f", order.executed.price, order.executed.value, order.executed.comm)
             self.bar_executed = len(self)
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
             self.log(
-                f"Order Canceled/Margin/Rejected: {order.Status[order.status]}")
+                "Order Canceled/Margin/Rejected: %s", order.Status[order.status])
         self.order = None
 
     def notify_trade(self, trade: bt.Trade) -> None:
         if not trade.isclosed:
             return
         self.log(
-            f"OPERATION PROFIT, GROSS {trade.pnl:.2f}, NET {trade.pnlcomm:.2f}")
+            "OPERATION PROFIT, GROSS %.2f, NET %.2f", trade.pnl, trade.pnlcomm)
 
     def next(self):
         if self.order:  # Check if an order is pending
             return
 
+        cross = self._cross[len(self) - 1]
         if not self.position:  # Not in the market
-            if self.crossover > 0:  # If short EMA crosses above long EMA
-                self.log(f"BUY CREATE, Close: {self.dataclose[0]:.5f}")
+            if cross > 0:  # If short EMA crosses above long EMA
+                self.log("BUY CREATE, Close: %.5f", self.dataclose[0])
                 self.order = self.buy()
         else:  # Already in the market
-            if self.crossover < 0:  # If short EMA crosses below long EMA
+            if cross < 0:  # If short EMA crosses below long EMA
                 self.log(
-                    f"SELL CREATE (Close Position), Close: {self.dataclose[0]:.5f}")
+                    "SELL CREATE (Close Position), Close: %.5f", self.dataclose[0])
                 self.order = self.sell()  # Or self.close()
@@ -1,61 +1,84 @@
 import backtrader as bt
 
-from utils.logging import get_logger
+from backtest.kernels import rsi_from_averages, rsi_wilder_step
+from backtest.strategies.base import BufferedLogMixin
 
-logger = get_logger(__name__)
 
-
-class RSIStrategy(bt.Strategy):
+class RSIStrategy(BufferedLogMixin, bt.Strategy):
     params = (
         ("rsi_period", 14),
         ("rsi_overbought", 70),
         ("rsi_oversold", 30),
-        ("printlog", True),
+        ("printlog", False),
     )
 
     def __init__(self):
         self.dataclose = self.datas[0].close
         self.order = None
-        self.rsi = bt.indicators.RelativeStrengthIndex(
-            period=self.params.rsi_period
-        )
-
-    def log(self, txt: str, dt: object = None, doprint: bool = False) -> None:
-        if self.params.printlog or doprint:
-            dt = dt or self.datas[0].datetime.datetime(0)
-            logger.info(f"{dt.isoformat()} - {txt}")
+        # Streaming Wilder state: O(1) work per bar, so the same code serves
+        # backtests and live/walk-forward feeds without recomputing history.
+        self._period = self.params.rsi_period
+        self._prev_close = None
+        self._n_diffs = 0
+        self._avg_g = 0.0
+        self._avg_l = 0.0
+        # Bound once: params lookups go through the metaclass on every access
+        self._os = self.params.rsi_oversold
+        self._ob = self.params.rsi_overbought
 
     def notify_order(self, order: bt.Order) -> None:
         if order.status in [order.Submitted, order.Accepted]:
             return
         if order.status in [order.Completed]:
             if order.isbuy():
-                self.log(f"BUY EXECUTED, Price: {order.executed.price:.5f}")
+                self.log("BUY EXECUTED, Price: %.5f", order.executed.price)
             elif order.issell():
-                self.log(f"SELL EXECUTED, Price: {order.executed.price:.5f}")
+                self.log("SELL EXECUTED, Price: %.5f", order.executed.price)
             self.bar_executed = len(self)
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
             self.log(
-                f"Order Canceled/Margin/Rejected: {order.Status[order.status]}")
+                "Order Canceled/Margin/Rejected: %s", order.Status[order.status])
         self.order = None
 
     def notify_trade(self, trade: bt.Trade) -> None:
         if not trade.isclosed:
             return
         self.log(
-            f"OPERATION PROFIT, GROSS {trade.pnl:.2f}, NET {trade.pnlcomm:.2f}")
+            "OPERATION PROFIT, GROSS %.2f, NET %.2f", trade.pnl, trade.pnlcomm)
+
+    def _update_rsi(self) -> float:
+        """Feeds the current close into the RSI state; NaN during warm-up."""
+        close = self.dataclose[0]
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            return float("nan")
+        diff = close - prev
+        self._n_diffs += 1
+        if self._n_diffs > self._period:
+            self._avg_g, self._avg_l, rsi = rsi_wilder_step(
+                self._avg_g, self._avg_l, diff, self._period)
+            return rsi
+        # Seed: simple average of the first `period` gains/losses
+        self._avg_g += diff if diff > 0 else 0.0
+        self._avg_l += -diff if diff < 0 else 0.0
+        if self._n_diffs < self._period:
+            return float("nan")
+        self._avg_g /= self._period
+        self._avg_l /= self._period
+        return rsi_from_averages(self._avg_g, self._avg_l)
 
     def next(self):
+        rsi = self._update_rsi()  # State must advance on every bar
         if self.order:
             return
 
         if not self.position:  # Not in the market
-            if self.rsi < self.params.rsi_oversold:
+            if rsi < self._os:
                 self.log(
-                    f"BUY CREATE (RSI Oversold), Close: {self.dataclose[0]:.5f}, RSI: {self.rsi[0]:.2f}")
+                    "BUY CREATE (RSI Oversold), Close: %.5f, RSI: %.2f", self.dataclose[0], rsi)
                 self.order = self.buy()
         else:  # In the market
-            if self.rsi > self.params.rsi_overbought:
+            if rsi > self._ob:
                 self.log(
-                    f"SELL CREATE (RSI Overbought - Close Position), Close: {self.dataclose[0]:.5f}, RSI: {self.rsi[0]:.2f}")
+                    "SELL CREATE (RSI Overbought - Close Position), Close: %.5f, RSI: %.2f", self.dataclose[0], rsi)
                 self.order = self.sell()
@@ -0,0 +1,4 @@
+# fx_trader/backtest/vectorized/__init__.py
+from .ema_crossover import simulate as simulate_ema_crossover
+
+__all__ = ["simulate_ema_crossover"]
@@ -4,6 +4,6 @@ FX Trader configuration package.
 This package provides access to application settings and configuration.
 """
 
-from .settings import settings
+from .settings import ensure_loaded, export_settings_for_workers, get_settings, settings
 
-__all__ = ['settings']
+__all__ = ['ensure_loaded', 'export_settings_for_workers', 'get_settings', 'settings']
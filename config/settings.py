@@ -1,26 +1,69 @@
+import atexit
+import json
 import logging
 import os
+import tempfile
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Type
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Optional, Type
+from urllib.parse import quote
 
+import msgspec
 import yaml
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import (
+    AliasChoices,
     Field,
-    PostgresDsn,
-    RedisDsn,
-    validator,
-    field_validator,
+    PlainSerializer,
+    PlainValidator,
     model_validator,
 )
 
-# 後方互換性のためのエイリアス
-validator = field_validator
-
-from config.trading_params import TradingParameters
+from config.trading_params import TradingParameters, coerce_trading_parameters
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; resolved once at import
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_config_file(config_file_path_str: str) -> Dict[str, Any]:
+    """Parses a YAML (or JSON, see export_settings_for_workers) config file."""
+    config_file_path = Path(config_file_path_str)
+    logger.info(
+        f"Loading configuration from {config_file_path.suffix.lstrip('.').upper() or 'YAML'} file: {config_file_path}")
+    with open(config_file_path, "r") as f:
+        try:
+            if config_file_path.suffix == ".json":
+                return json.load(f)
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
+        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            logger.error(
+                f"Error parsing config file {config_file_path}: {e}")
+            return {}
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_file_path_str: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """
+    _parse_config_file cached on (path, mtime_ns, size): repeated Settings()
+    calls skip the open() and parse until the file changes. The result is
+    read-only since it is shared between callers.
+    """
+    return MappingProxyType(_parse_config_file(config_file_path_str))
+
+
+@lru_cache(maxsize=4)
+def _build_postgres_dsn(user: str, password: str, host: str, port: int, db: str) -> str:
+    """Postgres DSN from its components, shared by every Settings instance."""
+    return f"postgresql+psycopg2://{quote(user, safe='')}:{quote(password, safe='')}@{host}:{port}/{db}"
+
+
+@lru_cache(maxsize=4)
+def _build_redis_url(host: str, port: int, db: int) -> str:
+    return f"redis://{host}:{port}/{db}"
+
 
 def yaml_config_settings_source() -> Dict[str, Any]:
     """
@@ -34,16 +77,16 @@ def yaml_config_settings_source() -> Dict[str, Any]:
         "CONFIG_FILE_PATH", "config/config.dev.yaml")
     config_file_path = Path(config_file_path_str)
 
-    if config_file_path.exists():
-        logger.info(
-            f"Loading configuration from YAML file: {config_file_path}")
-        with open(config_file_path, "r") as f:
-            try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError as e:
-                logger.error(
-                    f"Error parsing YAML config file {config_file_path}: {e}")
-                return {}
+    try:
+        stat = config_file_path.stat()
+    except FileNotFoundError:
+        stat = None
+    if stat is not None:
+        if os.getenv("APP_ENV") == "development":
+            # Explicit development mode: always re-read for hot reloads
+            return _parse_config_file(str(config_file_path))
+        return dict(_load_config_cached(
+            str(config_file_path), stat.st_mtime_ns, stat.st_size))
     logger.warning(
         f"YAML config file not found at {config_file_path}. "
         "Relying on environment variables and defaults."
@@ -53,128 +96,102 @@ def yaml_config_settings_source() -> Dict[str, Any]:
 
 class Settings(BaseSettings):
     # --- Application Metadata ---
-    VERSION: str = Field("0.1.0", env="APP_VERSION")
-    APP_ENV: str = Field("development", env="APP_ENV")
+    VERSION: str = Field("0.1.0", validation_alias=AliasChoices("APP_VERSION", "VERSION"))
+    APP_ENV: str = "development"  # development, staging, production
     DEBUG: bool = False  # Will be set by model_validator based on APP_ENV
     
     # --- API Settings ---
-    API_V1_STR: str = Field("/api/v1", env="API_V1_STR")
-    DOCS_ENABLED: bool = Field(True, env="DOCS_ENABLED")
+    API_V1_STR: str = "/api/v1"
+    DOCS_ENABLED: bool = True
     
     # --- CORS Settings ---
     BACKEND_CORS_ORIGINS: list[str] = Field(
         default=["*"],  # 本番環境では適切なオリジンに制限してください
-        env="BACKEND_CORS_ORIGINS",
         description="List of origins that are allowed to make cross-origin requests"
     )
 
     # --- API Keys & Access Credentials ---
-    OANDA_ACCOUNT_ID: str = Field(..., env="OANDA_ACCOUNT_ID")
-    OANDA_ACCESS_TOKEN: str = Field(..., env="OANDA_ACCESS_TOKEN")
-    OANDA_ENVIRONMENT: str = Field(
-        default="practice", env="OANDA_ENVIRONMENT")  # 'practice' or 'live'
+    OANDA_ACCOUNT_ID: str
+    OANDA_ACCESS_TOKEN: str
+    OANDA_ENVIRONMENT: str = "practice"  # 'practice' or 'live'
 
-    FRED_API_KEY: Optional[str] = Field(None, env="FRED_API_KEY")
-    ALPHAVANTAGE_API_KEY: Optional[str] = Field(
-        None, env="ALPHAVANTAGE_API_KEY")
+    FRED_API_KEY: Optional[str] = None
+    ALPHAVANTAGE_API_KEY: Optional[str] = None
 
     # --- Vault Configuration ---
-    VAULT_ADDR: str = Field(default="http://localhost:8200", env="VAULT_ADDR")
-    VAULT_ROLE_ID: Optional[str] = Field(None, env="VAULT_ROLE_ID")
-    VAULT_SECRET_ID: Optional[str] = Field(None, env="VAULT_SECRET_ID")
+    VAULT_ADDR: str = "http://localhost:8200"
+    VAULT_ROLE_ID: Optional[str] = None
+    VAULT_SECRET_ID: Optional[str] = None
     # For token-based auth if not AppRole
-    VAULT_TOKEN: Optional[str] = Field(None, env="VAULT_TOKEN")
-    VAULT_KV_MOUNT_POINT: str = Field(
-        default="secret", env="VAULT_KV_MOUNT_POINT")
-    VAULT_SECRET_PATH: str = Field(
-        default="fx_trader/api_keys", env="VAULT_SECRET_PATH")
-    VAULT_RENEW_TOKEN: bool = Field(default=True, env="VAULT_RENEW_TOKEN")
-    VAULT_CACHE_TTL_SECONDS: int = Field(
-        default=300, env="VAULT_CACHE_TTL_SECONDS")  # 5 minutes
+    VAULT_TOKEN: Optional[str] = None
+    VAULT_KV_MOUNT_POINT: str = "secret"
+    VAULT_SECRET_PATH: str = "fx_trader/api_keys"
+    VAULT_RENEW_TOKEN: bool = True
+    VAULT_CACHE_TTL_SECONDS: int = 300  # 5 minutes
 
     # --- Infrastructure URLs & Credentials ---
-    DB_USER: str = Field(default="fx_user", env="DB_USER")
-    DB_PASSWORD: str = Field(default="fx_password", env="DB_PASSWORD")
-    DB_HOST: str = Field(default="localhost", env="DB_HOST")
-    DB_PORT: int = Field(default=5432, env="DB_PORT")
-    DB_NAME: str = Field(default="fx_trader_db", env="DB_NAME")
-    POSTGRES_DSN: Optional[PostgresDsn] = None  # Assembled below
-
-    @field_validator("POSTGRES_DSN", mode='before')
-    @classmethod
-    def assemble_postgres_dsn(cls, v: Optional[str], info: Any) -> Any:
-        if isinstance(v, str):
-            return v
-        values = info.data
-        return PostgresDsn.build(
-            scheme="postgresql+psycopg2",
-            username=values.get("DB_USER"),
-            password=values.get("DB_PASSWORD"),
-            host=values.get("DB_HOST"),
-            port=str(values.get("DB_PORT")),
-            path=f"/{values.get('DB_NAME') or ''}",
-        )
+    DB_USER: str = "fx_user"
+    DB_PASSWORD: str = "fx_password"
+    DB_HOST: str = "localhost"
+    DB_PORT: int = 5432
+    DB_NAME: str = "fx_trader_db"
+    # Full DSN from the POSTGRES_DSN env var (e.g. docker-compose); when unset,
+    # the POSTGRES_DSN property assembles it from the DB_* fields.
+    POSTGRES_DSN_OVERRIDE: Optional[str] = Field(None, alias="POSTGRES_DSN")
 
-    MLFLOW_TRACKING_URI: str = Field(
-        default="http://localhost:5001", env="MLFLOW_TRACKING_URI")
-    MLFLOW_S3_ENDPOINT_URL: str = Field(
-        default="http://localhost:9000", env="MLFLOW_S3_ENDPOINT_URL")
-    MLFLOW_ARTIFACT_ROOT: str = Field(
-        default="s3://mlflow-artifacts", env="MLFLOW_ARTIFACT_ROOT")
-    AWS_ACCESS_KEY_ID: Optional[str] = Field(
-        None, env="AWS_ACCESS_KEY_ID")  # For MinIO/S3
-    AWS_SECRET_ACCESS_KEY: Optional[str] = Field(
-        None, env="AWS_SECRET_ACCESS_KEY")  # For MinIO/S3
-
-    FEAST_REGISTRY_PATH: str = Field(
-        default="feature_store/registry.db", env="FEAST_REGISTRY_PATH")
-    FEAST_OFFLINE_STORE_PATH: str = Field(
-        default="feature_store/data/offline_store.parquet", env="FEAST_OFFLINE_STORE_PATH")
-    FEAST_ONLINE_STORE_CONFIG_PATH: str = Field(
-        default="feature_store/online_store.yaml", env="FEAST_ONLINE_STORE_CONFIG_PATH")
-
-    REDIS_HOST: str = Field(default="localhost", env="REDIS_HOST")
-    REDIS_PORT: int = Field(default=6379, env="REDIS_PORT")
-    REDIS_DB_APP: int = Field(default=0, env="REDIS_DB_APP")
-    REDIS_DB_FEAST: int = Field(default=1, env="REDIS_DB_FEAST")
-    REDIS_URL: Optional[RedisDsn] = None  # Assembled below for app Redis
-
-    @field_validator("REDIS_URL", mode='before')
-    @classmethod
-    def assemble_redis_url(cls, v: Optional[str], info: Any) -> Any:
-        if isinstance(v, str):
-            return v
-        values = info.data
-        return RedisDsn.build(
-            scheme="redis",
-            host=values.get("REDIS_HOST"),
-            port=str(values.get("REDIS_PORT")),
-            path=f"/{values.get('REDIS_DB_APP')}",
-        )
+    @cached_property
+    def POSTGRES_DSN(self) -> str:
+        if self.POSTGRES_DSN_OVERRIDE:
+            return self.POSTGRES_DSN_OVERRIDE
+        return _build_postgres_dsn(self.DB_USER, self.DB_PASSWORD, self.DB_HOST, self.DB_PORT, self.DB_NAME)
+
+    MLFLOW_TRACKING_URI: str = "http://localhost:5001"
+    MLFLOW_S3_ENDPOINT_URL: str = "http://localhost:9000"
+    MLFLOW_ARTIFACT_ROOT: str = "s3://mlflow-artifacts"
+    AWS_ACCESS_KEY_ID: Optional[str] = None  # For MinIO/S3
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None  # For MinIO/S3
+
+    FEAST_REGISTRY_PATH: str = "feature_store/registry.db"
+    FEAST_OFFLINE_STORE_PATH: str = "feature_store/data/offline_store.parquet"
+    FEAST_ONLINE_STORE_CONFIG_PATH: str = "feature_store/online_store.yaml"
+
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB_APP: int = 0
+    REDIS_DB_FEAST: int = 1
+    # Full URL from the REDIS_URL env var; otherwise assembled for app Redis
+    REDIS_URL_OVERRIDE: Optional[str] = Field(None, alias="REDIS_URL")
+
+    @cached_property
+    def REDIS_URL(self) -> str:
+        if self.REDIS_URL_OVERRIDE:
+            return self.REDIS_URL_OVERRIDE
+        return _build_redis_url(self.REDIS_HOST, self.REDIS_PORT, self.REDIS_DB_APP)
 
     # --- Notification Service (Telegram) ---
-    TELEGRAM_BOT_TOKEN: Optional[str] = Field(None, env="TELEGRAM_BOT_TOKEN")
-    TELEGRAM_CHAT_ID: Optional[str] = Field(None, env="TELEGRAM_CHAT_ID")
+    TELEGRAM_BOT_TOKEN: Optional[str] = None
+    TELEGRAM_CHAT_ID: Optional[str] = None
 
     # --- Trading Parameters ---
     # This will instantiate TradingParameters and load its values from ENV VARS if they are set,
     # otherwise defaults from TradingParameters model will be used.
     # ENV VARS for TradingParameters should be prefixed, e.g., FX_TRADER_MAX_POSITIONS_PER_CURRENCY
-    TRADING: TradingParameters = Field(default_factory=TradingParameters)
+    TRADING: Annotated[
+        TradingParameters,
+        PlainValidator(coerce_trading_parameters),
+        PlainSerializer(msgspec.to_builtins, return_type=dict),
+    ] = Field(default_factory=TradingParameters)
 
     # --- General Application Settings ---
     # DEBUG, INFO, WARNING, ERROR, CRITICAL
-    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
-    # development, staging, production
-    APP_ENV: str = Field(default="development", env="APP_ENV")
-
-    class Config:
-        model_config = {
-            "env_file": ".env",
-            "env_file_encoding": "utf-8",
-            "case_sensitive": True,
-            "extra": "ignore",
-        }
+    LOG_LEVEL: str = "INFO"
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
 
     @classmethod
     def settings_customise_sources(
@@ -201,7 +218,71 @@ class Settings(BaseSettings):
         return self
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Returns the process-wide Settings instance, built on first use."""
+    return Settings()
+
+
+def export_settings_for_workers() -> str:
+    """
+    Dumps the parsed settings to a private JSON file and points CONFIG_FILE_PATH
+    at it, so spawned worker processes load plain JSON instead of re-parsing
+    the YAML config. Returns the file path; the file is removed at exit.
+    """
+    exported = os.environ.get("FX_TRADER_EXPORTED_SETTINGS")
+    if exported and os.path.exists(exported):
+        return exported
+
+    # mkstemp creates the file with 0600 permissions (it contains credentials)
+    fd, path = tempfile.mkstemp(prefix="fx_trader_settings_", suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        # by_alias: the DSN overrides are read back under their env var names
+        f.write(get_settings().model_dump_json(by_alias=True))
+    atexit.register(lambda: os.path.exists(path) and os.remove(path))
+
+    os.environ["CONFIG_FILE_PATH"] = path
+    os.environ["FX_TRADER_EXPORTED_SETTINGS"] = path
+    return path
+
+
+class _LazySettings:
+    """
+    Stand-in for the process-wide Settings: the config file parse and field
+    validation happen on first attribute access rather than at import time.
+    """
+
+    __slots__ = ("_inst",)
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_inst", None)
+
+    def _load(self) -> Settings:
+        inst = self._inst
+        if inst is None:
+            inst = get_settings()
+            object.__setattr__(self, "_inst", inst)
+        return inst
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return repr(self._load())
+
+
+settings = _LazySettings()
+
+
+def ensure_loaded() -> Settings:
+    """Builds and validates the settings now (e.g. at server startup) and returns them."""
+    return settings._load()
 
 # Example: Accessing a trading parameter
 # print(settings.TRADING.MAX_DRAWDOWN_PCT)
@@ -1,60 +1,109 @@
-from typing import List, Literal
+import sys
+from functools import cached_property
+from typing import Annotated, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+import msgspec
+import msgspec.inspect
+import msgspec.structs
 
 
-class TradingParameters(BaseModel):
+class TradingParameters(msgspec.Struct, frozen=True, dict=True):
     """
     Defines trading parameters with sensible defaults and validation.
     These can be overridden by environment variables if corresponding
     variables are set in the main Settings class.
+
+    A frozen msgspec Struct: fixed field layout (dict=True only backs the
+    cached properties). Bounds are declared with msgspec.Meta and checked
+    once at construction.
     """
 
-    MAX_POSITIONS_PER_CURRENCY: int = Field(
-        default=2, ge=1, description="Maximum open positions per currency pair."
-    )
-    MAX_CONCURRENT_POSITIONS: int = Field(
-        default=5, ge=1, description="Maximum total concurrent open positions across all pairs."
-    )
-    MAX_DRAWDOWN_PCT: float = Field(
-        default=0.1, ge=0.01, le=0.5, description="Maximum portfolio drawdown percentage (e.g., 0.1 for 10%)."
-    )
-    ACCOUNT_RISK_PER_TRADE_PCT: float = Field(
-        default=0.01, ge=0.001, le=0.05, description="Percentage of account balance to risk per trade."
-    )
-    DEFAULT_SL_PIPS: float = Field(
-        default=50.0, ge=5.0, description="Default Stop Loss in pips if not dynamically calculated."
-    )
-    DEFAULT_TP_PIPS: float = Field(
-        default=100.0, ge=10.0, description="Default Take Profit in pips if not dynamically calculated."
-    )
-    SLIPPAGE_TOLERANCE_BPS: int = Field(
-        default=5, ge=0, le=50, description="Slippage tolerance in basis points (0.01%)."
-    )
-    ATR_PERIOD_FOR_SIZING: int = Field(
-        default=14, ge=5, description="ATR period used for position sizing."
-    )
-    ATR_MULTIPLIER_FOR_SL: float = Field(
-        default=2.0, ge=0.5, description="ATR multiplier for calculating Stop Loss."
-    )
-    ATR_MULTIPLIER_FOR_TP: float = Field(
-        default=3.0, ge=0.5, description="ATR multiplier for calculating Take Profit (can be optional)."
-    )
-    DEFAULT_TIMEFRAME: str = Field(
-        default="H1", description="Default trading timeframe (e.g., M1, M5, M15, M30, H1, H4, D1)."
-    )
-    NEWS_SENTIMENT_THRESHOLD: float = Field(
-        default=0.2, ge=-1.0, le=1.0, description="Threshold for news sentiment to influence trading decisions."
-    )
-    CORRELATION_THRESHOLD: float = Field(
-        default=0.7, ge=0.0, le=1.0, description="Portfolio correlation threshold to avoid over-exposure."
-    )
-    ALLOWED_CURRENCY_PAIRS: List[str] = Field(
-        default=["EUR_USD", "USD_JPY", "GBP_USD", "AUD_USD", "USD_CAD"],
+    MAX_POSITIONS_PER_CURRENCY: Annotated[int, msgspec.Meta(
+        ge=1, description="Maximum open positions per currency pair."
+    )] = 2
+    MAX_CONCURRENT_POSITIONS: Annotated[int, msgspec.Meta(
+        ge=1, description="Maximum total concurrent open positions across all pairs."
+    )] = 5
+    MAX_DRAWDOWN_PCT: Annotated[float, msgspec.Meta(
+        ge=0.01, le=0.5, description="Maximum portfolio drawdown percentage (e.g., 0.1 for 10%)."
+    )] = 0.1
+    ACCOUNT_RISK_PER_TRADE_PCT: Annotated[float, msgspec.Meta(
+        ge=0.001, le=0.05, description="Percentage of account balance to risk per trade."
+    )] = 0.01
+    DEFAULT_SL_PIPS: Annotated[float, msgspec.Meta(
+        ge=5.0, description="Default Stop Loss in pips if not dynamically calculated."
+    )] = 50.0
+    DEFAULT_TP_PIPS: Annotated[float, msgspec.Meta(
+        ge=10.0, description="Default Take Profit in pips if not dynamically calculated."
+    )] = 100.0
+    SLIPPAGE_TOLERANCE_BPS: Annotated[int, msgspec.Meta(
+        ge=0, le=50, description="Slippage tolerance in basis points (0.01%)."
+    )] = 5
+    ATR_PERIOD_FOR_SIZING: Annotated[int, msgspec.Meta(
+        ge=5, description="ATR period used for position sizing."
+    )] = 14
+    ATR_MULTIPLIER_FOR_SL: Annotated[float, msgspec.Meta(
+        ge=0.5, description="ATR multiplier for calculating Stop Loss."
+    )] = 2.0
+    ATR_MULTIPLIER_FOR_TP: Annotated[float, msgspec.Meta(
+        ge=0.5, description="ATR multiplier for calculating Take Profit (can be optional)."
+    )] = 3.0
+    DEFAULT_TIMEFRAME: Annotated[str, msgspec.Meta(
+        description="Default trading timeframe (e.g., M1, M5, M15, M30, H1, H4, D1)."
+    )] = "H1"
+    NEWS_SENTIMENT_THRESHOLD: Annotated[float, msgspec.Meta(
+        ge=-1.0, le=1.0, description="Threshold for news sentiment to influence trading decisions."
+    )] = 0.2
+    CORRELATION_THRESHOLD: Annotated[float, msgspec.Meta(
+        ge=0.0, le=1.0, description="Portfolio correlation threshold to avoid over-exposure."
+    )] = 0.7
+    ALLOWED_CURRENCY_PAIRS: Annotated[List[str], msgspec.Meta(
         description="List of currency pairs allowed for trading."
-    )
-    MIN_TRADE_DURATION_MINUTES: int = Field(
-        default=15, ge=0, description="Minimum duration for a trade to be considered valid (e.g., to avoid high-frequency scalping issues)."
-    )
+    )] = msgspec.field(default_factory=lambda: ["EUR_USD", "USD_JPY", "GBP_USD", "AUD_USD", "USD_CAD"])
+    MIN_TRADE_DURATION_MINUTES: Annotated[int, msgspec.Meta(
+        ge=0, description="Minimum duration for a trade to be considered valid (e.g., to avoid high-frequency scalping issues)."
+    )] = 15
 
     # TODO: Add more parameters as needed, e.g., for specific strategies
+
+    def __post_init__(self) -> None:
+        # msgspec enforces Meta bounds only when decoding/converting; apply the
+        # same bounds to direct keyword construction.
+        for name, lower, upper in _FIELD_BOUNDS:
+            value = getattr(self, name)
+            if (lower is not None and value < lower) or (upper is not None and value > upper):
+                raise ValueError(
+                    f"TradingParameters.{name}={value!r} is outside [{lower}, {upper}]")
+        # Interned so pair comparisons elsewhere reduce to identity checks
+        msgspec.structs.force_setattr(
+            self, "ALLOWED_CURRENCY_PAIRS", [sys.intern(pair) for pair in self.ALLOWED_CURRENCY_PAIRS])
+
+    @cached_property
+    def ALLOWED_CURRENCY_PAIRS_SET(self) -> FrozenSet[str]:
+        """ALLOWED_CURRENCY_PAIRS for O(1) `pair in ...` membership checks."""
+        return frozenset(self.ALLOWED_CURRENCY_PAIRS)
+
+
+def _collect_field_bounds() -> Tuple[Tuple[str, Optional[float], Optional[float]], ...]:
+    bounds = []
+    for field in msgspec.inspect.type_info(TradingParameters).fields:
+        # Fields with a description are wrapped in Metadata around the constrained type
+        field_type = field.type.type if isinstance(field.type, msgspec.inspect.Metadata) else field.type
+        lower = getattr(field_type, "ge", None)
+        upper = getattr(field_type, "le", None)
+        if lower is not None or upper is not None:
+            bounds.append((field.name, lower, upper))
+    return tuple(bounds)
+
+
+_FIELD_BOUNDS = _collect_field_bounds()
+
+
+def coerce_trading_parameters(value: object) -> TradingParameters:
+    """Builds TradingParameters from a mapping (YAML/JSON/env input) or passes one through."""
+    if isinstance(value, TradingParameters):
+        return value
+    try:
+        return msgspec.convert(value, TradingParameters, strict=False)
+    except msgspec.ValidationError as e:
+        raise ValueError(str(e)) from e
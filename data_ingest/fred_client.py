@@ -1,21 +1,27 @@
+import asyncio
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
 import diskcache
 import httpx
+import orjson
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field, validator
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config import settings
-from utils.http_client import get_async_http_client, make_request_with_retry
+from utils.frame_cache import load_frame, store_frame
+from utils.http_client import KEEPALIVE_LIMITS, get_async_http_client, make_request_with_retry
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Cache for FRED API responses
+# Cache for FRED API responses (observation DataFrames as Arrow IPC blobs)
 fred_cache = diskcache.Cache(
     "cache/fred_cache", size_limit=1024 * 1024 * 100)  # 100MB
+FRED_CACHE_EXPIRE_SECONDS = 60 * 60 * 24  # Cache for 24 hours
+# Concurrent requests per FredClient in get_many_series
+FRED_MAX_CONCURRENT_REQUESTS = 8
 
 
 class FredObservation(BaseModel):
@@ -47,24 +53,70 @@ class FredSeriesObservations(BaseModel):
     observations: List[FredObservation]
 
 
+# Series-level fields of an observations response kept in df.attrs["fred"]
+FRED_ENVELOPE_FIELDS = (
+    "realtime_start", "realtime_end", "observation_start", "observation_end", "units",
+)
+
+
+def observations_to_frame(data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Builds a DataFrame from a raw FRED observations payload in one vectorized
+    pass: 'value' becomes float64 (FRED's "." for missing becomes NaN) and the
+    date columns become datetime64. The envelope (FRED_ENVELOPE_FIELDS and
+    count) is kept as a plain dict in df.attrs["fred"].
+    """
+    df = pd.DataFrame(
+        data.get("observations", []),
+        columns=["realtime_start", "realtime_end", "date", "value"],
+    )
+    df["value"] = pd.to_numeric(df["value"].replace(".", np.nan), errors="coerce")
+    for column in ("date", "realtime_start", "realtime_end"):
+        df[column] = pd.to_datetime(df[column], format="%Y-%m-%d")
+    envelope: Dict[str, Any] = {field: data.get(field, "") for field in FRED_ENVELOPE_FIELDS}
+    envelope["count"] = int(data.get("count", len(df)))
+    df.attrs["fred"] = envelope
+    return df
+
+
 class FredClient:
     BASE_URL = "https://api.stlouisfed.org/fred"
 
-    def __init__(self, api_key: Optional[str] = settings.FRED_API_KEY):
+    def __init__(self, api_key: Optional[str] = None):  # Defaults to settings.FRED_API_KEY
+        if api_key is None:
+            api_key = settings.FRED_API_KEY
         if not api_key:
             logger.warning(
                 "FRED_API_KEY not set. FREDClient will not be functional.")
             # raise ValueError("FRED_API_KEY is required for FredClient")
         self.api_key = api_key
+        self._client: Optional[httpx.AsyncClient] = None
 
-    @fred_cache.memoize(expire=60 * 60 * 24)  # Cache for 24 hours
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def get_series_observations(
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Returns the instance's pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = await get_async_http_client(base_url=self.BASE_URL, limits=KEEPALIVE_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client; the next request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "FredClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _fetch_observations(
         self,
         series_id: str,
         observation_start: Optional[date] = None,
         observation_end: Optional[date] = None,
-    ) -> Optional[FredSeriesObservations]:
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the raw JSON payload of /series/observations."""
         if not self.api_key:
             logger.error("Cannot fetch FRED data: API key not configured.")
             return None
@@ -81,17 +133,69 @@ class FredClient:
         if observation_end:
             params["observation_end"] = observation_end.strftime("%Y-%m-%d")
 
-        async with await get_async_http_client(base_url=self.BASE_URL) as client:
-            try:
-                response = await make_request_with_retry(client, "GET", endpoint, params=params)
-                data = response.json()
-                return FredSeriesObservations(**data)
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"FRED API error for series {series_id}: {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error fetching FRED series {series_id}: {e}")
-                raise
-        return None
+        client = await self._get_client()
+        try:
+            response = await make_request_with_retry(client, "GET", endpoint, params=params)
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"FRED API error for series {series_id}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error fetching FRED series {series_id}: {e}")
+            raise
+
+    async def get_series_observations(
+        self,
+        series_id: str,
+        observation_start: Optional[date] = None,
+        observation_end: Optional[date] = None,
+    ) -> Optional[FredSeriesObservations]:
+        data = await self._fetch_observations(series_id, observation_start, observation_end)
+        if data is None:
+            return None
+        return FredSeriesObservations(**data)
+
+    async def get_series_observations_df(
+        self,
+        series_id: str,
+        observation_start: Optional[date] = None,
+        observation_end: Optional[date] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Same request as get_series_observations, returned as a DataFrame
+        (date, value, realtime_start, realtime_end) without per-row pydantic models.
+        Results are cached for 24 hours as Arrow IPC blobs.
+        """
+        cache_key = f"fred:observations:{series_id}:{observation_start}:{observation_end}"
+        df = load_frame(fred_cache, cache_key)
+        if df is not None:
+            return df
+
+        data = await self._fetch_observations(series_id, observation_start, observation_end)
+        if data is None:
+            return None
+        df = observations_to_frame(data)
+        store_frame(fred_cache, cache_key, df, expire=FRED_CACHE_EXPIRE_SECONDS)
+        return df
+
+    async def get_many_series(
+        self,
+        series_ids: List[str],
+        observation_start: Optional[date] = None,
+        observation_end: Optional[date] = None,
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetches several series concurrently over the shared connection pool,
+        at most FRED_MAX_CONCURRENT_REQUESTS in flight. Keyed by series id;
+        a series whose request returned no data maps to None.
+        """
+        semaphore = asyncio.Semaphore(FRED_MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_one(series_id: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                return await self.get_series_observations_df(series_id, observation_start, observation_end)
+
+        frames = await asyncio.gather(*(fetch_one(series_id) for series_id in series_ids))
+        return dict(zip(series_ids, frames))
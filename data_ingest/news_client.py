@@ -3,18 +3,27 @@ from typing import Any, Dict, List, Optional
 
 import diskcache
 import httpx
+import orjson
+import pandas as pd
 from pydantic import BaseModel, Field, validator
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config import settings
-from utils.http_client import get_async_http_client, make_request_with_retry
+from utils.frame_cache import load_frame, store_frame
+from utils.http_client import KEEPALIVE_LIMITS, get_async_http_client, make_request_with_retry
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Cache for News API responses
+# Cache for News API responses (article DataFrames as Arrow IPC blobs)
 news_cache = diskcache.Cache(
     "cache/news_cache", size_limit=1024 * 1024 * 50)  # 50MB
+NEWS_CACHE_EXPIRE_SECONDS = 60 * 60 * 1  # Cache for 1 hour
+
+NEWS_ARTICLE_COLUMNS = [
+    "title", "url", "time_published", "authors", "summary", "banner_image",
+    "source", "category_within_source", "source_domain", "topics",
+    "overall_sentiment_score", "overall_sentiment_label", "ticker_sentiment",
+]
 
 
 class NewsArticleSentiment(BaseModel):
@@ -53,24 +62,55 @@ class AlphaVantageNewsResponse(BaseModel):
     feed: List[NewsArticle]
 
 
+def articles_to_frame(feed: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    One row per article. `topics` and `ticker_sentiment` stay lists of dicts,
+    which Arrow stores as list<struct> columns.
+    """
+    df = pd.DataFrame(feed, columns=NEWS_ARTICLE_COLUMNS)
+    # AlphaVantage format: "20231026T023151"
+    df["time_published"] = pd.to_datetime(df["time_published"], format="%Y%m%dT%H%M%S")
+    df["overall_sentiment_score"] = pd.to_numeric(df["overall_sentiment_score"], errors="coerce")
+    return df
+
+
 class NewsClient:
     BASE_URL = "https://www.alphavantage.co"
 
-    def __init__(self, api_key: Optional[str] = settings.ALPHAVANTAGE_API_KEY):
+    def __init__(self, api_key: Optional[str] = None):  # Defaults to settings.ALPHAVANTAGE_API_KEY
+        if api_key is None:
+            api_key = settings.ALPHAVANTAGE_API_KEY
         if not api_key:
             logger.warning(
                 "ALPHAVANTAGE_API_KEY not set. NewsClient will not be functional.")
         self.api_key = api_key
+        self._client: Optional[httpx.AsyncClient] = None
 
-    @news_cache.memoize(expire=60 * 60 * 1)  # Cache for 1 hour
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def get_news_sentiment(
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Returns the instance's pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = await get_async_http_client(base_url=self.BASE_URL, limits=KEEPALIVE_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client; the next request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "NewsClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _fetch_news(
         self,
-        # e.g., ["AAPL", "MSFT"] for stocks, or "FOREX:EURUSD"
         tickers: Optional[List[str]] = None,
-        topics: Optional[List[str]] = None,  # e.g., ["technology", "earnings"]
-        limit: int = 50,  # Max 1000, default 50
-    ) -> Optional[AlphaVantageNewsResponse]:
+        topics: Optional[List[str]] = None,
+        limit: int = 50,
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the raw NEWS_SENTIMENT JSON payload, or None on API errors."""
         if not self.api_key:
             logger.error(
                 "Cannot fetch news data: AlphaVantage API key not configured.")
@@ -88,19 +128,52 @@ class NewsClient:
             # e.g. "blockchain", "earnings", "ipo", "mergers_and_acquisitions", "financial_markets", "economy_fiscal", "economy_monetary", "economy_macro", "energy_transportation", "finance", "life_sciences", "manufacturing", "real_estate", "retail_wholesale", "technology"
             params["topics"] = ",".join(topics)
 
-        async with await get_async_http_client(base_url=self.BASE_URL) as client:
-            try:
-                response = await make_request_with_retry(client, "GET", endpoint, params=params)
-                data = response.json()
-                if "Error Message" in data or "Information" in data:  # AlphaVantage error/limit messages
-                    logger.error(f"AlphaVantage API error/info: {data}")
-                    return None  # Or raise a custom error
-                return AlphaVantageNewsResponse(**data)
-            except httpx.HTTPStatusError as e:
-                logger.error(f"AlphaVantage API error: {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error fetching AlphaVantage news: {e}")
-                raise
-        return None
+        client = await self._get_client()
+        try:
+            response = await make_request_with_retry(client, "GET", endpoint, params=params)
+            data = orjson.loads(response.content)
+            if "Error Message" in data or "Information" in data:  # AlphaVantage error/limit messages
+                logger.error(f"AlphaVantage API error/info: {data}")
+                return None  # Or raise a custom error
+            return data
+        except httpx.HTTPStatusError as e:
+            logger.error(f"AlphaVantage API error: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error fetching AlphaVantage news: {e}")
+            raise
+
+    async def get_news_sentiment(
+        self,
+        # e.g., ["AAPL", "MSFT"] for stocks, or "FOREX:EURUSD"
+        tickers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,  # e.g., ["technology", "earnings"]
+        limit: int = 50,  # Max 1000, default 50
+    ) -> Optional[AlphaVantageNewsResponse]:
+        data = await self._fetch_news(tickers, topics, limit)
+        if data is None:
+            return None
+        return AlphaVantageNewsResponse(**data)
+
+    async def get_news_sentiment_df(
+        self,
+        tickers: Optional[List[str]] = None,
+        topics: Optional[List[str]] = None,
+        limit: int = 50,
+    ) -> Optional[pd.DataFrame]:
+        """
+        News articles as a DataFrame (see articles_to_frame), cached for one
+        hour as an Arrow IPC blob so cache hits skip pydantic entirely.
+        """
+        cache_key = f"news:sentiment:{','.join(tickers or ())}:{','.join(topics or ())}:{limit}"
+        df = load_frame(news_cache, cache_key)
+        if df is not None:
+            return df
+
+        data = await self._fetch_news(tickers, topics, limit)
+        if data is None:
+            return None
+        df = articles_to_frame(data.get("feed", []))
+        store_frame(news_cache, cache_key, df, expire=NEWS_CACHE_EXPIRE_SECONDS)
+        return df
@@ -1,9 +1,12 @@
 import asyncio
-import json
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import httpx
+import msgspec
+import numpy as np
+import orjson
 import pandas as pd
 import websockets
 from oandapyV20 import API, V20Error
@@ -13,12 +16,24 @@ from pydantic import BaseModel, Field, validator
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config import settings
-from utils.http_client import get_async_http_client, make_request_with_retry
+from utils.http_client import KEEPALIVE_LIMITS, get_async_http_client, make_request_with_retry
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+_UTC = timezone.utc
+# RFC 3339 in UTC, as accepted by the v20 `from`/`to` query parameters
+_OANDA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def _format_oanda_time(value: datetime) -> str:
+    """Formats a datetime for OANDA; naive values are taken to be UTC already."""
+    if value.tzinfo is not None and value.utcoffset():
+        value = value.astimezone(_UTC)
+    return value.strftime(_OANDA_TIME_FORMAT)
+
+
 class OandaCandle(BaseModel):
     time: datetime
     open: float = Field(alias="o")
@@ -33,16 +48,23 @@ class OandaCandle(BaseModel):
         # OANDA v20 returns time as a string like "2023-01-01T00:00:00.000000000Z"
         # or sometimes as a float/int timestamp for streaming
         if isinstance(value, str):
-            try:  # Handle nanosecond precision if present
-                return datetime.strptime(value.split('.')[0], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
-            except ValueError:
-                return pd.to_datetime(value).to_pydatetime().replace(tzinfo=timezone.utc)
+            if len(value) >= 19:
+                # Fixed-width prefix "YYYY-MM-DDTHH:MM:SS"; fractional seconds are dropped
+                try:
+                    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                                    int(value[11:13]), int(value[14:16]), int(value[17:19]), tzinfo=_UTC)
+                except ValueError:
+                    pass
+            # Rare non fixed-width formats
+            return pd.to_datetime(value, utc=True).to_pydatetime()
         elif isinstance(value, (float, int)):
-            return datetime.fromtimestamp(value, tz=timezone.utc)
+            return datetime.fromtimestamp(value, tz=_UTC)
         raise ValueError(f"Invalid time format: {value}")
 
 
-class OandaPriceTick(BaseModel):
+class OandaPriceTick(msgspec.Struct, frozen=True, gc=False):
+    # Immutable and untracked by the cyclic GC: ticks only hold scalars and
+    # are created at stream rate, so they should stay as cheap as tuples.
     type: str
     time: datetime
     instrument: str
@@ -50,47 +72,143 @@ class OandaPriceTick(BaseModel):
     ask: float
     status: Optional[str] = None  # e.g. 'tradeable' or 'non-tradeable'
 
-    @validator("time", pre=True)
-    def parse_time(cls, value: str) -> datetime:
-        return pd.to_datetime(value).to_pydatetime().replace(tzinfo=timezone.utc)
 
-    @validator("bid", "ask", pre=True)
-    def parse_float_from_string(cls, value: Any) -> float:
-        # OANDA sometimes sends bids/asks as list of dicts
-        if isinstance(value, list) and value:
-            return float(value[0]['price'])
-        return float(value)
+class _OandaPriceBucket(msgspec.Struct, gc=False):
+    price: float
+
+
+class _OandaStreamMessage(msgspec.Struct):
+    # Wire format of the pricing stream; covers both PRICE and HEARTBEAT
+    # messages. Unknown fields (closeoutBid, tradeable, ...) are skipped.
+    type: str
+    time: datetime
+    instrument: str = ""
+    bids: List[_OandaPriceBucket] = []
+    asks: List[_OandaPriceBucket] = []
+    status: Optional[str] = None
+
+
+CANDLE_PRICE_COLUMNS = ["open", "high", "low", "close"]
+CANDLE_COLUMNS = ["time", *CANDLE_PRICE_COLUMNS, "volume", "complete"]
+# Candle component holding the OHLC values for each `price` request parameter
+_CANDLE_PRICE_KEYS = {"M": "mid", "B": "bid", "A": "ask"}
+_CANDLE_OHLC_KEYS = (("open", "o"), ("high", "h"), ("low", "l"), ("close", "c"))
+
+
+def candles_to_frame(
+    candles: List[Dict[str, Any]], price: str = "M", price_dtype: Any = np.float64, time_index: bool = False
+) -> pd.DataFrame:
+    """
+    Parses OANDA candles into CANDLE_COLUMNS column by column: each field is
+    pulled straight into a contiguous NumPy array (OHLC as `price_dtype`),
+    with no intermediate per-candle rows. Accepts both the nested v20 layout
+    ({"mid": {"o": ...}, "volume": ...}) and flat o/h/l/c/v. With
+    `time_index`, "time" becomes the index instead of a column.
+    """
+    n = len(candles)
+    price_key = _CANDLE_PRICE_KEYS.get(price, "mid")
+    nested = n > 0 and price_key in candles[0]
+    volume_key = "volume" if n == 0 or "volume" in candles[0] else "v"
+
+    times = pd.to_datetime([c["time"] for c in candles], utc=True, format="ISO8601")
+    columns: Dict[str, Any] = {} if time_index else {"time": times}
+    for column, key in _CANDLE_OHLC_KEYS:
+        values = (c[price_key][key] for c in candles) if nested else (c[key] for c in candles)
+        columns[column] = np.fromiter(values, dtype=price_dtype, count=n)
+    columns["volume"] = np.fromiter((c[volume_key] for c in candles), dtype=np.int64, count=n)
+    columns["complete"] = np.fromiter((c.get("complete", True) for c in candles), dtype=bool, count=n)
+    if time_index:
+        return pd.DataFrame(columns, index=times.rename("time"), columns=CANDLE_COLUMNS[1:])
+    return pd.DataFrame(columns, columns=CANDLE_COLUMNS)
+
+
+@lru_cache(maxsize=32)
+def _pricing_stream_uri(streaming_url: str, account_id: str, instruments: Tuple[str, ...]) -> str:
+    return f"{streaming_url}/accounts/{account_id}/pricing/stream?instruments={','.join(instruments)}"
 
 
 class OandaClient:
     def __init__(
         self,
-        access_token: str = settings.OANDA_ACCESS_TOKEN,
-        account_id: str = settings.OANDA_ACCOUNT_ID,
-        environment: str = settings.OANDA_ENVIRONMENT,  # "practice" or "live"
+        access_token: Optional[str] = None,  # Defaults to settings.OANDA_ACCESS_TOKEN
+        account_id: Optional[str] = None,  # Defaults to settings.OANDA_ACCOUNT_ID
+        environment: Optional[str] = None,  # "practice" or "live"; defaults to settings.OANDA_ENVIRONMENT
     ):
-        self.access_token = access_token
-        self.account_id = account_id
-        self.environment = environment
+        self.access_token = access_token if access_token is not None else settings.OANDA_ACCESS_TOKEN
+        self.account_id = account_id if account_id is not None else settings.OANDA_ACCOUNT_ID
+        self.environment = environment if environment is not None else settings.OANDA_ENVIRONMENT
         self.base_url = (
             "https://api-fxpractice.oanda.com/v3"
-            if environment == "practice"
+            if self.environment == "practice"
             else "https://api-fxtrade.oanda.com/v3"
         )
         self.streaming_url = (
             "wss://stream-fxpractice.oanda.com/v3"
-            if environment == "practice"
+            if self.environment == "practice"
             else "wss://stream-fxtrade.oanda.com/v3"
         )
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
+        # Reused for every pricing stream (re)connect
+        self._stream_headers = {"Authorization": self.headers["Authorization"]}
         # For synchronous operations using oandapyV20
         self.sync_api = API(access_token=self.access_token,
                             environment=self.environment)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Returns the instance's pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = await get_async_http_client(base_url=self.base_url, headers=self.headers, limits=KEEPALIVE_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client; the next request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "OandaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _fetch_candles(
+        self,
+        instrument: str,
+        granularity: str,
+        count: Optional[int],
+        from_time: Optional[datetime],
+        to_time: Optional[datetime],
+        price: str,
+    ) -> List[Dict[str, Any]]:
+        """Returns the raw `candles` list of the instrument candles endpoint."""
+        params: Dict[str, Any] = {"granularity": granularity, "price": price}
+        if count:
+            params["count"] = count
+        if from_time:
+            params["from"] = _format_oanda_time(from_time)
+        if to_time:
+            params["to"] = _format_oanda_time(to_time)
+
+        endpoint = f"/instruments/{instrument}/candles"
+        client = await self._get_client()
+        try:
+            response = await make_request_with_retry(client, "GET", endpoint, params=params)
+            data = orjson.loads(response.content)
+            return data.get("candles", [])
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"OANDA API error fetching candles for {instrument}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error fetching OANDA candles for {instrument}: {e}")
+            raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def get_historical_candles(
         self,
         instrument: str,
@@ -101,35 +219,38 @@ class OandaClient:
         price: str = "M",  # M = Midpoint, B = Bid, A = Ask
     ) -> List[OandaCandle]:
         """Fetches historical candle data."""
-        params: Dict[str, Any] = {"granularity": granularity, "price": price}
-        if count:
-            params["count"] = count
-        if from_time:
-            params["from"] = from_time.isoformat().replace("+00:00", "Z")
-        if to_time:
-            params["to"] = to_time.isoformat().replace("+00:00", "Z")
+        candles = await self._fetch_candles(instrument, granularity, count, from_time, to_time, price)
+        frame = candles_to_frame(candles, price)
+        # Values are already parsed by candles_to_frame, so skip per-candle validation
+        return [OandaCandle.model_construct(**record) for record in frame.to_dict("records")]
 
-        endpoint = f"/instruments/{instrument}/candles"
-        async with await get_async_http_client(base_url=self.base_url, headers=self.headers) as client:
-            try:
-                response = await make_request_with_retry(client, "GET", endpoint, params=params)
-                data = response.json()
-                return [OandaCandle(**candle) for candle in data.get("candles", [])]
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"OANDA API error fetching candles for {instrument}: {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error fetching OANDA candles for {instrument}: {e}")
-                raise
+    async def get_historical_candles_df(
+        self,
+        instrument: str,
+        granularity: str = "H1",
+        count: Optional[int] = None,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        price: str = "M",
+        time_index: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Fetches historical candles as a DataFrame (time, open, high, low, close,
+        volume, complete) with float32 OHLC, without building a model per candle.
+        With `time_index`, "time" is the index rather than a column.
+        """
+        candles = await self._fetch_candles(instrument, granularity, count, from_time, to_time, price)
+        return candles_to_frame(candles, price, price_dtype=np.float32, time_index=time_index)
 
     async def stream_prices(
         self, instruments: List[str]
     ) -> AsyncGenerator[OandaPriceTick, None]:
         """Streams real-time pricing data for a list of instruments."""
-        uri = f"{self.streaming_url}/accounts/{self.account_id}/pricing/stream?instruments={','.join(instruments)}"
-        headers = {"Authorization": f"Bearer {self.access_token}"}
+        uri = _pricing_stream_uri(self.streaming_url, self.account_id, tuple(sorted(instruments)))
+        headers = self._stream_headers
+        # strict=False lets the decoder coerce OANDA's string prices to float.
+        # The bound method is hoisted so the per-frame loop reads a local.
+        decode = msgspec.json.Decoder(_OandaStreamMessage, strict=False).decode
 
         while True:  # Outer loop for reconnections
             try:
@@ -139,30 +260,35 @@ class OandaClient:
                         f"Connected to OANDA price stream for {instruments}")
                     while True:
                         try:
-                            message_str = await asyncio.wait_for(websocket.recv(), timeout=30.0)
-                            message = json.loads(message_str)  # type: ignore
-
-                            if message.get("type") == "PRICE":
-                                # OANDA sends bid/ask as list of dicts, need to extract
-                                bid = float(message["bids"][0]["price"]) if message.get(
-                                    "bids") else 0.0
-                                ask = float(message["asks"][0]["price"]) if message.get(
-                                    "asks") else 0.0
-
-                                tick_data = {
-                                    "type": message["type"],
-                                    "time": message["time"],
-                                    "instrument": message["instrument"],
-                                    "bid": bid,
-                                    "ask": ask,
-                                    "status": message.get("status")
-                                }
-                                yield OandaPriceTick(**tick_data)
-                            elif message.get("type") == "HEARTBEAT":
-                                logger.debug(f"OANDA Heartbeat: {message}")
-                            else:
-                                logger.warning(
-                                    f"Received unhandled OANDA message type: {message}")
+                            frames = [await asyncio.wait_for(websocket.recv(), timeout=30.0)]
+                            # Drain frames the connection has already buffered; recv()
+                            # returns them without suspending while the queue is non-empty.
+                            while websocket.messages:
+                                frames.append(await websocket.recv())
+
+                            for message_str in frames:
+                                try:
+                                    message = decode(message_str)
+                                except msgspec.DecodeError as e:
+                                    logger.error(
+                                        f"Error decoding JSON from OANDA stream: {e}. Message: {message_str}")
+                                    continue
+
+                                if message.type == "PRICE":
+                                    # OANDA sends bid/ask as list of price buckets, take the top of book
+                                    yield OandaPriceTick(
+                                        type=message.type,
+                                        time=message.time,
+                                        instrument=message.instrument,
+                                        bid=message.bids[0].price if message.bids else 0.0,
+                                        ask=message.asks[0].price if message.asks else 0.0,
+                                        status=message.status,
+                                    )
+                                elif message.type == "HEARTBEAT":
+                                    logger.debug(f"OANDA Heartbeat: {message}")
+                                else:
+                                    logger.warning(
+                                        f"Received unhandled OANDA message type: {message}")
 
                         except asyncio.TimeoutError:
                             logger.warning(
@@ -177,9 +303,6 @@ class OandaClient:
                             logger.warning(
                                 f"OANDA stream connection closed: {e}. Reconnecting...")
                             break  # Break inner loop to reconnect
-                        except json.JSONDecodeError as e:
-                            logger.error(
-                                f"Error decoding JSON from OANDA stream: {e}. Message: {message_str}")
                         except Exception as e:
                             logger.error(f"Error in OANDA price stream: {e}")
                             # Wait before continuing or breaking
@@ -33,6 +33,7 @@ if [ "$COMMAND" = "api" ]; then
     ${FX_TRADER_APP_MODULE:-fx_trader.app.main:app} \
     --host 0.0.0.0 \
     --port ${PORT:-8000} \
+    --loop uvloop \
     $RELOAD_OPTION
 elif [ "$COMMAND" = "worker" ]; then
   echo "Starting Celery worker..."
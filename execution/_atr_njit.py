@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from utils._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True, fastmath=True)
+def wilder_atr_last(high, low, close, period):
+    """
+    Final Wilder-smoothed ATR value in a single pass, with no output array.
+
+    Matches talib.ATR's last element: the first ATR is the mean true range of
+    bars 1..period, then atr = (atr * (period - 1) + tr) / period. Returns NaN
+    when there are fewer than period + 1 bars.
+    """
+    n = close.size
+    if period < 1 or n <= period:
+        return np.nan
+    atr = 0.0
+    for i in range(1, n):
+        h = np.float64(high[i])
+        l = np.float64(low[i])
+        prev_close = np.float64(close[i - 1])
+        tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        if i <= period:
+            atr += tr
+            if i == period:
+                atr /= period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+@njit(cache=True, fastmath=True)
+def wilder_atr(high, low, close, period):
+    """
+    Wilder-smoothed ATR for every bar, computed the same way as
+    wilder_atr_last (so out[-1] equals it). The first `period` values are
+    NaN, as with talib.ATR.
+    """
+    n = close.size
+    out = np.empty(n)
+    out[:] = np.nan
+    if period < 1 or n <= period:
+        return out
+    atr = 0.0
+    for i in range(1, n):
+        h = np.float64(high[i])
+        l = np.float64(low[i])
+        prev_close = np.float64(close[i - 1])
+        tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        if i <= period:
+            atr += tr
+            if i == period:
+                atr /= period
+                out[i] = atr
+        else:
+            atr = (atr * (period - 1) + tr) / period
+            out[i] = atr
+    return out
+
+
+def _wilder_atr_ewm(high, low, close, period):
+    """
+    wilder_atr without a Python-level loop, for when numba is not installed
+    and the kernels above would run as plain Python. True range is computed
+    vectorized and the smoothing is pandas' (Cython) ewm: seeded with the
+    mean of the first `period` true ranges, ewm(alpha=1/period, adjust=False)
+    is exactly atr = (atr * (period - 1) + tr) / period.
+    """
+    n = close.size
+    out = np.full(n, np.nan)
+    if period < 1 or n <= period:
+        return out
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    prev_close = close[:-1]
+    # tr[j] is the true range of bar j + 1
+    tr = np.maximum.reduce([high[1:] - low[1:],
+                            np.abs(high[1:] - prev_close),
+                            np.abs(low[1:] - prev_close)])
+    smoothed = tr[period - 1:].copy()
+    smoothed[0] = tr[:period].mean()
+    out[period:] = pd.Series(smoothed).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+    return out
+
+
+def _wilder_atr_last_ewm(high, low, close, period):
+    """wilder_atr_last counterpart of _wilder_atr_ewm."""
+    if period < 1 or close.size <= period:
+        return np.nan
+    return _wilder_atr_ewm(high, low, close, period)[-1]
+
+
+if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only without numba
+    wilder_atr = _wilder_atr_ewm
+    wilder_atr_last = _wilder_atr_last_ewm
@@ -0,0 +1,54 @@
+import numpy as np
+
+from execution._atr_njit import wilder_atr_last
+
+
+class OhlcRing:
+    """
+    Fixed-size high/low/close history for live ATR updates, stored as three
+    parallel float64 arrays (structure of arrays) instead of a growing
+    DataFrame: push() is O(1) and memory stays bounded at `capacity` bars.
+
+    Each array is twice `capacity` long and every bar is written at both
+    `i` and `i + capacity`, so the most recent k bars are always one
+    contiguous slice and last_k() returns views with no concatenation.
+    The views are overwritten by later pushes; copy them to keep them.
+    """
+
+    __slots__ = ("capacity", "high", "low", "close", "_idx", "_filled")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.high = np.full(2 * capacity, np.nan)
+        self.low = np.full(2 * capacity, np.nan)
+        self.close = np.full(2 * capacity, np.nan)
+        self._idx = 0  # Slot the next bar goes to, in [0, capacity)
+        self._filled = 0
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def push(self, high: float, low: float, close: float) -> None:
+        """Appends a bar, dropping the oldest one once the ring is full."""
+        i = self._idx
+        j = i + self.capacity
+        self.high[i] = self.high[j] = high
+        self.low[i] = self.low[j] = low
+        self.close[i] = self.close[j] = close
+        self._idx = (i + 1) % self.capacity
+        if self._filled < self.capacity:
+            self._filled += 1
+
+    def last_k(self, k: int):
+        """(high, low, close) views of the most recent min(k, len(self)) bars, oldest first."""
+        k = min(k, self._filled)
+        # Bars end just before _idx in the second copy: [idx + capacity - k, idx + capacity)
+        stop = self._idx + self.capacity
+        window = slice(stop - k, stop)
+        return self.high[window], self.low[window], self.close[window]
+
+    def atr(self, period: int) -> float:
+        """Wilder ATR over every stored bar; NaN with fewer than period + 1 bars."""
+        return wilder_atr_last(*self.last_k(self.capacity), period)
@@ -0,0 +1,35 @@
+from execution._atr_njit import wilder_atr_last
+from utils._njit import njit
+
+
+# No fastmath here: the ATR fallback below relies on NaN comparing false
+@njit(cache=True)
+def evaluate_signal(direction, entry, high, low, close, atr_period, atr_sl_mult, atr_tp_mult,
+                    default_sl_pips, default_tp_pips, pip_size, account_balance, risk_pct,
+                    pip_value_per_lot):
+    """
+    RiskManager's calculate_sl_tp -> calculate_position_size -> pre_trade_checks
+    sequence fused into one compiled call for backtest loops.
+
+    `direction` is +1.0 for BUY, -1.0 for SELL (0.0 for anything else). SL/TP
+    are placed ATR multiples from `entry`, or the default pip distances when
+    the ATR is unavailable. Lots risk `risk_pct` of `account_balance` on the
+    SL distance, rounded to 4 decimals. Returns (sl, tp, lots, ok), where ok
+    means a BUY/SELL with a positive size.
+    """
+    atr = wilder_atr_last(high, low, close, atr_period)
+    if atr > 0.0:
+        sl_distance = atr * atr_sl_mult
+        tp_distance = atr * atr_tp_mult
+    else:
+        sl_distance = default_sl_pips * pip_size
+        tp_distance = default_tp_pips * pip_size
+    sl = entry - direction * sl_distance
+    tp = entry + direction * tp_distance
+
+    risk_in_pips = sl_distance / pip_size
+    lots = 0.0
+    if risk_in_pips > 0.0:
+        lots = round(account_balance * risk_pct / (risk_in_pips * pip_value_per_lot), 4)
+    ok = direction != 0.0 and lots > 0.0
+    return sl, tp, lots, ok
@@ -1,9 +1,36 @@
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+
+import pandas as pd
 
 from models.signals import Signal, SignalActionType
 
 
+_T = TypeVar("_T")
+
+
+def _slotted_dataclass(cls: Type[_T]) -> Type[_T]:
+    """
+    dataclass(slots=True) for order/position records (no per-instance
+    __dict__). Python < 3.10 lacks the flag, so the class is rebuilt with
+    __slots__ the same way the stdlib does it.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    # Field defaults already live in the generated __init__, so the class
+    # attributes that would shadow the slot descriptors are dropped
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in field_names and key not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
 class OrderType(str):
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -20,12 +47,13 @@ class OrderStatus(str):
     PARTIALLY_FILLED = "PARTIALLY_FILLED"
 
 
-class TradeOrder(ABC):  # Could be a Pydantic model too
+@_slotted_dataclass
+class TradeOrder:
     order_id: str
-    client_order_id: Optional[str] = None
     instrument: str
     units: float  # Positive for buy, negative for sell
     order_type: OrderType
+    client_order_id: Optional[str] = None
     price: Optional[float] = None  # For LIMIT/STOP orders
     stop_loss_on_fill: Optional[Dict[str, Any]
                                 ] = None  # e.g., {"price": 1.2345}
@@ -35,7 +63,8 @@ class TradeOrder(ABC):  # Could be a Pydantic model too
     # Add more fields like creation_timestamp, filled_timestamp, avg_fill_price etc.
 
 
-class Position(ABC):  # Could be a Pydantic model
+@_slotted_dataclass
+class Position:
     instrument: str
     long_units: float
     short_units: float
@@ -43,6 +72,48 @@ class Position(ABC):  # Could be a Pydantic model
     # Add more fields like average_entry_price, margin_used etc.
 
 
+class RecordPool:
+    """
+    Bounded free list of order/position records for the acquire()/release()
+    pattern: polling loops that release records after use recycle them
+    instead of allocating new ones. Records beyond `maxsize` drop the oldest
+    pooled one. Releasing a record that is already pooled raises, since two
+    later acquires would otherwise share one mutable record.
+    """
+
+    __slots__ = ("_free", "_pooled_ids", "_lock")
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._free: deque = deque(maxlen=maxsize)
+        # id() of every pooled record; stable, as the deque keeps them alive
+        self._pooled_ids: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def get(self) -> Optional[Any]:
+        """Returns a released record, or None when the pool is empty."""
+        with self._lock:
+            if not self._free:
+                return None
+            record = self._free.pop()
+            self._pooled_ids.discard(id(record))
+            return record
+
+    def put(self, record: Any) -> None:
+        """Pools `record`; raises ValueError if it was already released."""
+        with self._lock:
+            if id(record) in self._pooled_ids:
+                raise ValueError(f"{type(record).__name__} released twice")
+            if len(self._free) == self._free.maxlen:
+                if not self._free:  # maxsize 0: pooling disabled
+                    return
+                self._pooled_ids.discard(id(self._free.popleft()))
+            self._free.append(record)
+            self._pooled_ids.add(id(record))
+
+
 class AbstractBrokerClient(ABC):
     """
     Abstract base class for broker clients.
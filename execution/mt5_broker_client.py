@@ -23,31 +23,37 @@ logger = get_logger(__name__)
 
 
 class MT5TradeOrder(TradeOrder):  # Placeholder
+    __slots__ = ()
+
     # mt5_order_info could be a TradeOrder or OrderSendResult
     def __init__(self, mt5_order_info: Any):
-        self.order_id = str(mt5_order_info.ticket if hasattr(
-            mt5_order_info, 'ticket') else mt5_order_info.order)
-        # Further mapping needed based on mt5_order_info structure
-        self.instrument = getattr(mt5_order_info, 'symbol', 'UNKNOWN')
-        self.units = getattr(mt5_order_info, 'volume', 0.0)
-        # ... map other fields
-        self.status = OrderStatus.PENDING  # Default, needs proper mapping
-        self.order_type = OrderType.MARKET  # Default
+        super().__init__(
+            order_id=str(mt5_order_info.ticket if hasattr(
+                mt5_order_info, 'ticket') else mt5_order_info.order),
+            # Further mapping needed based on mt5_order_info structure
+            instrument=getattr(mt5_order_info, 'symbol', 'UNKNOWN'),
+            units=getattr(mt5_order_info, 'volume', 0.0),
+            # ... map other fields
+            order_type=OrderType.MARKET,  # Default
+            status=OrderStatus.PENDING,  # Default, needs proper mapping
+        )
 
 
 class MT5Position(Position):  # Placeholder
+    __slots__ = ()
+
     def __init__(self, mt5_pos_info: mt5.PositionInfo):
-        self.instrument = mt5_pos_info.symbol
+        long_units = short_units = 0.0
         if mt5_pos_info.type == mt5.ORDER_TYPE_BUY:
-            self.long_units = mt5_pos_info.volume
-            self.short_units = 0.0
+            long_units = mt5_pos_info.volume
         elif mt5_pos_info.type == mt5.ORDER_TYPE_SELL:
-            self.short_units = mt5_pos_info.volume
-            self.long_units = 0.0
-        else:
-            self.long_units = 0.0
-            self.short_units = 0.0
-        self.unrealized_pnl = mt5_pos_info.profit
+            short_units = mt5_pos_info.volume
+        super().__init__(
+            instrument=mt5_pos_info.symbol,
+            long_units=long_units,
+            short_units=short_units,
+            unrealized_pnl=mt5_pos_info.profit,
+        )
         # ... map other fields
 
 
@@ -1,78 +1,200 @@
+import asyncio
+import functools
+import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar, Union
 
+import httpx
+import orjson
 import pandas as pd
-from oandapyV20 import API, V20Error
+from oandapyV20 import V20Error
 from oandapyV20.contrib.requests import MarketOrderRequest, StopLossOrderRequest, TakeProfitOrderRequest, TrailingStopLossOrderRequest
 from oandapyV20.endpoints import accounts, orders, positions, trades
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from oandapyV20.endpoints.apirequest import APIRequest
+from oandapyV20.oandapyV20 import TRADING_ENVIRONMENTS
 
 from config import settings
+from data_ingest.oanda_client import OandaClient as IngestOandaClient
 from execution.abstract_broker_client import (
     AbstractBrokerClient,
     OrderType,
     Position,
+    RecordPool,
     TradeOrder,
     OrderStatus
 )
+from utils.http_client import KEEPALIVE_LIMITS, get_async_http_client, retry_backoff
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Map OANDA order states to internal OrderStatus
-OANDA_ORDER_STATE_MAP = {
+# Map OANDA order states to internal OrderStatus. Keys are interned; values are
+# the OrderStatus constants themselves, so a parsed status can be compared
+# with `is` against OrderStatus.* as well as with ==.
+OANDA_ORDER_STATE_MAP = {sys.intern(state): status for state, status in {
     "PENDING": OrderStatus.PENDING,
     "FILLED": OrderStatus.FILLED,
     "TRIGGERED": OrderStatus.FILLED,  # For SL/TP orders that become market orders
     "CANCELLED": OrderStatus.CANCELLED,
     "REJECTED": OrderStatus.REJECTED,
     "EXPIRED": OrderStatus.EXPIRED,
+}.items()}
+
+# Response keys holding the transaction to parse, in priority order; the
+# index into this tuple is the transaction kind used by OandaTradeOrder.
+_OANDA_TRANSACTION_KEYS = ("orderFillTransaction", "orderCancelTransaction", "orderCreateTransaction")
+_TXN_CANCEL = _OANDA_TRANSACTION_KEYS.index("orderCancelTransaction")
+# A response with none of those keys is a bare order object
+_TXN_NONE = len(_OANDA_TRANSACTION_KEYS)
+# Per kind: the field looked up in OANDA_ORDER_STATE_MAP and the status used
+# when it is missing or unmapped (fill, cancel, create, bare order).
+_TXN_STATUS = (
+    ("type", OrderStatus.FILLED),
+    ("type", OrderStatus.CANCELLED),
+    ("state", OrderStatus.PENDING),
+    ("state", OrderStatus.PENDING),
+)
+
+# OrderType is a plain str subclass (not an Enum), so names are resolved here
+_ORDER_TYPE_BY_NAME = {
+    "MARKET": OrderType.MARKET,
+    "LIMIT": OrderType.LIMIT,
+    "STOP": OrderType.STOP,
 }
 
 
+# Order type accepted by place_order -> (internal OrderType, default timeInForce,
+# whether a price is required). FillOrKill for Market, GoodTilCancelled for Limit/Stop.
+_ORDER_TYPE_TABLE = {
+    "MARKET": (OrderType.MARKET, "FOK", False),
+    "LIMIT": (OrderType.LIMIT, "GTC", True),
+    "STOP": (OrderType.STOP, "GTC", True),
+}
+
+
+def _is_no_position_error(error: V20Error) -> bool:
+    """True for OANDA's rejection of a close on a side that holds no units."""
+    return error.code == 400 and "POSITION_CLOSEOUT_FAILED" in str(error) and "UNITS_REDUCE_ONLY" in str(error)
+
+
+# Retry policy for broker calls: 3 attempts, backing off as in utils.http_client
+_RETRY_ATTEMPTS = 3
+
+_T = TypeVar("_T")
+
+
+def _retry_on_v20_error(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+    """
+    Retries the decorated coroutine on V20Error with exponential backoff and
+    re-raises the last error. The policy is fixed at import time, so a call
+    that succeeds first time costs one extra await; unlike a shared tenacity
+    controller, there is no per-call state that concurrent calls could clobber.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> _T:
+        for attempt in range(1, _RETRY_ATTEMPTS):
+            try:
+                return await func(*args, **kwargs)
+            except V20Error:
+                await asyncio.sleep(retry_backoff(attempt))
+        # Final attempt: its error propagates to the caller
+        return await func(*args, **kwargs)
+    return wrapper
+
 class OandaTradeOrder(TradeOrder):
+    __slots__ = ()
+    _pool: ClassVar[RecordPool] = RecordPool()
+
     def __init__(self, oanda_response_data: Dict[str, Any], order_type_override: Optional[OrderType] = None):
-        # This is a simplified mapping. A full implementation would parse more fields.
-        # 'orderFillTransaction' or 'orderCancelTransaction' or 'orderCreateTransaction'
-        transaction_key = None
-        if 'orderFillTransaction' in oanda_response_data:
-            transaction_key = 'orderFillTransaction'
-            data = oanda_response_data[transaction_key]
-            self.status = OANDA_ORDER_STATE_MAP.get(
-                data.get('type'), OrderStatus.FILLED)  # Assuming fill means filled
-        elif 'orderCancelTransaction' in oanda_response_data:
-            transaction_key = 'orderCancelTransaction'
-            data = oanda_response_data[transaction_key]
-            self.status = OrderStatus.CANCELLED
-        elif 'orderCreateTransaction' in oanda_response_data:  # For pending orders
-            transaction_key = 'orderCreateTransaction'
-            data = oanda_response_data[transaction_key]
-            self.status = OANDA_ORDER_STATE_MAP.get(
-                data.get('state', 'PENDING'), OrderStatus.PENDING)
-        elif 'lastTransactionID' in oanda_response_data:  # For order details from /orders endpoint
-            data = oanda_response_data
-            self.status = OANDA_ORDER_STATE_MAP.get(
-                data.get('state'), OrderStatus.PENDING)
-        # Fallback if no specific transaction type found (e.g. direct order object)
+        self._reset(oanda_response_data, order_type_override)
+
+    @classmethod
+    def acquire(cls, oanda_response_data: Dict[str, Any], order_type_override: Optional[OrderType] = None) -> "OandaTradeOrder":
+        """Like the constructor, but reuses a released instance when one is pooled."""
+        order = cls._pool.get()
+        if order is None:
+            order = cls.__new__(cls)
+        order._reset(oanda_response_data, order_type_override)
+        return order
+
+    @classmethod
+    def from_cancel(cls, oanda_response_data: Dict[str, Any]) -> "OandaTradeOrder":
+        """acquire() for an OrderCancel response, skipping the transaction-key search."""
+        data = oanda_response_data.get("orderCancelTransaction")
+        if data is None:
+            return cls.acquire(oanda_response_data)
+        return cls._acquire_kind(_TXN_CANCEL, data, None)
+
+    @classmethod
+    def from_order_object(cls, order_data: Dict[str, Any]) -> "OandaTradeOrder":
+        """acquire() for a bare order object (e.g. OrderDetails' "order")."""
+        return cls._acquire_kind(_TXN_NONE, order_data, None)
+
+    @classmethod
+    def _acquire_kind(cls, kind: int, data: Dict[str, Any], order_type_override: Optional[OrderType]) -> "OandaTradeOrder":
+        order = cls._pool.get()
+        if order is None:
+            order = cls.__new__(cls)
+        order._assign(kind, data, order_type_override)
+        return order
+
+    def release(self) -> None:
+        """Returns this order to the pool; it must not be used afterwards."""
+        self.stop_loss_on_fill = self.take_profit_on_fill = None
+        self._pool.put(self)
+
+    def _reset(self, oanda_response_data: Dict[str, Any], order_type_override: Optional[OrderType]) -> None:
+        # One .get per known transaction key; the first present one selects the kind.
+        for kind, transaction_key in enumerate(_OANDA_TRANSACTION_KEYS):
+            data = oanda_response_data.get(transaction_key)
+            if data is not None:
+                break
         else:
-            data = oanda_response_data
-            self.status = OANDA_ORDER_STATE_MAP.get(
-                data.get('state'), OrderStatus.PENDING)
+            # Order details from the /orders endpoint or a direct order object
+            kind, data = _TXN_NONE, oanda_response_data
+        self._assign(kind, data, order_type_override)
+
+    def _assign(self, kind: int, data: Dict[str, Any], order_type_override: Optional[OrderType]) -> None:
+        # This is a simplified mapping. A full implementation would parse more fields.
+        status_field, default_status = _TXN_STATUS[kind]
+        status = OANDA_ORDER_STATE_MAP.get(data.get(status_field), default_status)
 
+        price = data.get('price')
+        # Every slot is assigned, so a recycled instance carries nothing over
         self.order_id = str(data.get('id'))
         self.client_order_id = data.get('clientOrderID')
         self.instrument = data.get('instrument')
         self.units = float(data.get('units', 0.0))
-        self.order_type = order_type_override or OrderType[data.get(
-            'type', 'MARKET').upper()]
-        self.price = float(data.get('price')) if data.get('price') else None
+        self.order_type = order_type_override or _ORDER_TYPE_BY_NAME.get(
+            data.get('type', 'MARKET').upper(), OrderType.MARKET)
+        self.price = float(price) if price else None
         # SL/TP details would be in 'stopLossOnFill' / 'takeProfitOnFill' sub-dicts
         self.stop_loss_on_fill = data.get('stopLossOnFill')
         self.take_profit_on_fill = data.get('takeProfitOnFill')
+        self.status = status
 
 
 class OandaPosition(Position):
+    __slots__ = ()
+    _pool: ClassVar[RecordPool] = RecordPool()
+
     def __init__(self, oanda_position_data: Dict[str, Any]):
+        self._reset(oanda_position_data)
+
+    @classmethod
+    def acquire(cls, oanda_position_data: Dict[str, Any]) -> "OandaPosition":
+        """Like the constructor, but reuses a released instance when one is pooled."""
+        position = cls._pool.get()
+        if position is None:
+            position = cls.__new__(cls)
+        position._reset(oanda_position_data)
+        return position
+
+    def release(self) -> None:
+        """Returns this position to the pool; it must not be used afterwards."""
+        self._pool.put(self)
+
+    def _reset(self, oanda_position_data: Dict[str, Any]) -> None:
         self.instrument = oanda_position_data['instrument']
         self.long_units = float(oanda_position_data['long']['units'])
         self.short_units = float(oanda_position_data['short']['units'])
@@ -84,21 +206,64 @@ class OandaPosition(Position):
 class OandaBrokerClient(AbstractBrokerClient):
     def __init__(
         self,
-        access_token: str = settings.OANDA_ACCESS_TOKEN,
-        account_id: str = settings.OANDA_ACCOUNT_ID,
-        environment: str = settings.OANDA_ENVIRONMENT,
+        access_token: Optional[str] = None,  # Defaults to settings.OANDA_ACCESS_TOKEN
+        account_id: Optional[str] = None,  # Defaults to settings.OANDA_ACCOUNT_ID
+        environment: Optional[str] = None,  # Defaults to settings.OANDA_ENVIRONMENT
     ):
-        self.access_token = access_token
-        self.account_id = account_id
-        self.environment = environment
-        self.api = API(access_token=self.access_token,
-                       environment=self.environment)
+        self.access_token = access_token if access_token is not None else settings.OANDA_ACCESS_TOKEN
+        self.account_id = account_id if account_id is not None else settings.OANDA_ACCOUNT_ID
+        self.environment = environment if environment is not None else settings.OANDA_ENVIRONMENT
+        self.base_url = TRADING_ENVIRONMENTS[self.environment]["api"]
+        self.headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        # Body-less endpoints depend only on the account, so one request object
+        # each is built here and reused; _request's return value is used rather
+        # than the shared .response, which concurrent calls overwrite.
+        self._account_summary_req = accounts.AccountSummary(accountID=self.account_id)
+        self._open_positions_req = positions.OpenPositions(accountID=self.account_id)
+        # (long_units, short_units) per instrument as of the last get_open_positions;
+        # an entry is dropped once this client places an order or closes on it
+        self._position_sides: Dict[str, Tuple[float, float]] = {}
+        # Candle client for get_historical_data, kept so its connection pool is reused
+        self._ingest_client: Optional[IngestOandaClient] = None
         logger.info(
             f"OANDA Broker Client initialized for account {self.account_id} in {self.environment} environment.")
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Returns the instance's pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = await get_async_http_client(base_url=self.base_url, headers=self.headers, limits=KEEPALIVE_LIMITS)
+        return self._client
+
+    async def _request(self, r: APIRequest) -> Dict[str, Any]:
+        """
+        Async equivalent of oandapyV20's API.request: sends the endpoint object's
+        method, path and body over the pooled client, stores the decoded body on
+        r.response and raises V20Error for HTTP status codes >= 400.
+        """
+        client = await self._get_client()
+        method = r.method.upper()
+        if method == "GET":
+            request_args = {"params": getattr(r, "params", None)}
+        else:
+            data = getattr(r, "data", None)
+            request_args = {"content": orjson.dumps(data)} if data else {}
+        response = await client.request(method, f"/{r}", **request_args)
+        if response.status_code >= 400:
+            # OANDA error bodies are JSON, but a proxy or gateway error may not be
+            try:
+                r.response = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                r.response = {}
+            raise V20Error(response.status_code, response.text)
+        r.response = orjson.loads(response.content) if response.content else {}
+        return r.response
+
     async def connect(self) -> None:
-        # oandapyV20 doesn't maintain a persistent connection in the same way a websocket client might.
-        # API calls are stateless. We can check connectivity with an account summary call.
+        # API calls are stateless over a pooled HTTP client; check connectivity with an account summary call.
         logger.info(
             "Attempting to connect to OANDA (checking account summary)...")
         await self.get_account_summary()  # This will raise if auth fails
@@ -106,23 +271,26 @@ class OandaBrokerClient(AbstractBrokerClient):
             "Successfully connected to OANDA (verified via account summary).")
 
     async def disconnect(self) -> None:
-        logger.info(
-            "OANDA client disconnected (stateless, no specific action).")
-        pass  # Stateless
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._ingest_client is not None:
+            await self._ingest_client.aclose()
+            self._ingest_client = None
+        logger.info("OANDA client disconnected (HTTP connection pool closed).")
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def get_account_summary(self) -> Dict[str, Any]:
-        r = accounts.AccountSummary(accountID=self.account_id)
         try:
-            self.api.request(r)
-            logger.debug(f"OANDA Account Summary Response: {r.response}")
-            return r.response.get("account", {})
+            response = await self._request(self._account_summary_req)
+            logger.debug(f"OANDA Account Summary Response: {response}")
+            return response.get("account", {})
         except V20Error as e:
-            logger.error(
-                f"OANDA API error getting account summary: {e} - {r.response}")
+            # The error message carries the response body
+            logger.error(f"OANDA API error getting account summary: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def place_order(self, order_details: Dict[str, Any]) -> OandaTradeOrder:
         """
         Places an order.
@@ -136,67 +304,72 @@ class OandaBrokerClient(AbstractBrokerClient):
             "takeProfitOnFill": {"price": "1.12800"}
         }
         """
-        oanda_order_request = {
-            "order": {
-                "instrument": order_details["instrument"],
-                "units": str(order_details["units"]),
-                "type": order_details.get("type", "MARKET").upper(),
-                # FillOrKill for Market, GoodTilCancelled for Limit/Stop
-                "timeInForce": order_details.get("timeInForce", "FOK" if order_details.get("type", "MARKET").upper() == "MARKET" else "GTC"),
-                "positionFill": order_details.get("positionFill", "DEFAULT")
-            }
+        oanda_type = order_details.get("type", "MARKET").upper()
+        try:
+            order_type, default_tif, needs_price = _ORDER_TYPE_TABLE[oanda_type]
+        except KeyError:
+            raise ValueError(f"Unsupported order type: {oanda_type}") from None
+        order = {
+            "instrument": order_details["instrument"],
+            "units": str(order_details["units"]),
+            "type": oanda_type,
+            "timeInForce": order_details.get("timeInForce", default_tif),
+            "positionFill": order_details.get("positionFill", "DEFAULT")
         }
-        if order_details.get("type", "MARKET").upper() in ["LIMIT", "STOP"]:
+        oanda_order_request = {"order": order}
+        if needs_price:
             if "price" not in order_details:
                 raise ValueError("Price is required for LIMIT/STOP orders.")
-            oanda_order_request["order"]["price"] = str(order_details["price"])
+            order["price"] = str(order_details["price"])
 
         if "stopLossOnFill" in order_details:
-            oanda_order_request["order"]["stopLossOnFill"] = {
+            order["stopLossOnFill"] = {
                 "price": str(order_details["stopLossOnFill"]["price"])}
         if "takeProfitOnFill" in order_details:
-            oanda_order_request["order"]["takeProfitOnFill"] = {
+            order["takeProfitOnFill"] = {
                 "price": str(order_details["takeProfitOnFill"]["price"])}
         if "clientOrderID" in order_details:
-            oanda_order_request["order"]["clientExtensions"] = {
+            order["clientExtensions"] = {
                 "id": str(order_details["clientOrderID"])}
 
+        self._position_sides.pop(order_details["instrument"], None)
         r = orders.OrderCreate(accountID=self.account_id,
                                data=oanda_order_request)
         try:
-            self.api.request(r)
+            await self._request(r)
             logger.info(
                 f"OANDA OrderCreate Response for {order_details['instrument']}: {r.response}")
             # The response contains info about the transaction that created/filled the order
-            return OandaTradeOrder(r.response, order_type_override=OrderType[order_details.get("type", "MARKET").upper()])
+            return OandaTradeOrder.acquire(r.response, order_type_override=order_type)
         except V20Error as e:
             logger.error(
                 f"OANDA API error placing order for {order_details['instrument']}: {e} - {r.response}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def get_open_positions(self) -> List[OandaPosition]:
-        r = positions.OpenPositions(accountID=self.account_id)
         try:
-            self.api.request(r)
-            return [OandaPosition(pos_data) for pos_data in r.response.get("positions", [])]
+            response = await self._request(self._open_positions_req)
+            open_positions = [OandaPosition.acquire(pos_data) for pos_data in response.get("positions", [])]
+            self._position_sides = {
+                pos.instrument: (pos.long_units, pos.short_units) for pos in open_positions}
+            return open_positions
         except V20Error as e:
-            logger.error(
-                f"OANDA API error getting open positions: {e} - {r.response}")
+            logger.error(f"OANDA API error getting open positions: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def get_order_status(self, order_id: str) -> OandaTradeOrder:
         r = orders.OrderDetails(accountID=self.account_id, orderID=order_id)
         try:
-            self.api.request(r)
-            return OandaTradeOrder(r.response.get("order", {}))
+            await self._request(r)
+            return OandaTradeOrder.from_order_object(r.response.get("order", {}))
         except V20Error as e:
             logger.error(
                 f"OANDA API error getting order status for {order_id}: {e} - {r.response}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def modify_order_sltp(self, order_id: str, sl_price: Optional[float], tp_price: Optional[float]) -> OandaTradeOrder:
         # Modifying SL/TP for an open TRADE (not pending order) is done via TradeCRCDO (trades.TradeCRCDO)
         # Modifying SL/TP for a PENDING order is done via orders.OrderReplace
@@ -223,7 +396,7 @@ class OandaBrokerClient(AbstractBrokerClient):
         # if tp_price: crcdo_data["takeProfit"] = {"price": str(tp_price), "timeInForce": "GTC"}
         # r = trades.TradeCRCDO(accountID=self.account_id, tradeID=trade_id, data=crcdo_data)
         # try:
-        #     self.api.request(r)
+        #     await self._request(r)
         #     # The response here is complex, might be orderFillTransaction for SL/TP if hit immediately,
         #     # or a transaction showing the SL/TP orders being created/modified.
         #     return OandaTradeOrder(r.response.get("orderCreateTransaction") or r.response.get("orderFillTransaction") or {})
@@ -233,13 +406,13 @@ class OandaBrokerClient(AbstractBrokerClient):
         raise NotImplementedError(
             "OANDA modify_order_sltp needs robust handling for trades vs orders.")
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def cancel_order(self, order_id: str) -> OandaTradeOrder:
         r = orders.OrderCancel(accountID=self.account_id, orderID=order_id)
         try:
-            self.api.request(r)
+            await self._request(r)
             # Response contains 'orderCancelTransaction'
-            return OandaTradeOrder(r.response)
+            return OandaTradeOrder.from_cancel(r.response)
         except V20Error as e:
             logger.error(
                 f"OANDA API error cancelling order {order_id}: {e} - {r.response}")
@@ -253,13 +426,13 @@ class OandaBrokerClient(AbstractBrokerClient):
                 return OandaTradeOrder({"id": order_id, "state": "CANCELLED", "instrument": "UNKNOWN"}, order_type_override=OrderType.MARKET)
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(V20Error))
+    @_retry_on_v20_error
     async def close_position(self, instrument: str, units: Optional[str] = "ALL") -> OandaTradeOrder:
         # units: "ALL" or specific amount like "-100" to close 100 long units.
         # Closing a long position means selling. Closing a short position means buying.
         # OANDA requires specifying which side to close (long or short).
         # For simplicity, this example closes all units of the specified instrument.
-        # A more robust version would check if it's a long or short position first.
+        # A side known to be empty from the last get_open_positions is skipped.
 
         # Close all long units
         long_units_data = {"longUnits": "ALL"} if units == "ALL" else {
@@ -268,46 +441,39 @@ class OandaBrokerClient(AbstractBrokerClient):
         short_units_data = {"shortUnits": "ALL"} if units == "ALL" else {
             "shortUnits": str(abs(float(units)))}
 
-        # Attempt to close long side first, then short side if units="ALL"
-        # This is a simplification. Ideally, you know if you are long or short.
-        closed_order_response = None
-        try:
-            r_long = positions.PositionClose(
-                accountID=self.account_id, instrument=instrument, data=long_units_data)
-            self.api.request(r_long)
-            logger.info(
-                f"OANDA PositionClose (long) Response for {instrument}: {r_long.response}")
-            # Response contains 'longOrderFillTransaction' or 'longOrderCreateTransaction'
-            closed_order_response = r_long.response.get("longOrderFillTransaction") or \
-                r_long.response.get("longOrderCreateTransaction") or \
-                r_long.response  # Fallback
-        except V20Error as e_long:
-            # If no long position, OANDA might error. That's okay if we intend to close short next.
-            logger.warning(
-                f"Error or no action closing long side for {instrument}: {e_long} - {r_long.response if 'r_long' in locals() else 'N/A'}")
-            # Not a "no position" error
-            if not (e_long.code == 400 and "POSITION_CLOSEOUT_FAILED" in str(e_long) and "UNITS_REDUCE_ONLY" in str(e_long)):
-                pass  # Could raise if it's not a "no position" error and units != "ALL"
-
         # If closing all or closing a short by buying
-        if units == "ALL" or (units is not None and float(units) > 0):
-            try:
-                r_short = positions.PositionClose(
-                    accountID=self.account_id, instrument=instrument, data=short_units_data)
-                self.api.request(r_short)
-                logger.info(
-                    f"OANDA PositionClose (short) Response for {instrument}: {r_short.response}")
-                # Use this response if it's more relevant (e.g., we were short)
-                closed_order_response = r_short.response.get("shortOrderFillTransaction") or \
-                    r_short.response.get("shortOrderCreateTransaction") or \
-                    r_short.response  # Fallback
-            except V20Error as e_short:
+        close_long, close_short = True, units == "ALL" or (units is not None and float(units) > 0)
+        sides = self._position_sides.pop(instrument, None)
+        if sides is not None and any(sides):
+            # The last get_open_positions saw a position here: skip the side it
+            # doesn't hold. Otherwise both sides are tried, as the cache may be stale.
+            close_long = sides[0] != 0
+            close_short = close_short and sides[1] != 0
+        units_data = {"long": long_units_data, "short": short_units_data}
+        sides_to_close = [side for side, wanted in (("long", close_long), ("short", close_short)) if wanted]
+        # The sides are independent requests, so they are sent concurrently
+        results = await asyncio.gather(
+            *(self._close_side(instrument, side, units_data[side]) for side in sides_to_close),
+            return_exceptions=True)
+        short_result = results[-1] if sides_to_close[-1:] == ["short"] else None
+
+        closed_order_response = None
+        for side, result in zip(sides_to_close, results):
+            if isinstance(result, V20Error):
+                # If no position on that side, OANDA errors. That's okay if the other side closes.
                 logger.warning(
-                    f"Error or no action closing short side for {instrument}: {e_short} - {r_short.response if 'r_short' in locals() else 'N/A'}")
-                if closed_order_response is None:  # If long close also failed or didn't happen
-                    if not (e_short.code == 400 and "POSITION_CLOSEOUT_FAILED" in str(e_short) and "UNITS_REDUCE_ONLY" in str(e_short)):
-                        raise V20Error(
-                            msg=f"Failed to close both long and short for {instrument}") from e_short
+                    f"Error or no action closing {side} side for {instrument}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is not None:
+                # The short response wins if both sides closed (e.g., we were short)
+                closed_order_response = result
+
+        if isinstance(short_result, V20Error) and closed_order_response is None:
+            # Long close also failed or didn't happen
+            if not _is_no_position_error(short_result):
+                raise V20Error(
+                    short_result.code, f"Failed to close both long and short for {instrument}") from short_result
 
         if closed_order_response is None:
             # This can happen if there was no position to close.
@@ -319,6 +485,18 @@ class OandaBrokerClient(AbstractBrokerClient):
 
         return OandaTradeOrder(closed_order_response, order_type_override=OrderType.MARKET)
 
+    async def _close_side(self, instrument: str, side: str, data: Dict[str, str]) -> Dict[str, Any]:
+        """Closes one side ("long" or "short") of a position and returns its transaction."""
+        r = positions.PositionClose(
+            accountID=self.account_id, instrument=instrument, data=data)
+        response = await self._request(r)
+        logger.info(
+            f"OANDA PositionClose ({side}) Response for {instrument}: {response}")
+        # Response contains '<side>OrderFillTransaction' or '<side>OrderCreateTransaction'
+        return response.get(f"{side}OrderFillTransaction") or \
+            response.get(f"{side}OrderCreateTransaction") or \
+            response  # Fallback
+
     async def get_historical_data(
         self,
         instrument: str,
@@ -327,25 +505,16 @@ class OandaBrokerClient(AbstractBrokerClient):
         from_time: Optional[pd.Timestamp] = None,
         to_time: Optional[pd.Timestamp] = None,
     ) -> pd.DataFrame:
-        # This is a synchronous wrapper for consistency with abstract method.
-        # The main data ingestion should use data_ingest.oanda_client for async calls.
-        from data_ingest.oanda_client import OandaClient as IngestOandaClient
-        ingest_client = IngestOandaClient(
-            self.access_token, self.account_id, self.environment)
-
-        # The ingest client's get_historical_candles is async.
-        # This broker client method is also async, so we can await it.
-        candles_models = await ingest_client.get_historical_candles(
+        # The main data ingestion should use data_ingest.oanda_client for async calls;
+        # this delegates to it for consistency with the abstract method.
+        if self._ingest_client is None:
+            self._ingest_client = IngestOandaClient(
+                self.access_token, self.account_id, self.environment)
+        return await self._ingest_client.get_historical_candles_df(
             instrument=instrument,
             granularity=granularity,
             count=count,
             from_time=from_time.to_pydatetime() if from_time else None,
             to_time=to_time.to_pydatetime() if to_time else None,
+            time_index=True,
         )
-        # Use .model_dump() for Pydantic v2
-        df = pd.DataFrame([c.model_dump(by_alias=False)
-                          for c in candles_models])
-        if not df.empty:
-            df['time'] = pd.to_datetime(df['time'])
-            df = df.set_index('time')
-        return df
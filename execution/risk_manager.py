@@ -1,42 +1,126 @@
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import talib
 
 from config import settings
 from config.trading_params import TradingParameters
-from models.signals import Signal, SignalActionType
+from execution._atr_njit import wilder_atr, wilder_atr_last
+from execution._signal_eval_njit import evaluate_signal
+from models.signals import SIGNAL_ACTION_CODES, Signal, SignalActionType
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_ATR_CACHE_MAXSIZE = 512
+
+# key -> (copies of the trailing period + 1 high/low/close values, ATR value)
+_atr_cache: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[np.ndarray, ...], Optional[float]]]" = OrderedDict()
+_atr_cache_stats = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=None)
+def _pip_size(pair: str) -> float:
+    """
+    Pip size for a pair: 0.01 for JPY-quoted pairs, otherwise 0.0001
+    (simplified, assumes USD quote or cross). Memoized, since the set of
+    traded pairs is small and fixed.
+    """
+    return 0.01 if "JPY" in pair.upper() else 0.0001
+
+
+class AtrCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def atr_cache_info() -> AtrCacheInfo:
+    """Hit/miss statistics of the ATR cache, in the shape of lru_cache's cache_info()."""
+    return AtrCacheInfo(_atr_cache_stats["hits"], _atr_cache_stats["misses"],
+                        _ATR_CACHE_MAXSIZE, len(_atr_cache))
+
+
+def clear_atr_cache() -> None:
+    """Drops all memoized ATR values and resets the statistics."""
+    _atr_cache.clear()
+    _atr_cache_stats["hits"] = _atr_cache_stats["misses"] = 0
+
 
 class RiskManager:
+    __slots__ = ("params", "account_balance")
+
     def __init__(
         self,
-        trading_params: TradingParameters = settings.TRADING,
+        trading_params: Optional[TradingParameters] = None,  # Defaults to settings.TRADING
         account_balance: float = 100000.0,  # Initial or current balance
         # current_positions: List[Dict[str, Any]] # List of open positions with details
     ):
-        self.params = trading_params
+        self.params = trading_params if trading_params is not None else settings.TRADING
         self.account_balance = account_balance
         # self.current_positions = current_positions # For portfolio-level checks
 
-    def _calculate_atr(self, historical_df: pd.DataFrame, period: int) -> Optional[float]:
-        """Calculates the Average True Range (ATR)."""
-        if len(historical_df) < period + 1:  # Need enough data for ATR
+    def _calculate_atr(self, historical_df: pd.DataFrame, period: int, pair: Optional[str] = None) -> Optional[float]:
+        """Calculates the Average True Range (ATR) of a high/low/close DataFrame."""
+        try:
+            arrays = (historical_df['high'].to_numpy(copy=False),
+                      historical_df['low'].to_numpy(copy=False),
+                      historical_df['close'].to_numpy(copy=False))
+            last_time = historical_df.index[-1] if len(historical_df) else None
+        except Exception as e:
+            logger.error(f"Error calculating ATR: {e}")
+            return None
+        return self._atr_from_arrays(*arrays, period, pair, last_time)
+
+    def _atr_from_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        period: int,
+        pair: Optional[str] = None,
+        last_time: Any = None,
+    ) -> Optional[float]:
+        """
+        Calculates the Average True Range (ATR) from price arrays, so callers
+        that already hold NumPy buffers (e.g. a live tick feed) skip building
+        a DataFrame.
+
+        Results are memoized per (pair, period, price buffers, last bar): the
+        key holds the arrays' data pointers plus the last bar's `last_time`
+        and high/low/close, and the entry keeps copies of only the trailing
+        period + 1 bars, which are compared on lookup. Caching never pins the
+        caller's arrays, and rewriting recent bars in place forces a
+        recomputation.
+        """
+        if len(close) < period + 1:  # Need enough data for ATR
             logger.warning(
-                f"Not enough data ({len(historical_df)}) to calculate ATR with period {period}.")
+                f"Not enough data ({len(close)}) to calculate ATR with period {period}.")
             return None
         try:
-            atr = talib.ATR(
-                historical_df['high'].values,
-                historical_df['low'].values,
-                historical_df['close'].values,
-                timeperiod=period
-            )
-            return atr[-1] if atr is not None and len(atr) > 0 and not np.isnan(atr[-1]) else None
+            arrays = (np.asarray(high), np.asarray(low), np.asarray(close))
+            tails = tuple(arr[-(period + 1):] for arr in arrays)
+            key = (pair, period, len(close), last_time) + tuple(
+                tail[-1].item() for tail in tails) + tuple(
+                (arr.__array_interface__['data'][0], arr.strides, arr.dtype.str) for arr in arrays)
+            hit = _atr_cache.get(key)
+            if hit is not None and all(map(np.array_equal, hit[0], tails)):
+                _atr_cache.move_to_end(key)
+                _atr_cache_stats["hits"] += 1
+                return hit[1]
+
+            _atr_cache_stats["misses"] += 1
+            # Only the last value is needed, so no full-length ATR array is built
+            atr = wilder_atr_last(*arrays, period)
+            result = None if np.isnan(atr) else float(atr)
+            _atr_cache[key] = (tuple(tail.copy() for tail in tails), result)
+            _atr_cache.move_to_end(key)
+            if len(_atr_cache) > _ATR_CACHE_MAXSIZE:
+                _atr_cache.popitem(last=False)
+            return result
         except Exception as e:
             logger.error(f"Error calculating ATR: {e}")
             return None
@@ -71,10 +155,10 @@ class RiskManager:
                 "Risk per unit is zero. Cannot calculate position size.")
             return None
 
-        # Determine pip size for the pair (simplified, assumes USD quote or cross)
+        # Determine pip size for the pair
         # For XXX/YYY, pip_size is 0.0001, for XXX/JPY it's 0.01
         # This needs to be accurate for the specific pair.
-        pip_size = 0.0001 if "JPY" not in pair.upper() else 0.01
+        pip_size = _pip_size(pair)
 
         # This is a simplification. Real pip value depends on quote currency and current rate.
         # For a pair like EUR/USD, if account is USD, pip value for 1 lot is $10.
@@ -118,6 +202,33 @@ class RiskManager:
             f"Calculated position size for {pair}: {position_size_lots:.4f} lots")
         return round(position_size_lots, 4)  # Round to typical lot precision
 
+    def calculate_position_size_batch(
+        self,
+        pairs: Sequence[str],
+        entry_prices: np.ndarray,
+        stop_loss_prices: np.ndarray,
+        pip_value_per_lot: Union[float, np.ndarray] = 10.0,
+        pip_sizes: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size over a batch of signals: one NumPy
+        pass instead of a Python call per signal. Returns lots as a float64
+        array, NaN where the scalar version would return None (zero risk or
+        a non-positive size). `pip_sizes` can be passed in when the same
+        pairs are sized repeatedly (e.g. per bar in a backtest).
+        """
+        entry = np.asarray(entry_prices, dtype=np.float64)
+        stop_loss = np.asarray(stop_loss_prices, dtype=np.float64)
+        if pip_sizes is None:
+            pip_sizes = np.fromiter((_pip_size(pair) for pair in pairs), dtype=np.float64, count=len(pairs))
+        risk_per_trade_abs = self.account_balance * \
+            self.params.ACCOUNT_RISK_PER_TRADE_PCT
+
+        risk_in_pips = np.abs(entry - stop_loss) / pip_sizes
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lots = risk_per_trade_abs / (risk_in_pips * pip_value_per_lot)
+        return np.where((lots > 0) & np.isfinite(lots), np.round(lots, 4), np.nan)
+
     def calculate_sl_tp(
         self,
         signal: Signal,
@@ -130,88 +241,158 @@ class RiskManager:
                 "Entry price not available in signal for SL/TP calculation.")
             return None, None
 
-        atr = self._calculate_atr(
-            historical_df, self.params.ATR_PERIOD_FOR_SLTP)
-
-        # Determine pip size for the pair
-        pip_size = 0.0001 if "JPY" not in signal.pair.upper() else 0.01
+        # +1 places SL below and TP above entry (BUY), -1 the reverse (SELL)
+        sign = signal.action_code
+        if not sign:  # No SL/TP for HOLD/CLOSE_* signals
+            return None, None
 
-        sl, tp = None, None
+        params = self.params
+        atr = self._calculate_atr(
+            historical_df, params.ATR_PERIOD_FOR_SIZING, signal.pair)
 
         if atr is not None and atr > 0:
-            atr_sl_distance = atr * self.params.ATR_MULTIPLIER_FOR_SL
-            atr_tp_distance = atr * self.params.ATR_MULTIPLIER_FOR_TP
-
-            if signal.action == SignalActionType.BUY:
-                sl = entry - atr_sl_distance
-                tp = entry + atr_tp_distance
-            elif signal.action == SignalActionType.SELL:
-                sl = entry + atr_sl_distance
-                tp = entry - atr_tp_distance
+            sl_distance = atr * params.ATR_MULTIPLIER_FOR_SL
+            tp_distance = atr * params.ATR_MULTIPLIER_FOR_TP
         else:  # Fallback to fixed pips if ATR is not available
             logger.warning(
                 f"ATR not available for {signal.pair}, using fixed pip SL/TP.")
-            if signal.action == SignalActionType.BUY:
-                sl = entry - (self.params.DEFAULT_SL_PIPS * pip_size)
-                tp = entry + (self.params.DEFAULT_TP_PIPS * pip_size)
-            elif signal.action == SignalActionType.SELL:
-                sl = entry + (self.params.DEFAULT_SL_PIPS * pip_size)
-                tp = entry - (self.params.DEFAULT_TP_PIPS * pip_size)
-
-        # Ensure SL/TP are reasonably placed (e.g., SL not through entry for a new trade)
-        if sl is not None and tp is not None:
-            if signal.action == SignalActionType.BUY and (sl >= entry or tp <= entry):
-                logger.warning(
-                    f"Invalid SL/TP for BUY signal on {signal.pair}: SL={sl}, TP={tp}, Entry={entry}")
-                return None, None  # Or adjust to min distance
-            if signal.action == SignalActionType.SELL and (sl <= entry or tp >= entry):
-                logger.warning(
-                    f"Invalid SL/TP for SELL signal on {signal.pair}: SL={sl}, TP={tp}, Entry={entry}")
-                return None, None  # Or adjust to min distance
+            pip_size = _pip_size(signal.pair)
+            sl_distance = params.DEFAULT_SL_PIPS * pip_size
+            tp_distance = params.DEFAULT_TP_PIPS * pip_size
+        sl = entry - sign * sl_distance
+        tp = entry + sign * tp_distance
+
+        # Ensure SL/TP are reasonably placed (e.g., SL not through entry for a new trade).
+        # NaN compares false, so non-finite levels are rejected explicitly.
+        if (not (np.isfinite(sl) and np.isfinite(tp))
+                or sign * (entry - sl) <= 0 or sign * (tp - entry) <= 0):
+            logger.warning(
+                f"Invalid SL/TP for {signal.action} signal on {signal.pair}: SL={sl}, TP={tp}, Entry={entry}")
+            return None, None  # Or adjust to min distance
 
         return sl, tp
 
+    def calculate_sl_tp_batch(
+        self,
+        df: pd.DataFrame,
+        pair: str,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_sl_tp for one pair over a run of bars. `df` holds
+        the bars (high, low, close) plus each bar's `entry_price` and either
+        an integer `action_code` column (see SIGNAL_ACTION_CODES) or the
+        signal `action`. The ATR series is computed once; row i uses the ATR of
+        bars up to i, as calculate_sl_tp would with the history up to that bar.
+        Returns (sl, tp) float64 arrays, NaN for rows that are not BUY/SELL.
+        """
+        atr = wilder_atr(
+            df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy(),
+            self.params.ATR_PERIOD_FOR_SIZING)
+        entry = df['entry_price'].to_numpy(dtype=np.float64)
+        if 'action_code' in df.columns:
+            action_code = df['action_code'].to_numpy()
+        else:
+            # Matched by .value: NumPy turns a str Enum member into str(member),
+            # which is "SignalActionType.BUY" on newer Pythons
+            action = df['action'].to_numpy()
+            action_code = np.where(action == SignalActionType.BUY.value, 1,
+                                   np.where(action == SignalActionType.SELL.value, -1, 0))
+        # +1 for BUY (SL below entry), -1 for SELL, NaN for anything else
+        direction = np.where(action_code != 0, action_code, np.nan)
+
+        # Fall back to fixed pips where ATR is not available
+        pip_size = _pip_size(pair)
+        use_atr = atr > 0  # False for the NaN warm-up bars too
+        sl_distance = np.where(use_atr, atr * self.params.ATR_MULTIPLIER_FOR_SL,
+                               self.params.DEFAULT_SL_PIPS * pip_size)
+        tp_distance = np.where(use_atr, atr * self.params.ATR_MULTIPLIER_FOR_TP,
+                               self.params.DEFAULT_TP_PIPS * pip_size)
+        return entry - direction * sl_distance, entry + direction * tp_distance
+
+    def evaluate_signal(
+        self,
+        action: SignalActionType,
+        entry_price: float,
+        historical_df: pd.DataFrame,
+        pair: str,
+        pip_value_per_lot: float = 10.0,
+    ) -> Tuple[float, float, float, bool]:
+        """
+        SL/TP, position size and the size check in one compiled call, for
+        backtest loops. Returns (sl, tp, lots, ok). Unlike the individual
+        methods it neither logs nor memoizes; live trading keeps using them.
+        """
+        params = self.params
+        return evaluate_signal(
+            float(SIGNAL_ACTION_CODES.get(action, 0)), float(entry_price),
+            historical_df['high'].to_numpy(), historical_df['low'].to_numpy(),
+            historical_df['close'].to_numpy(),
+            params.ATR_PERIOD_FOR_SIZING, params.ATR_MULTIPLIER_FOR_SL, params.ATR_MULTIPLIER_FOR_TP,
+            params.DEFAULT_SL_PIPS, params.DEFAULT_TP_PIPS, _pip_size(pair),
+            self.account_balance, params.ACCOUNT_RISK_PER_TRADE_PCT, pip_value_per_lot)
+
     def pre_trade_checks(
         self,
         signal: Signal,
         proposed_size_lots: float,
-        # current_portfolio_value: float, # Needed for drawdown check
-        # open_positions: List[Any], # Detailed list of open positions
-    ) -> bool:
-        """Performs pre-trade risk checks."""
-        # 1. Max Drawdown Check (requires tracking portfolio value over time)
-        # if (self.account_balance - current_portfolio_value) / self.account_balance > self.params.MAX_DRAWDOWN_PCT:
-        #     logger.error(f"Max drawdown limit ({self.params.MAX_DRAWDOWN_PCT*100}%) breached. No new trades.")
-        #     return False
-        logger.warning(
-            "Max drawdown check is a placeholder and needs portfolio value tracking.")
-
-        # 2. Max Concurrent Positions (overall and per currency)
-        # num_open_positions = len(open_positions)
-        # if num_open_positions >= self.params.MAX_CONCURRENT_POSITIONS:
-        #     logger.warning(f"Max concurrent positions ({self.params.MAX_CONCURRENT_POSITIONS}) reached. Cannot open new trade for {signal.pair}.")
-        #     return False
-        #
-        # positions_for_pair = [p for p in open_positions if p.instrument == signal.pair]
-        # if len(positions_for_pair) >= self.params.MAX_POSITIONS_PER_CURRENCY:
-        #     logger.warning(f"Max positions for {signal.pair} ({self.params.MAX_POSITIONS_PER_CURRENCY}) reached.")
-        #     return False
-        logger.warning(
-            "Max concurrent positions check is a placeholder and needs open positions data.")
-
-        # 3. Portfolio Correlation Check (Optional, more complex)
-        # if self.params.CORRELATION_THRESHOLD < 1.0:
-        #     # Calculate correlation of the new trade's asset with existing portfolio
-        #     # If high correlation and same direction, might reject or reduce size
-        #     logger.warning("Portfolio correlation check is a placeholder.")
-        #     pass
-
-        # 4. Check if proposed size is valid (e.g., not zero or negative)
+        # One row per open position: pair, notional, direction (+1 long / -1 short), entry_time
+        open_positions_df: Optional[pd.DataFrame] = None,
+        current_portfolio_value: Optional[float] = None,  # Needed for drawdown check
+        # Pair x pair return correlations, e.g. returns_df.corr()
+        correlation_matrix: Optional[pd.DataFrame] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Performs pre-trade risk checks. Returns (passed, reason); reason is
+        empty when every check passes.
+
+        Position checks run as whole-frame pandas/NumPy operations on
+        `open_positions_df` rather than a Python loop over positions. Checks
+        whose input is not provided are skipped.
+        """
+        params = self.params
+
+        # 1. Check if proposed size is valid (e.g., not zero or negative)
         if proposed_size_lots <= 0:
-            logger.error(
-                f"Invalid proposed position size ({proposed_size_lots}) for {signal.pair}.")
-            return False
+            reason = f"Invalid proposed position size ({proposed_size_lots}) for {signal.pair}."
+            logger.error(reason)
+            return False, reason
+
+        # 2. Max Drawdown Check
+        if current_portfolio_value is not None and self.account_balance > 0:
+            drawdown = (self.account_balance - current_portfolio_value) / self.account_balance
+            if drawdown > params.MAX_DRAWDOWN_PCT:
+                reason = f"Max drawdown limit ({params.MAX_DRAWDOWN_PCT * 100}%) breached. No new trades."
+                logger.error(reason)
+                return False, reason
+
+        if open_positions_df is not None and not open_positions_df.empty:
+            # 3. Max Concurrent Positions (overall and per currency)
+            if len(open_positions_df) >= params.MAX_CONCURRENT_POSITIONS:
+                reason = (f"Max concurrent positions ({params.MAX_CONCURRENT_POSITIONS}) reached. "
+                          f"Cannot open new trade for {signal.pair}.")
+                logger.warning(reason)
+                return False, reason
+
+            open_pairs = open_positions_df['pair']
+            if open_pairs.value_counts().get(signal.pair, 0) >= params.MAX_POSITIONS_PER_CURRENCY:
+                reason = f"Max positions for {signal.pair} ({params.MAX_POSITIONS_PER_CURRENCY}) reached."
+                logger.warning(reason)
+                return False, reason
+
+            # 4. Portfolio Correlation Check: reject when another pair already held
+            # moves with the new trade (positive correlation, same direction, or
+            # negative correlation, opposite direction) beyond the threshold
+            if correlation_matrix is not None and signal.pair in correlation_matrix.index:
+                others = (open_pairs != signal.pair).to_numpy()
+                corr = correlation_matrix.loc[signal.pair].reindex(open_pairs[others]).to_numpy()
+                direction = open_positions_df['direction'].to_numpy(dtype=np.float64)[others]
+                co_movement = corr * direction * signal.action_code
+                if np.any(co_movement > params.CORRELATION_THRESHOLD):
+                    reason = (f"{signal.pair} is correlated above {params.CORRELATION_THRESHOLD} "
+                              f"with open positions in the same direction.")
+                    logger.warning(reason)
+                    return False, reason
 
         logger.info(
             f"Pre-trade checks passed for {signal.pair} with size {proposed_size_lots} lots.")
-        return True
+        return True, ""
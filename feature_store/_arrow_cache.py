@@ -0,0 +1,106 @@
+"""
+In-memory Arrow cache for the feature store's Parquet sources.
+
+Each file is decoded once, sorted by (pair, timestamp) and kept as a
+pyarrow.Table; lookups then binary-search the pair's row range and take a
+zero-copy slice instead of re-reading and re-decoding the Parquet file.
+Entries are refreshed when the file's mtime changes or after
+ARROW_CACHE_TTL_SECONDS, and at most ARROW_CACHE_MAXSIZE files are kept (LRU).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, NamedTuple, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ARROW_CACHE_MAXSIZE = 8
+ARROW_CACHE_TTL_SECONDS = 300.0
+
+TimeLike = Union[str, datetime, pd.Timestamp]
+
+
+class _CachedSource(NamedTuple):
+    mtime_ns: int
+    loaded_at: float
+    table: pa.Table  # Sorted by (pair, timestamp)
+    ranges: Dict[str, Tuple[int, int]]  # pair -> [start, stop) rows in `table`
+    timestamps: np.ndarray  # int64 UTC nanoseconds, aligned with `table`
+
+
+_sources: "OrderedDict[Tuple[str, str, str], _CachedSource]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _load_source(path: str, pair_column: str, timestamp_column: str, mtime_ns: int) -> _CachedSource:
+    table = pq.read_table(path, memory_map=True).sort_by(
+        [(pair_column, "ascending"), (timestamp_column, "ascending")])
+
+    timestamps = table.column(timestamp_column)
+    if not pa.types.is_timestamp(timestamps.type):
+        raise ValueError(f"{path}: column '{timestamp_column}' is {timestamps.type}, not a timestamp")
+    timestamps = timestamps.cast(pa.timestamp("ns", timestamps.type.tz)).cast(pa.int64())
+
+    pairs = table.column(pair_column).to_numpy(zero_copy_only=False)
+    # Rows are grouped by pair after the sort; record where each run starts and stops
+    boundaries = np.flatnonzero(pairs[1:] != pairs[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(pairs)]))
+    ranges = {pairs[start]: (int(start), int(stop)) for start, stop in zip(starts, stops)} if len(pairs) else {}
+
+    return _CachedSource(mtime_ns, time.monotonic(), table, ranges,
+                         timestamps.to_numpy())
+
+
+def _get_source(path: str, pair_column: str, timestamp_column: str) -> _CachedSource:
+    key = (os.path.abspath(path), pair_column, timestamp_column)
+    mtime_ns = os.stat(path).st_mtime_ns
+    with _lock:
+        source = _sources.get(key)
+        if (source is not None and source.mtime_ns == mtime_ns
+                and time.monotonic() - source.loaded_at < ARROW_CACHE_TTL_SECONDS):
+            _sources.move_to_end(key)
+            return source
+
+        source = _load_source(path, pair_column, timestamp_column, mtime_ns)
+        _sources[key] = source
+        _sources.move_to_end(key)
+        while len(_sources) > ARROW_CACHE_MAXSIZE:
+            _sources.popitem(last=False)
+        return source
+
+
+def get_slice(
+    path: str,
+    pair: str,
+    start: TimeLike,
+    end: TimeLike,
+    pair_column: str = "currency_pair_id",
+    timestamp_column: str = "event_timestamp",
+) -> pd.DataFrame:
+    """
+    Rows of the Parquet file at `path` for `pair` with start <= timestamp <= end,
+    sorted by timestamp. Naive start/end are taken as UTC. The Arrow slice is
+    zero-copy; only the final to_pandas() conversion materializes the rows.
+    """
+    source = _get_source(path, pair_column, timestamp_column)
+    row_range = source.ranges.get(pair)
+    if row_range is None:
+        return source.table.slice(0, 0).to_pandas()
+
+    first, stop = row_range
+    timestamps = source.timestamps[first:stop]
+    lo = first + int(np.searchsorted(timestamps, pd.Timestamp(start).value, side="left"))
+    hi = first + int(np.searchsorted(timestamps, pd.Timestamp(end).value, side="right"))
+    return source.table.slice(lo, hi - lo).to_pandas(split_blocks=True)
+
+
+def clear_cache() -> None:
+    """Drops every cached table."""
+    with _lock:
+        _sources.clear()
@@ -58,20 +58,21 @@ def define_feature_views(price_source, macro_source, news_source):
         name="price_features",
         entities=["currency_pair"],
         ttl=timedelta(days=365),
+        # 価格・指標は有効桁数が7桁で足りるためFloat32で保持する
         schema=[
-            Field(name="open", dtype=Float64),
-            Field(name="high", dtype=Float64),
-            Field(name="low", dtype=Float64),
-            Field(name="close", dtype=Float64),
+            Field(name="open", dtype=Float32),
+            Field(name="high", dtype=Float32),
+            Field(name="low", dtype=Float32),
+            Field(name="close", dtype=Float32),
             Field(name="volume", dtype=Int64),
-            Field(name="sma_20", dtype=Float64, description="20期間単純移動平均"),
-            Field(name="sma_50", dtype=Float64, description="50期間単純移動平均"),
+            Field(name="sma_20", dtype=Float32, description="20期間単純移動平均"),
+            Field(name="sma_50", dtype=Float32, description="50期間単純移動平均"),
             Field(name="rsi_14", dtype=Float32, description="14期間RSI"),
-            Field(name="macd", dtype=Float64, description="MACD"),
-            Field(name="macd_signal", dtype=Float64, description="MACDシグナル"),
-            Field(name="bollinger_upper", dtype=Float64, description="ボリンジャーバンド上限"),
-            Field(name="bollinger_lower", dtype=Float64, description="ボリンジャーバンド下限"),
-            Field(name="atr_14", dtype=Float64, description="14期間ATR"),
+            Field(name="macd", dtype=Float32, description="MACD"),
+            Field(name="macd_signal", dtype=Float32, description="MACDシグナル"),
+            Field(name="bollinger_upper", dtype=Float32, description="ボリンジャーバンド上限"),
+            Field(name="bollinger_lower", dtype=Float32, description="ボリンジャーバンド下限"),
+            Field(name="atr_14", dtype=Float32, description="14期間ATR"),
         ],
         online=True,
         source=price_source,
@@ -5,11 +5,14 @@ This module provides endpoints for managing trading accounts,
 including account information, balances, and transaction history.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import secrets
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field, validator, condecimal
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, condecimal, field_validator
 from typing_extensions import Literal
 
 from utils.logging import get_logger
@@ -19,14 +22,39 @@ from config import settings
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/accounts", tags=["accounts"])
+router = APIRouter(prefix="/accounts", tags=["accounts"], default_response_class=ORJSONResponse)
 
-# Constants
-ACCOUNT_TYPES = ["LIVE", "DEMO"]
-ACCOUNT_CURRENCIES = ["USD", "JPY", "EUR", "GBP"]
-TRANSACTION_TYPES = [
+# Malformed IDs are rejected by path validation (422) before the handler runs
+AccountId = Annotated[str, Path(pattern=r"^acc_[A-Za-z0-9]+$", description="Account ID ('acc_' prefix)")]
+
+# Constants (frozensets for the validators' membership checks)
+ACCOUNT_TYPES = frozenset({"LIVE", "DEMO"})
+ACCOUNT_CURRENCIES = frozenset({"USD", "JPY", "EUR", "GBP"})
+TRANSACTION_TYPES = frozenset({
     "DEPOSIT", "WITHDRAWAL", "TRADE", "FEE", "INTEREST", "DIVIDEND", "TRANSFER"
-]
+})
+
+# Age of the mock accounts' created_at
+_THIRTY_DAYS = timedelta(days=30)
+
+# Validation error messages, joined once
+_ACCOUNT_TYPES_MSG = f"Invalid account type. Must be one of: {', '.join(sorted(ACCOUNT_TYPES))}"
+_ACCOUNT_CURRENCIES_MSG = f"Unsupported currency. Must be one of: {', '.join(sorted(ACCOUNT_CURRENCIES))}"
+_TRANSACTION_TYPES_MSG = f"Invalid transaction type. Must be one of: {', '.join(sorted(TRANSACTION_TYPES))}"
+
+# Upper-case value -> interned canonical string, so validated fields share one
+# string object per value and later equality checks short-circuit on identity
+_ACCOUNT_TYPE_NAMES = {sys.intern(x): sys.intern(x) for x in ACCOUNT_TYPES}
+_ACCOUNT_CURRENCY_NAMES = {sys.intern(x): sys.intern(x) for x in ACCOUNT_CURRENCIES}
+_TRANSACTION_TYPE_NAMES = {sys.intern(x): sys.intern(x) for x in TRANSACTION_TYPES}
+
+
+def _canonical_choice(value: str, choices: Dict[str, str], error_message: str) -> str:
+    """Returns the canonical (interned) choice `value` names, case-insensitively."""
+    canonical = choices.get(value.upper())
+    if canonical is None:
+        raise ValueError(error_message)
+    return canonical
 
 
 class AccountBase(BaseModel):
@@ -44,19 +72,17 @@ class AccountBase(BaseModel):
     created_at: datetime = Field(..., description="Account creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    @validator('type')
+    @field_validator('type')
+    @classmethod
     def validate_account_type(cls, v):
         """Validate the account type."""
-        if v.upper() not in ACCOUNT_TYPES:
-            raise ValueError(f"Invalid account type. Must be one of: {', '.join(ACCOUNT_TYPES)}")
-        return v.upper()
+        return _canonical_choice(v, _ACCOUNT_TYPE_NAMES, _ACCOUNT_TYPES_MSG)
 
-    @validator('currency')
+    @field_validator('currency')
+    @classmethod
     def validate_currency(cls, v):
         """Validate the account currency."""
-        if v.upper() not in ACCOUNT_CURRENCIES:
-            raise ValueError(f"Unsupported currency. Must be one of: {', '.join(ACCOUNT_CURRENCIES)}")
-        return v.upper()
+        return _canonical_choice(v, _ACCOUNT_CURRENCY_NAMES, _ACCOUNT_CURRENCIES_MSG)
 
 
 class AccountCreate(BaseModel):
@@ -66,6 +92,18 @@ class AccountCreate(BaseModel):
     currency: str = Field("USD", description="Account currency")
     initial_balance: float = Field(10000.0, gt=0, description="Initial account balance")
 
+    @field_validator('type')
+    @classmethod
+    def validate_account_type(cls, v):
+        """Validate the account type."""
+        return _canonical_choice(v, _ACCOUNT_TYPE_NAMES, _ACCOUNT_TYPES_MSG)
+
+    @field_validator('currency')
+    @classmethod
+    def validate_currency(cls, v):
+        """Validate the account currency."""
+        return _canonical_choice(v, _ACCOUNT_CURRENCY_NAMES, _ACCOUNT_CURRENCIES_MSG)
+
 
 class AccountUpdate(BaseModel):
     """Request model for updating an account."""
@@ -85,22 +123,21 @@ class Transaction(BaseModel):
     reference_id: Optional[str] = Field(None, description="Reference ID (e.g., order ID for trade-related transactions)")
     created_at: datetime = Field(..., description="Transaction timestamp")
 
-    @validator('type')
+    @field_validator('type')
+    @classmethod
     def validate_transaction_type(cls, v):
         """Validate the transaction type."""
-        if v.upper() not in TRANSACTION_TYPES:
-            raise ValueError(f"Invalid transaction type. Must be one of: {', '.join(TRANSACTION_TYPES)}")
-        return v.upper()
+        return _canonical_choice(v, _TRANSACTION_TYPE_NAMES, _TRANSACTION_TYPES_MSG)
 
 
-@router.get("", response_model=List[AccountBase])
+@router.get("")
 async def list_accounts(
     type: Optional[str] = Query(None, description="Filter by account type"),
     currency: Optional[str] = Query(None, description="Filter by account currency"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, le=1000, description="Maximum number of accounts to return")
-):
+) -> List[AccountBase]:
     """
     List all trading accounts with optional filtering.
     
@@ -114,8 +151,8 @@ async def list_accounts(
     return []
 
 
-@router.post("", response_model=AccountBase, status_code=status.HTTP_201_CREATED)
-async def create_account(account: AccountCreate):
+@router.post("", status_code=status.HTTP_201_CREATED)
+async def create_account(account: AccountCreate) -> AccountBase:
     """
     Create a new trading account.
     
@@ -125,27 +162,30 @@ async def create_account(account: AccountCreate):
     
     # TODO: Implement actual account creation
     # This is a placeholder implementation
+    now = datetime.now(timezone.utc)
     new_account = {
-        "account_id": f"acc_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+        # Random rather than timestamp-based, so concurrent creations can't collide
+        "account_id": f"acc_{secrets.token_hex(6)}",
         "name": account.name,
-        "type": account.type.upper(),
-        "currency": account.currency.upper(),
+        "type": account.type,
+        "currency": account.currency,
         "balance": account.initial_balance,
         "equity": account.initial_balance,
         "margin": 0.0,
         "free_margin": account.initial_balance,
         "margin_level": None,
         "is_active": True,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
+        "created_at": now,
+        "updated_at": now
     }
     
     logger.info(f"Account created: {new_account}")
-    return new_account
+    # type and currency were canonicalized by AccountCreate, so validation is skipped
+    return AccountBase.model_construct(**new_account)
 
 
-@router.get("/{account_id}", response_model=AccountBase)
-async def get_account(account_id: str):
+@router.get("/{account_id}")
+async def get_account(account_id: AccountId) -> AccountBase:
     """
     Get details of a specific trading account.
     
@@ -155,31 +195,26 @@ async def get_account(account_id: str):
     
     # TODO: Implement actual account retrieval
     # This is a placeholder implementation
-    if not account_id.startswith("acc_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID '{account_id}' not found"
-        )
-    
-    # Return a mock account
-    return {
-        "account_id": account_id,
-        "name": "Demo Account",
-        "type": "DEMO",
-        "currency": "USD",
-        "balance": 10000.0,
-        "equity": 10050.0,
-        "margin": 200.0,
-        "free_margin": 9850.0,
-        "margin_level": 5025.0,
-        "is_active": True,
-        "created_at": datetime.utcnow() - timedelta(days=30),
-        "updated_at": datetime.utcnow()
-    }
+    # Return a mock account (trusted values, so validation is skipped)
+    now = datetime.now(timezone.utc)
+    return AccountBase.model_construct(
+        account_id=account_id,
+        name="Demo Account",
+        type="DEMO",
+        currency="USD",
+        balance=10000.0,
+        equity=10050.0,
+        margin=200.0,
+        free_margin=9850.0,
+        margin_level=5025.0,
+        is_active=True,
+        created_at=now - _THIRTY_DAYS,
+        updated_at=now
+    )
 
 
-@router.patch("/{account_id}", response_model=AccountBase)
-async def update_account(account_id: str, account_update: AccountUpdate):
+@router.patch("/{account_id}")
+async def update_account(account_id: AccountId, account_update: AccountUpdate) -> AccountBase:
     """
     Update a trading account.
     
@@ -189,41 +224,37 @@ async def update_account(account_id: str, account_update: AccountUpdate):
     
     # TODO: Implement actual account update
     # This is a placeholder implementation
-    if not account_id.startswith("acc_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID '{account_id}' not found"
-        )
-    
-    # Return the updated account (mock)
-    updated_account = {
-        "account_id": account_id,
-        "name": account_update.name or "Demo Account",
-        "type": "DEMO",
-        "currency": "USD",
-        "balance": 10000.0,
-        "equity": 10050.0,
-        "margin": 200.0,
-        "free_margin": 9850.0,
-        "margin_level": 5025.0,
-        "is_active": account_update.is_active if account_update.is_active is not None else True,
-        "created_at": datetime.utcnow() - timedelta(days=30),
-        "updated_at": datetime.utcnow()
-    }
+    # Return the updated account (mock). account_update was validated on the
+    # way in, so the result is built without revalidation.
+    now = datetime.now(timezone.utc)
+    updated_account = AccountBase.model_construct(
+        account_id=account_id,
+        name=account_update.name or "Demo Account",
+        type="DEMO",
+        currency="USD",
+        balance=10000.0,
+        equity=10050.0,
+        margin=200.0,
+        free_margin=9850.0,
+        margin_level=5025.0,
+        is_active=account_update.is_active if account_update.is_active is not None else True,
+        created_at=now - _THIRTY_DAYS,
+        updated_at=now
+    )
     
     logger.info(f"Account updated: {updated_account}")
     return updated_account
 
 
-@router.get("/{account_id}/transactions", response_model=List[Transaction])
+@router.get("/{account_id}/transactions")
 async def get_account_transactions(
-    account_id: str,
+    account_id: AccountId,
     type: Optional[str] = Query(None, description="Filter by transaction type"),
     start_date: Optional[datetime] = Query(None, description="Filter by start date (inclusive)"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date (inclusive)"),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, le=1000, description="Maximum number of transactions to return")
-):
+) -> List[Transaction]:
     """
     Get transaction history for a specific account.
     
@@ -235,18 +266,12 @@ async def get_account_transactions(
     
     # TODO: Implement actual transaction history retrieval
     # This is a placeholder implementation
-    if not account_id.startswith("acc_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID '{account_id}' not found"
-        )
-    
     # Return an empty list for now
     return []
 
 
-@router.get("/{account_id}/balance", response_model=Dict[str, float])
-async def get_account_balance(account_id: str):
+@router.get("/{account_id}/balance")
+async def get_account_balance(account_id: AccountId) -> Dict[str, float]:
     """
     Get the current balance of a trading account.
     
@@ -256,12 +281,6 @@ async def get_account_balance(account_id: str):
     
     # TODO: Implement actual balance retrieval
     # This is a placeholder implementation
-    if not account_id.startswith("acc_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Account with ID '{account_id}' not found"
-        )
-    
     # Return mock balance information
     return {
         "balance": 10000.0,
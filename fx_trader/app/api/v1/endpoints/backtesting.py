@@ -5,12 +5,16 @@ This module provides endpoints for backtesting trading strategies
 on historical market data.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import random
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, List, Optional, Any
 from enum import Enum
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
-from pydantic import BaseModel, Field, validator, confloat, conint
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Path
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationInfo, confloat, conint, field_validator
 
 from utils.logging import get_logger
 from config import settings
@@ -19,11 +23,26 @@ from config import settings
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(prefix="/backtesting", tags=["backtesting"])
+router = APIRouter(prefix="/backtesting", tags=["backtesting"], default_response_class=ORJSONResponse)
 
-# Constants
-SUPPORTED_INTERVALS = ["1m", "5m", "15m", "30m", "1h", "4h", "1d"]
-SUPPORTED_STRATEGY_TYPES = ["MEAN_REVERSION", "MOMENTUM", "BREAKOUT", "GRID", "MACHINE_LEARNING"]
+# Malformed IDs are rejected by path validation (422) before the handler runs
+BacktestId = Annotated[str, Path(pattern=r"^bt_[A-Za-z0-9]+$", description="Backtest ID ('bt_' prefix)")]
+
+# Constants (frozensets for membership checks)
+_INTERVALS_IN_ORDER = ("1m", "5m", "15m", "30m", "1h", "4h", "1d")
+SUPPORTED_INTERVALS = frozenset(_INTERVALS_IN_ORDER)
+SUPPORTED_STRATEGY_TYPES = frozenset({"MEAN_REVERSION", "MOMENTUM", "BREAKOUT", "GRID", "MACHINE_LEARNING"})
+
+# Joined once, shortest interval first, for the field description and validation error
+_SUPPORTED_INTERVALS_LIST = ", ".join(_INTERVALS_IN_ORDER)
+
+# Offsets used by the mock responses
+_FIFTEEN_MINUTES = timedelta(minutes=15)
+_THIRTY_DAYS = timedelta(days=30)
+
+# Backtest IDs only need to be unique, not unpredictable: seed once from the OS
+# and draw 48 bits per ID without a syscall
+_id_rng = random.Random(secrets.randbits(128))
 
 
 class StrategyType(str, Enum):
@@ -39,7 +58,7 @@ class BacktestRequest(BaseModel):
     """Request model for starting a backtest."""
     strategy_type: StrategyType = Field(..., description="Type of trading strategy to backtest")
     symbol: str = Field(..., description="Trading pair symbol (e.g., 'USD_JPY')")
-    interval: str = Field("1h", description=f"Candlestick interval. Supported: {', '.join(SUPPORTED_INTERVALS)}")
+    interval: str = Field("1h", description=f"Candlestick interval. Supported: {_SUPPORTED_INTERVALS_LIST}")
     start_time: datetime = Field(..., description="Start time of the backtest period (inclusive)")
     end_time: datetime = Field(..., description="End time of the backtest period (inclusive)")
     initial_balance: float = Field(10000.0, gt=0, description="Initial account balance in quote currency")
@@ -53,18 +72,20 @@ class BacktestRequest(BaseModel):
     commission: float = Field(0.0005, ge=0, description="Commission per trade as a percentage")
     slippage: float = Field(0.0001, ge=0, description="Slippage as a percentage")
     
-    @validator('end_time')
-    def validate_end_time_after_start_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time_after_start_time(cls, v, info: ValidationInfo):
         """Validate that end_time is after start_time."""
-        if 'start_time' in values and v <= values['start_time']:
+        if 'start_time' in info.data and v <= info.data['start_time']:
             raise ValueError("end_time must be after start_time")
         return v
     
-    @validator('interval')
+    @field_validator('interval')
+    @classmethod
     def validate_interval(cls, v):
         """Validate the candlestick interval."""
         if v not in SUPPORTED_INTERVALS:
-            raise ValueError(f"Unsupported interval. Supported intervals: {', '.join(SUPPORTED_INTERVALS)}")
+            raise ValueError(f"Unsupported interval. Supported intervals: {_SUPPORTED_INTERVALS_LIST}")
         return v
 
 
@@ -99,11 +120,6 @@ class BacktestResult(BaseModel):
     
     # Error information (if any)
     error: Optional[str] = Field(None, description="Error message if the backtest failed")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
 
 
 class BacktestTrade(BaseModel):
@@ -124,15 +140,10 @@ class BacktestTrade(BaseModel):
     stop_loss: Optional[float] = Field(None, description="Stop-loss price")
     take_profit: Optional[float] = Field(None, description="Take-profit price")
     exit_reason: Optional[str] = Field(None, description="Reason for closing the trade")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
 
 
-@router.post("", response_model=BacktestResult, status_code=status.HTTP_201_CREATED)
-async def create_backtest(request: BacktestRequest):
+@router.post("", status_code=status.HTTP_201_CREATED)
+async def create_backtest(request: BacktestRequest) -> BacktestResult:
     """
     Start a new backtest.
     
@@ -142,8 +153,7 @@ async def create_backtest(request: BacktestRequest):
     logger.info(f"Starting new backtest with request: {request.dict()}")
     
     # Generate a unique backtest ID
-    import uuid
-    backtest_id = f"bt_{uuid.uuid4().hex[:12]}"
+    backtest_id = f"bt_{_id_rng.getrandbits(48):012x}"
     
     # TODO: Implement actual backtest execution
     # This is a placeholder implementation that returns immediately with a running status
@@ -154,16 +164,16 @@ async def create_backtest(request: BacktestRequest):
     # 3. Return immediately with a status of RUNNING
     # 4. Process the backtest in a background task
     
-    return BacktestResult(
+    return BacktestResult.model_construct(
         backtest_id=backtest_id,
         status="RUNNING",
-        start_time=datetime.utcnow(),
+        start_time=datetime.now(timezone.utc),
         initial_balance=request.initial_balance,
     )
 
 
-@router.get("/{backtest_id}", response_model=BacktestResult)
-async def get_backtest_result(backtest_id: str):
+@router.get("/{backtest_id}")
+async def get_backtest_result(backtest_id: BacktestId) -> BacktestResult:
     """
     Get the result of a backtest.
     
@@ -179,23 +189,19 @@ async def get_backtest_result(backtest_id: str):
     # 2. Return the current status and results
     
     # For demo purposes, return a completed backtest with mock data
-    if not backtest_id.startswith("bt_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Backtest with ID '{backtest_id}' not found"
-        )
     
     # Generate some mock performance metrics
+    now = datetime.now(timezone.utc)
     initial_balance = 10000.0
     final_balance = 12500.0
     total_trades = 42
     winning_trades = 25
     
-    return BacktestResult(
+    return BacktestResult.model_construct(
         backtest_id=backtest_id,
         status="COMPLETED",
-        start_time=datetime.utcnow() - timedelta(minutes=15),
-        end_time=datetime.utcnow(),
+        start_time=now - _FIFTEEN_MINUTES,
+        end_time=now,
         duration_seconds=900,  # 15 minutes
         initial_balance=initial_balance,
         final_balance=final_balance,
@@ -213,12 +219,12 @@ async def get_backtest_result(backtest_id: str):
     )
 
 
-@router.get("/{backtest_id}/trades", response_model=List[BacktestTrade])
+@router.get("/{backtest_id}/trades")
 async def get_backtest_trades(
-    backtest_id: str,
+    backtest_id: BacktestId,
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(100, le=1000, description="Maximum number of trades to return")
-):
+) -> List[BacktestTrade]:
     """
     Get the trades from a backtest.
     
@@ -229,47 +235,51 @@ async def get_backtest_trades(
     # TODO: Implement actual trade retrieval
     # This is a placeholder implementation that returns mock data
     
-    if not backtest_id.startswith("bt_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Backtest with ID '{backtest_id}' not found"
-        )
-    
-    # Generate some mock trades
-    trades = []
-    base_time = datetime.utcnow() - timedelta(days=30)
-    
-    for i in range(min(limit, 100)):  # Return up to 100 mock trades
-        is_win = i % 3 != 0  # Roughly 2/3 win rate
-        entry_price = 100.0 + (i * 0.1)
-        exit_price = entry_price * (1.015 if is_win else 0.99)  # 1.5% win or 1% loss
-        
-        trade = BacktestTrade(
+    # Generate some mock trades (up to 100) as whole columns, then build the
+    # models in one pass. The values are generated here and trusted, so
+    # model_construct skips per-field validation.
+    idx = np.arange(min(limit, 100))
+    is_win = idx % 3 != 0  # Roughly 2/3 win rate
+    is_buy = idx % 2 == 0
+    direction = np.where(is_buy, 1.0, -1.0)
+    entry_prices = 100.0 + idx * 0.1
+    exit_prices = entry_prices * np.where(is_win, 1.015, 0.99)  # 1.5% win or 1% loss
+    pnls = 1000.0 * (exit_prices - entry_prices) * direction
+    pnl_pcts = (exit_prices / entry_prices - 1) * 100 * direction
+    stop_losses = entry_prices * np.where(is_buy, 0.99, 1.01)
+    take_profits = entry_prices * np.where(is_buy, 1.01, 0.99)
+    base_time = datetime.now(timezone.utc) - _THIRTY_DAYS
+    
+    trades = [
+        BacktestTrade.model_construct(
             trade_id=f"trade_{i}",
             entry_time=base_time + timedelta(hours=i*2),
             exit_time=base_time + timedelta(hours=(i*2 + 1)),
             symbol="USD_JPY",
-            side="BUY" if i % 2 == 0 else "SELL",
+            side="BUY" if buy else "SELL",
             size=1000.0,
             entry_price=entry_price,
             exit_price=exit_price,
-            pnl=1000.0 * (exit_price - entry_price) * (1 if i % 2 == 0 else -1),
-            pnl_pct=(exit_price / entry_price - 1) * 100 * (1 if i % 2 == 0 else -1),
+            pnl=pnl,
+            pnl_pct=pnl_pct,
             fee=0.5,
-            stop_loss=entry_price * (0.99 if i % 2 == 0 else 1.01),
-            take_profit=entry_price * (1.01 if i % 2 == 0 else 0.99),
-            exit_reason="TAKE_PROFIT" if is_win else "STOP_LOSS"
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            exit_reason="TAKE_PROFIT" if win else "STOP_LOSS"
         )
-        trades.append(trade)
+        for i, (win, buy, entry_price, exit_price, pnl, pnl_pct, stop_loss, take_profit) in enumerate(zip(
+            is_win.tolist(), is_buy.tolist(), entry_prices.tolist(), exit_prices.tolist(),
+            pnls.tolist(), pnl_pcts.tolist(), stop_losses.tolist(), take_profits.tolist()))
+    ]
     
     return trades
 
 
-@router.get("/{backtest_id}/equity", response_model=List[Dict[str, Any]])
+@router.get("/{backtest_id}/equity")
 async def get_backtest_equity_curve(
-    backtest_id: str,
+    backtest_id: BacktestId,
     interval: str = Query("1d", description="Interval between equity curve points")
-):
+) -> List[Dict[str, Any]]:
     """
     Get the equity curve from a backtest.
     
@@ -280,31 +290,24 @@ async def get_backtest_equity_curve(
     # TODO: Implement actual equity curve retrieval
     # This is a placeholder implementation that returns mock data
     
-    if not backtest_id.startswith("bt_"):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Backtest with ID '{backtest_id}' not found"
-        )
-    
-    # Generate a mock equity curve
-    equity_curve = []
+    # Generate a mock equity curve: a random walk of -1% to +1% daily returns
+    num_days = 30
     initial_balance = 10000.0
-    current_balance = initial_balance
-    current_time = datetime.utcnow() - timedelta(days=30)
-    
-    for i in range(30):  # 30 days of data
-        # Add some random walk to the balance
-        import random
-        daily_return = (random.random() * 0.02) - 0.01  # -1% to +1% daily return
-        current_balance *= (1 + daily_return)
-        
-        equity_curve.append({
-            "timestamp": current_time.isoformat(),
-            "balance": current_balance,
-            "equity": current_balance * (1 + (random.random() * 0.02 - 0.01)),  # Slight variation
-            "drawdown": (1 - (current_balance / max(p["balance"] for p in equity_curve))) * 100 if equity_curve else 0.0
-        })
-        
-        current_time += timedelta(days=1)
+    start_time = datetime.now(timezone.utc) - _THIRTY_DAYS
+    
+    balances = initial_balance * np.cumprod(1 + np.random.uniform(-0.01, 0.01, size=num_days))
+    equities = balances * (1 + np.random.uniform(-0.01, 0.01, size=num_days))  # Slight variation
+    drawdowns = (1 - balances / np.maximum.accumulate(balances)) * 100
+    
+    equity_curve = [
+        {
+            "timestamp": (start_time + timedelta(days=i)).isoformat(),
+            "balance": balance,
+            "equity": equity,
+            "drawdown": drawdown,
+        }
+        for i, (balance, equity, drawdown) in enumerate(
+            zip(balances.tolist(), equities.tolist(), drawdowns.tolist()))
+    ]
     
     return equity_curve
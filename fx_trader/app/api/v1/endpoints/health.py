@@ -5,10 +5,13 @@ This module provides endpoints to check the health status of the application
 and its dependencies.
 """
 
-from datetime import datetime
-from typing import Dict, List
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from config import settings
@@ -18,7 +21,59 @@ from utils.logging import get_logger
 logger = get_logger(__name__)
 
 # Create router with prefix and tags
-router = APIRouter(prefix="/health", tags=["health"])
+router = APIRouter(prefix="/health", tags=["health"], default_response_class=ORJSONResponse)
+
+# Detailed checks within this window reuse the previous response, so frequent
+# probes don't each walk /proc
+DETAILED_HEALTH_CACHE_TTL_SECONDS = 1.0
+
+# Pre-serialized probe bodies. The basic health check only varies in its
+# timestamp, so everything else is encoded once (on first use, since it reads
+# settings) and the timestamp is appended per request.
+_health_body_prefix: Optional[bytes] = None
+_READY_BODY = orjson.dumps({"status": "ready"})
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+
+# psutil handle for this process, created on the first detailed check
+_process: Optional[Any] = None
+_detailed_cache: Optional[Tuple[float, "HealthCheckDetailedResponse"]] = None
+
+# Non-blocking cpu_percent() reports usage since the previous call and the
+# first call only sets the baseline, so it is primed here rather than in the
+# first detailed check (which would otherwise report a meaningless value)
+try:
+    import psutil
+except ImportError:  # Only the detailed check needs psutil
+    pass
+else:
+    psutil.cpu_percent(interval=None)
+
+
+def _get_health_body_prefix() -> bytes:
+    """The basic health check JSON without its timestamp and closing brace."""
+    global _health_body_prefix
+    if _health_body_prefix is None:
+        _health_body_prefix = orjson.dumps({
+            "status": "ok",
+            "version": settings.VERSION,
+            "environment": settings.APP_ENV,
+            "dependencies": {
+                "database": "ok",  # TODO: Implement actual check
+                "cache": "ok",     # TODO: Implement actual check
+                "broker": "ok"     # TODO: Implement actual check
+            },
+        })[:-1]
+    return _health_body_prefix
+
+
+def _get_process() -> Any:
+    """Returns the cached psutil.Process, creating it on first use."""
+    global _process
+    if _process is None:
+        import psutil
+
+        _process = psutil.Process()
+    return _process
 
 
 class HealthCheckResponse(BaseModel):
@@ -48,27 +103,19 @@ class HealthCheckDetailedResponse(HealthCheckResponse):
 
 
 @router.get("", response_model=HealthCheckResponse, summary="Health Check")
-async def health_check() -> HealthCheckResponse:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     
     Returns:
         HealthCheckResponse: Basic health status of the application.
     """
-    return HealthCheckResponse(
-        status="ok",
-        version=settings.VERSION,
-        timestamp=datetime.utcnow(),
-        environment=settings.ENV,
-        dependencies={
-            "database": "ok",  # TODO: Implement actual check
-            "cache": "ok",     # TODO: Implement actual check
-            "broker": "ok"     # TODO: Implement actual check
-        }
-    )
+    body = (_get_health_body_prefix() + b',"timestamp":'
+            + orjson.dumps(datetime.now(timezone.utc), option=orjson.OPT_UTC_Z) + b"}")
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/detailed", response_model=HealthCheckDetailedResponse)
+@router.get("/detailed")
 async def detailed_health_check() -> HealthCheckDetailedResponse:
     """
     Detailed health check endpoint with system information.
@@ -79,13 +126,14 @@ async def detailed_health_check() -> HealthCheckDetailedResponse:
     Returns:
         HealthCheckDetailedResponse: Detailed health status of the application.
     """
-    # Import psutil only when needed to avoid import overhead
+    global _detailed_cache
+    now = time.monotonic()
+    if _detailed_cache is not None and now - _detailed_cache[0] < DETAILED_HEALTH_CACHE_TTL_SECONDS:
+        return _detailed_cache[1]
+
     import psutil
-    import os
-    import time
-    
-    # Get process information
-    process = psutil.Process(os.getpid())
+
+    process = _get_process()
     memory_info = process.memory_info()
     
     # Calculate memory usage in MB
@@ -95,8 +143,8 @@ async def detailed_health_check() -> HealthCheckDetailedResponse:
         "percent": process.memory_percent()
     }
     
-    # Get system-wide CPU and memory info
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+    # Get system-wide CPU and memory info (CPU since the previous check; never blocks)
+    cpu_percent = psutil.cpu_percent(interval=None)
     virtual_memory = psutil.virtual_memory()
     
     # Add system metrics to memory usage
@@ -113,28 +161,30 @@ async def detailed_health_check() -> HealthCheckDetailedResponse:
         "ml_service": "ok"    # Replace with actual check
     }
     
-    return HealthCheckDetailedResponse(
+    response = HealthCheckDetailedResponse(
         status="ok",
         version=settings.VERSION,
-        timestamp=datetime.utcnow(),
-        environment=settings.ENV,
+        timestamp=datetime.now(timezone.utc),
+        environment=settings.APP_ENV,
         dependencies={
             "database": "ok",  # TODO: Implement actual check
             "cache": "ok",     # TODO: Implement actual check
             "broker": "ok"     # TODO: Implement actual check
         },
         uptime=time.time() - process.create_time(),
-        active_workers=len(psutil.Process().children()),
+        active_workers=len(process.children(recursive=False)),
         memory_usage=memory_usage,
         database_status="ok",  # TODO: Implement actual check
         cache_status="ok",     # TODO: Implement actual check
         broker_status="ok",    # TODO: Implement actual check
         external_apis=external_apis
     )
+    _detailed_cache = (now, response)
+    return response
 
 
 @router.get("/readiness", response_model=Dict[str, str], summary="Readiness Probe")
-async def readiness_probe() -> Dict[str, str]:
+async def readiness_probe() -> Response:
     """
     Kubernetes readiness probe endpoint.
     
@@ -146,11 +196,11 @@ async def readiness_probe() -> Dict[str, str]:
     """
     # TODO: Implement actual readiness checks
     # For now, we'll just return a 200 OK if the application is running
-    return {"status": "ready"}
+    return Response(content=_READY_BODY, media_type="application/json")
 
 
 @router.get("/liveness", response_model=Dict[str, str], summary="Liveness Probe")
-async def liveness_probe() -> Dict[str, str]:
+async def liveness_probe() -> Response:
     """
     Kubernetes liveness probe endpoint.
     
@@ -162,4 +212,4 @@ async def liveness_probe() -> Dict[str, str]:
     """
     # TODO: Implement actual liveness checks
     # For now, we'll just return a 200 OK if the application is running
-    return {"status": "alive"}
+    return Response(content=_ALIVE_BODY, media_type="application/json")
@@ -15,7 +15,7 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from utils.logging import get_logger, configure_logging
-from config.settings import settings
+from config.settings import ensure_loaded, settings
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -48,6 +48,9 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance.
     """
+    # Validate configuration up front so a bad config fails at startup
+    ensure_loaded()
+
     # Configure logging
     configure_logging()
     
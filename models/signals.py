@@ -3,14 +3,24 @@ from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import talib
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from config import settings
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# talib (a C extension) is imported on first indicator use, so importers that
+# only need the Signal model (e.g. execution.risk_manager) don't pay for it
+_talib = None
+
+
+def _get_talib():
+    global _talib
+    if _talib is None:
+        import talib as _talib
+    return _talib
+
 
 class SignalActionType(str, Enum):
     BUY = "BUY"
@@ -20,6 +30,14 @@ class SignalActionType(str, Enum):
     CLOSE_SHORT = "CLOSE_SHORT"  # Explicitly close an existing short
 
 
+# Integer direction per action (+1 BUY, -1 SELL); every other action is 0.
+# Lets hot paths and NumPy batch code compare ints instead of enum members.
+SIGNAL_ACTION_CODES: Dict[SignalActionType, int] = {
+    SignalActionType.BUY: 1,
+    SignalActionType.SELL: -1,
+}
+
+
 class Signal(BaseModel):
     """
     Represents a trading signal.
@@ -37,7 +55,15 @@ class Signal(BaseModel):
     # For strategy-specific details, e.g., indicator values
     details: Dict[str, Any] = Field(default_factory=dict)
 
-    @validator("timestamp", pre=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # pd.Timestamp has no pydantic schema
+
+    @property
+    def action_code(self) -> int:
+        """+1 for BUY, -1 for SELL, 0 for any other action (see SIGNAL_ACTION_CODES)."""
+        return SIGNAL_ACTION_CODES.get(self.action, 0)
+
+    @field_validator("timestamp", mode="before")
+    @classmethod
     def _parse_timestamp(cls, value: Any) -> pd.Timestamp:
         if isinstance(value, pd.Timestamp):
             return value
@@ -49,6 +75,7 @@ def _calculate_ema_crossover_signal(df: pd.DataFrame, short_window: int, long_wi
     if len(df) < long_window:
         return SignalActionType.HOLD
 
+    talib = _get_talib()
     df['ema_short'] = talib.EMA(df['close'], timeperiod=short_window)
     df['ema_long'] = talib.EMA(df['close'], timeperiod=long_window)
 
@@ -73,6 +100,7 @@ def _calculate_rsi_signal(df: pd.DataFrame, period: int, oversold_threshold: int
     if len(df) < period:
         return SignalActionType.HOLD
 
+    talib = _get_talib()
     df['rsi'] = talib.RSI(df['close'], timeperiod=period)
     last_rsi = df['rsi'].iloc[-1]
 
@@ -91,7 +119,7 @@ def _calculate_bollinger_bands_signal(df: pd.DataFrame, period: int, std_dev: fl
     if len(df) < period:
         return SignalActionType.HOLD
 
-    upper, middle, lower = talib.BBANDS(
+    upper, middle, lower = _get_talib().BBANDS(
         df['close'], timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev, matype=0)
     df['bb_upper'] = upper
     df['bb_middle'] = middle
@@ -0,0 +1,109 @@
+"""
+APIエンドポイントのユニットテスト
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import settings
+from fx_trader.app.api.v1.endpoints import accounts, backtesting, health
+
+
+@pytest.fixture
+def client():
+    """エンドポイントのルーターを登録したテストクライアント"""
+    app = FastAPI()
+    app.include_router(accounts.router)
+    app.include_router(backtesting.router)
+    app.include_router(health.router)
+    return TestClient(app)
+
+
+def test_create_account_canonicalizes_choices(client):
+    """口座作成で口座種別と通貨が正規化されるかのテスト"""
+    response = client.post("/accounts", json={"name": "Main", "type": "live", "currency": "jpy"})
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["type"] == "LIVE"
+    assert body["currency"] == "JPY"
+    assert body["account_id"].startswith("acc_")
+
+
+@pytest.mark.parametrize("field, value", [("type", "PAPER"), ("currency", "XYZ")])
+def test_create_account_rejects_invalid_choice(client, field, value):
+    """不正な口座種別・通貨は422で拒否されるかのテスト"""
+    response = client.post("/accounts", json={"name": "Main", field: value})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("path", ["/accounts/foo", "/backtesting/xyz", "/backtesting/xyz/trades"])
+def test_malformed_ids_are_rejected(client, path):
+    """形式が不正な口座ID・バックテストIDはハンドラーに到達せず422になるかのテスト"""
+    response = client.get(path)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "path"
+
+
+def test_get_account_with_valid_id(client):
+    """正しい形式の口座IDで口座情報を取得できるかのテスト"""
+    response = client.get("/accounts/acc_abc123")
+
+    assert response.status_code == 200
+    assert response.json()["account_id"] == "acc_abc123"
+
+
+def test_backtest_create_then_read(client):
+    """バックテストを作成し、結果とトレードを取得できるかのテスト"""
+    response = client.post("/backtesting", json={
+        "strategy_type": "MOMENTUM",
+        "symbol": "USD_JPY",
+        "start_time": "2024-01-01T00:00:00Z",
+        "end_time": "2024-02-01T00:00:00Z",
+    })
+    assert response.status_code == 201
+    created = response.json()
+    backtest_id = created["backtest_id"]
+    assert backtest_id.startswith("bt_")
+    assert created["status"] == "RUNNING"
+
+    result = client.get(f"/backtesting/{backtest_id}")
+    assert result.status_code == 200
+    assert result.json()["backtest_id"] == backtest_id
+
+    trades = client.get(f"/backtesting/{backtest_id}/trades", params={"limit": 5})
+    assert trades.status_code == 200
+    body = trades.json()
+    assert len(body) == 5
+    assert {trade["side"] for trade in body} == {"BUY", "SELL"}
+
+
+def test_health_check(client):
+    """ヘルスチェックが事前シリアライズされたJSONを返すかのテスト"""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["version"] == settings.VERSION
+    assert body["environment"] == settings.APP_ENV
+    assert body["timestamp"].endswith("Z")
+    # 2回目以降もキャッシュされたプレフィックスで同じ形になる
+    assert client.get("/health").json().keys() == body.keys()
+
+
+def test_detailed_health_check(client):
+    """詳細ヘルスチェックが初回からCPU使用率とUTCの時刻を返すかのテスト"""
+    response = client.get("/health/detailed")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["environment"] == settings.APP_ENV
+    assert body["timestamp"].endswith(("Z", "+00:00"))
+    assert 0.0 <= body["memory_usage"]["cpu_percent"] <= 100.0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
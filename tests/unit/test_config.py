@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from config.settings import Settings
 from config.trading_params import TradingParameters
@@ -37,3 +39,13 @@ def test_trading_params_validation():
     
     with pytest.raises(ValueError):
         TradingParameters(MAX_DRAWDOWN_PCT=1.5)
+
+
+def test_trading_params_allowed_pairs_set():
+    """許可通貨ペアがfrozensetとして参照でき、文字列がinternされていること"""
+    params = TradingParameters(ALLOWED_CURRENCY_PAIRS=["EUR_USD", "USD_JPY"])
+
+    assert params.ALLOWED_CURRENCY_PAIRS_SET == frozenset({"EUR_USD", "USD_JPY"})
+    assert params.ALLOWED_CURRENCY_PAIRS_SET is params.ALLOWED_CURRENCY_PAIRS_SET
+    assert "GBP_USD" not in params.ALLOWED_CURRENCY_PAIRS_SET
+    assert params.ALLOWED_CURRENCY_PAIRS[0] is sys.intern("EUR_USD")
@@ -1,4 +1,7 @@
+import httpx
+import orjson
 import pytest
+from execution.abstract_broker_client import OrderStatus
 from execution.risk_manager import RiskManager
 from execution.oanda_broker_client import OandaBrokerClient
 
@@ -46,7 +49,23 @@ def test_risk_manager_check_risk_limits(risk_manager):
     assert result is False
 
 
-def test_oanda_broker_client_order(oanda_broker_client):
+@pytest.fixture
+def oanda_broker_client():
+    """OANDAへのリクエストをhttpx.MockTransportで処理するブローカークライアント"""
+    def handler(request):
+        order = orjson.loads(request.content)["order"]
+        return httpx.Response(201, json={"orderFillTransaction": {
+            "id": "6", "type": "ORDER_FILL", "instrument": order["instrument"], "units": order["units"],
+            "price": "135.000",
+        }})
+
+    client = OandaBrokerClient(access_token="test-token", account_id="101-001-1", environment="practice")
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_oanda_broker_client_order(oanda_broker_client):
     """OANDA注文テスト"""
     # テスト用のデータ
     mock_order = {
@@ -56,8 +75,10 @@ def test_oanda_broker_client_order(oanda_broker_client):
         "timeInForce": "FOK",
         "positionFill": "DEFAULT"
     }
-    
-    # モックのレスポンスを返す
-    with pytest.raises(NotImplementedError):
-        # 実際のAPI呼び出しはテスト環境では実行しない
-        oanda_broker_client.create_order(mock_order)
+
+    # モックのレスポンスを返す(実際のAPI呼び出しはテスト環境では実行しない)
+    order = await oanda_broker_client.place_order(mock_order)
+    assert order.order_id == "6"
+    assert order.instrument == "USD_JPY"
+    assert order.units == 10000.0
+    assert order.status == OrderStatus.FILLED
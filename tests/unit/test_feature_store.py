@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from feature_store import _arrow_cache
+
+
+def test_arrow_cache_get_slice(tmp_path):
+    """Arrowキャッシュから通貨ペアと期間で切り出せるかのテスト"""
+    times = pd.date_range("2024-01-01", periods=4, freq="h", tz="UTC")
+    df = pd.DataFrame({
+        "event_timestamp": list(times) * 2,
+        "currency_pair_id": ["USD_JPY"] * 4 + ["EUR_USD"] * 4,
+        "close": [150.0, 150.1, 150.2, 150.3, 1.10, 1.11, 1.12, 1.13],
+    }).sample(frac=1.0, random_state=0)  # 行順はばらばら
+    path = tmp_path / "price_data.parquet"
+    df.to_parquet(path)
+    _arrow_cache.clear_cache()
+
+    result = _arrow_cache.get_slice(str(path), "EUR_USD", times[1], times[2])
+    assert result["close"].tolist() == [1.11, 1.12]
+    assert (result["currency_pair_id"] == "EUR_USD").all()
+
+    # 2回目はキャッシュされたテーブルを使う
+    assert _arrow_cache.get_slice(str(path), "EUR_USD", times[0], times[0])["close"].tolist() == [1.10]
+    assert len(_arrow_cache._sources) == 1
+
+    assert _arrow_cache.get_slice(str(path), "GBP_USD", times[0], times[3]).empty
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,32 @@
+import diskcache
+import pandas as pd
+import pytest
+
+from utils.frame_cache import load_frame, store_frame
+
+
+def test_frame_cache_roundtrip(tmp_path):
+    """DataFrameとattrsがpickleを介さずにキャッシュから復元されること"""
+    cache = diskcache.Cache(str(tmp_path))
+    df = pd.DataFrame({"date": pd.to_datetime(["2024-01-01", "2024-01-02"]), "value": [1.5, float("nan")]})
+    df.attrs["fred"] = {"units": "lin", "count": 2}
+
+    store_frame(cache, "fred:observations:TEST", df)
+    assert isinstance(cache.get("fred:observations:TEST"), bytes)
+
+    loaded = load_frame(cache, "fred:observations:TEST")
+    pd.testing.assert_frame_equal(loaded, df)
+    assert loaded.attrs == {"fred": {"units": "lin", "count": 2}}
+    assert load_frame(cache, "fred:observations:MISSING") is None
+
+
+def test_frame_cache_respects_expire(tmp_path):
+    """有効期限切れのエントリはキャッシュミスとして扱われること"""
+    cache = diskcache.Cache(str(tmp_path))
+    store_frame(cache, "news:expired", pd.DataFrame({"value": [1.0]}), expire=-1)
+
+    assert load_frame(cache, "news:expired") is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,54 @@
+"""
+HTTPクライアントユーティリティのユニットテスト
+"""
+import httpx
+import pytest
+
+from utils import http_client
+from utils.http_client import make_request_with_retry, retry_backoff
+
+
+def test_retry_backoff_matches_tenacity_schedule():
+    """待機時間がwait_exponential(multiplier=1, min=2, max=10)と同じかのテスト"""
+    assert [retry_backoff(attempt) for attempt in range(1, 7)] == [2.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_make_request_with_retry_backs_off_then_succeeds(monkeypatch):
+    """失敗したリクエストが待機を挟んで再試行されるかのテスト"""
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+    statuses = iter([503, 500, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    async with httpx.AsyncClient(base_url="https://example.test", transport=httpx.MockTransport(handler)) as client:
+        response = await make_request_with_retry(client, "GET", "/data")
+
+    assert response.status_code == 200
+    assert waits == [2.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_make_request_with_retry_raises_last_error(monkeypatch):
+    """全ての試行が失敗した場合は最後のエラーを送出するかのテスト"""
+    async def fake_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+
+    def handler(request):
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(base_url="https://example.test", transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await make_request_with_retry(client, "GET", "/missing", max_attempts=2)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.kernels import (
+    bollinger_bands,
+    bollinger_step,
+    cached_indicator,
+    clear_indicator_cache,
+    ema_crossover_fused,
+    ema_step,
+    make_bollinger,
+    make_ema_crossover,
+    make_rsi,
+    rsi_from_averages,
+    rsi_wilder,
+    rsi_wilder_step,
+)
+from execution._atr_njit import _wilder_atr_ewm, _wilder_atr_last_ewm, wilder_atr, wilder_atr_last
+from execution._ohlc_ring import OhlcRing
+from execution._signal_eval_njit import evaluate_signal
+
+
+@pytest.fixture
+def close():
+    """テスト用の終値配列"""
+    rng = np.random.default_rng(0)
+    return 1.1 + np.cumsum(rng.normal(0, 0.001, 1000))
+
+
+def test_rsi_wilder_matches_pandas(close):
+    """RSIカーネルとpandasのWilder平滑化の比較テスト"""
+    period = 14
+    rsi = rsi_wilder(close, period)
+
+    diff = pd.Series(close).diff()
+    gain = diff.clip(lower=0.0)
+    loss = -diff.clip(upper=0.0)
+    # 最初の平均は単純平均、それ以降はWilder平滑化
+    gain.iloc[period] = gain.iloc[1:period + 1].mean()
+    loss.iloc[period] = loss.iloc[1:period + 1].mean()
+    avg_g = gain.iloc[period:].ewm(alpha=1 / period, adjust=False).mean()
+    avg_l = loss.iloc[period:].ewm(alpha=1 / period, adjust=False).mean()
+    expected = 100 - 100 / (1 + avg_g / avg_l)
+
+    assert np.isnan(rsi[:period]).all()
+    np.testing.assert_allclose(rsi[period:], expected.to_numpy(), rtol=1e-9)
+
+
+def test_bollinger_bands_matches_rolling(close):
+    """ボリンジャーバンドカーネルとpandas rollingの比較テスト"""
+    period, devfactor = 20, 2.0
+    mid, top, bot = bollinger_bands(close, period, devfactor)
+
+    rolling = pd.Series(close).rolling(period)
+    expected_mid = rolling.mean().to_numpy()
+    expected_std = rolling.std(ddof=0).to_numpy()
+
+    assert np.isnan(mid[:period - 1]).all()
+    np.testing.assert_allclose(mid[period - 1:], expected_mid[period - 1:], rtol=1e-9)
+    np.testing.assert_allclose(
+        top[period - 1:], (expected_mid + devfactor * expected_std)[period - 1:], rtol=1e-9)
+    np.testing.assert_allclose(
+        bot[period - 1:], (expected_mid - devfactor * expected_std)[period - 1:], rtol=1e-9)
+
+
+def test_ema_crossover_fused_matches_pandas(close):
+    """融合EMAクロスオーバーがpandasでの計算と一致するかのテスト"""
+    short, long = 10, 30
+
+    def sma_seeded_ema(period):
+        seeded = pd.Series(close).copy()
+        seeded.iloc[period - 1] = close[:period].mean()
+        return seeded.iloc[period - 1:].ewm(span=period, adjust=False).mean().reindex(
+            range(len(close))).to_numpy()
+
+    diff = sma_seeded_ema(short) - sma_seeded_ema(long)
+    expected = np.zeros(len(close), dtype=np.int8)
+    expected[1:][(diff[1:] > 0) & (diff[:-1] < 0)] = 1
+    expected[1:][(diff[1:] < 0) & (diff[:-1] > 0)] = -1
+
+    signals = ema_crossover_fused(close, short, long)
+    assert signals.dtype == np.int8
+    np.testing.assert_array_equal(signals, expected)
+
+
+def test_kernels_accept_float32(close):
+    """float32入力でもfloat64と同じ結果になるかのテスト"""
+    close32 = close.astype(np.float32)
+    close64 = close32.astype(np.float64)
+
+    np.testing.assert_allclose(rsi_wilder(close32, 14), rsi_wilder(close64, 14), rtol=1e-12)
+    for band32, band64 in zip(bollinger_bands(close32, 20, 2.0), bollinger_bands(close64, 20, 2.0)):
+        np.testing.assert_allclose(band32, band64, rtol=1e-12)
+
+
+def test_streaming_steps_match_batch_kernels(close):
+    """ストリーミング更新がバッチ計算と一致するかのテスト"""
+    period = 14
+    diffs = np.diff(close)
+    avg_g = np.clip(diffs[:period], 0, None).mean()
+    avg_l = np.clip(-diffs[:period], 0, None).mean()
+    rsi = [rsi_from_averages(avg_g, avg_l)]
+    for diff in diffs[period:]:
+        avg_g, avg_l, value = rsi_wilder_step(avg_g, avg_l, diff, period)
+        rsi.append(value)
+    np.testing.assert_allclose(rsi, rsi_wilder(close, period)[period:], rtol=1e-9)
+
+    buf = np.empty(20)
+    s = sumsq = 0.0
+    bands = []
+    for count, x in enumerate(close):
+        s, sumsq, mid, top, bot = bollinger_step(buf, count, s, sumsq, x, 2.0)
+        bands.append((mid, top, bot))
+    np.testing.assert_allclose(np.array(bands).T, np.array(bollinger_bands(close, 20, 2.0)), rtol=1e-12)
+
+    ema = close[0]
+    for x in close[1:]:
+        ema = ema_step(ema, x, 2 / 11)
+    expected = pd.Series(close).ewm(span=10, adjust=False).mean().iloc[-1]
+    assert np.isclose(ema, expected)
+
+
+def test_specialized_kernels_match_generic(close):
+    """期間固定の特殊化カーネルが汎用カーネルと一致するかのテスト"""
+    assert make_rsi(14) is make_rsi(14)
+    np.testing.assert_array_equal(make_rsi(14)(close), rsi_wilder(close, 14))
+    for special, generic in zip(make_bollinger(20, 2.0)(close), bollinger_bands(close, 20, 2.0)):
+        np.testing.assert_allclose(special, generic, rtol=1e-12)
+    np.testing.assert_array_equal(make_ema_crossover(10, 30)(close),
+                                  ema_crossover_fused(close, 10, 30))
+
+
+def test_cached_indicator_reuses_result_for_same_buffer(close):
+    """同じバッファに対する計算結果がキャッシュから返されるかのテスト"""
+    clear_indicator_cache()
+    first = cached_indicator(rsi_wilder, close, 14)
+    # 同じメモリを指す別のビューでもキャッシュヒットする
+    second = cached_indicator(rsi_wilder, close[:], 14)
+    assert second is first
+    assert not first.flags.writeable
+
+    other_period = cached_indicator(rsi_wilder, close, 21)
+    assert other_period is not first
+
+
+def test_wilder_atr_last_matches_pandas(close):
+    """ATRカーネルの最終値とpandasのWilder平滑化の比較テスト"""
+    period = 14
+    high, low = close + 0.0010, close - 0.0012
+    prev_close = pd.Series(close).shift()
+    tr = pd.concat([pd.Series(high - low), (high - prev_close).abs(),
+                    (low - prev_close).abs()], axis=1).max(axis=1)
+    # 最初の平均は単純平均、それ以降はWilder平滑化
+    tr.iloc[period] = tr.iloc[1:period + 1].mean()
+    expected = tr.iloc[period:].ewm(alpha=1 / period, adjust=False).mean().iloc[-1]
+    assert np.isclose(wilder_atr_last(high, low, close, period), expected)
+    # 系列版の最終値は最終値版と一致し、先頭period本はNaN
+    series = wilder_atr(high, low, close, period)
+    assert series[-1] == wilder_atr_last(high, low, close, period)
+    assert np.isnan(series[:period]).all() and not np.isnan(series[period:]).any()
+    # データ不足の場合はNaN
+    assert np.isnan(wilder_atr_last(high[:period], low[:period], close[:period], period))
+
+
+def test_wilder_atr_ewm_fallback_matches_kernel(close):
+    """numba非導入時のpandas ewm版ATRがカーネルと一致するかのテスト"""
+    period = 14
+    high, low = close + 0.0010, close - 0.0012
+    np.testing.assert_allclose(_wilder_atr_ewm(high, low, close, period),
+                               wilder_atr(high, low, close, period), equal_nan=True)
+    assert np.isclose(_wilder_atr_last_ewm(high, low, close, period),
+                      wilder_atr_last(high, low, close, period))
+    assert np.isnan(_wilder_atr_last_ewm(high[:period], low[:period], close[:period], period))
+
+
+def test_ohlc_ring_keeps_latest_bars(close):
+    """OHLCリングバッファが直近のバーを連続したビューで返すかのテスト"""
+    high, low = close + 0.0010, close - 0.0012
+    ring = OhlcRing(capacity=30)
+    for i in range(10):
+        ring.push(high[i], low[i], close[i])
+    assert len(ring) == 10
+    np.testing.assert_array_equal(ring.last_k(50)[2], close[:10])
+
+    # 容量を超えたら古いバーから捨てられる
+    for i in range(10, len(close)):
+        ring.push(high[i], low[i], close[i])
+    assert len(ring) == 30
+    h, l, c = ring.last_k(20)
+    np.testing.assert_array_equal(c, close[-20:])
+    assert c.flags.c_contiguous
+    assert ring.atr(14) == wilder_atr_last(high[-30:], low[-30:], close[-30:], 14)
+
+
+def test_evaluate_signal_fuses_sl_tp_and_sizing(close):
+    """SL/TP・ロット計算の融合カーネルが個別計算と一致するかのテスト"""
+    high, low = close + 0.0010, close - 0.0012
+    atr = wilder_atr_last(high, low, close, 14)
+    sl, tp, lots, ok = evaluate_signal(-1.0, close[-1], high, low, close, 14, 2.0, 3.0,
+                                       50.0, 100.0, 0.0001, 100000.0, 0.01, 10.0)
+    assert ok
+    assert np.isclose(sl, close[-1] + 2.0 * atr) and np.isclose(tp, close[-1] - 3.0 * atr)
+    assert lots == round(1000.0 / (2.0 * atr / 0.0001 * 10.0), 4)
+
+    # ATRが計算できない場合は固定pipsにフォールバック
+    sl, tp, lots, ok = evaluate_signal(1.0, 1.1, high[:5], low[:5], close[:5], 14, 2.0, 3.0,
+                                       50.0, 100.0, 0.0001, 100000.0, 0.01, 10.0)
+    assert ok and np.isclose(sl, 1.095) and np.isclose(tp, 1.11) and lots == 2.0
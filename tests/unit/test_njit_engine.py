@@ -0,0 +1,19 @@
+import numpy as np
+
+from backtest.engine.njit_runner import simulate
+
+
+def test_simulate_fills_on_next_open():
+    """シグナルの翌バー始値で約定することのテスト"""
+    open_ = np.array([1.0, 1.1, 1.2, 1.3, 1.4])
+    close = np.array([1.05, 1.15, 1.25, 1.35, 1.45])
+    signal = np.array([1.0, 0.0, -1.0, 0.0, 0.0])
+
+    equity, trades = simulate(open_, close, signal, 100.0, 0.001, 0.0, 1.0)
+
+    assert len(trades) == 1
+    entry_idx, exit_idx, entry_price, exit_price, size, pnl, pnlcomm = trades[0]
+    assert (entry_idx, exit_idx) == (1, 3)
+    assert np.isclose(pnl, 1.3 - 1.1)
+    assert np.isclose(pnlcomm, pnl - (1.1 + 1.3) * 0.001)
+    assert np.isclose(equity[-1], 100.0 + pnlcomm)
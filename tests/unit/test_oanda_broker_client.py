@@ -0,0 +1,281 @@
+"""
+OANDAブローカークライアントのユニットテスト
+"""
+import httpx
+import orjson
+import pytest
+from oandapyV20 import V20Error
+from oandapyV20.endpoints import orders
+
+from execution.abstract_broker_client import OrderStatus, RecordPool
+from execution.oanda_broker_client import OandaBrokerClient, OandaPosition, OandaTradeOrder
+
+# OANDA's rejection of a close on a side that holds no units
+NO_POSITION_ERROR = V20Error(400, orjson.dumps({
+    "errorCode": "POSITION_CLOSEOUT_FAILED",
+    "longOrderRejectTransaction": {"rejectReason": "UNITS_REDUCE_ONLY"},
+}).decode())
+
+ACCOUNT_ID = "101-001-1234567-001"
+
+
+def make_client(handler):
+    """httpx.MockTransportでリクエストを処理するクライアントを返す"""
+    client = OandaBrokerClient(access_token="test-token", account_id=ACCOUNT_ID, environment="practice")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, headers=client.headers, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_request_get_sends_params():
+    """GETリクエストでクエリパラメータが送信されるかのテスト"""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"orders": [], "lastTransactionID": "1"})
+
+    client = make_client(handler)
+    r = orders.OrderList(accountID=ACCOUNT_ID, params={"instrument": "EUR_USD", "count": 5})
+
+    assert await client._request(r) == {"orders": [], "lastTransactionID": "1"}
+    assert r.response == {"orders": [], "lastTransactionID": "1"}
+    request = seen[0]
+    assert request.method == "GET"
+    assert request.url.host == "api-fxpractice.oanda.com"
+    assert request.url.path == f"/v3/accounts/{ACCOUNT_ID}/orders"
+    assert dict(request.url.params) == {"instrument": "EUR_USD", "count": "5"}
+    assert request.headers["Authorization"] == "Bearer test-token"
+    assert request.content == b""
+
+
+@pytest.mark.asyncio
+async def test_request_post_sends_json_body():
+    """POSTリクエストでボディがJSONとして送信されるかのテスト"""
+    seen = []
+    data = {"order": {"instrument": "EUR_USD", "units": "100", "type": "MARKET"}}
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(201, json={"orderCreateTransaction": {"id": "42"}})
+
+    client = make_client(handler)
+    r = orders.OrderCreate(accountID=ACCOUNT_ID, data=data)
+
+    assert await client._request(r) == {"orderCreateTransaction": {"id": "42"}}
+    request = seen[0]
+    assert request.method == "POST"
+    assert request.url.path == f"/v3/accounts/{ACCOUNT_ID}/orders"
+    assert request.headers["Content-Type"] == "application/json"
+    assert orjson.loads(request.content) == data
+
+
+@pytest.mark.asyncio
+async def test_request_4xx_sets_response_and_cancel_order_handles_404():
+    """4xxのJSONエラーでV20Errorとr.responseが設定され、cancel_orderが404を処理するかのテスト"""
+    error_body = {"errorMessage": "Order not found", "errorCode": "ORDER_DOESNT_EXIST"}
+
+    def handler(request):
+        return httpx.Response(404, json=error_body)
+
+    client = make_client(handler)
+    r = orders.OrderCancel(accountID=ACCOUNT_ID, orderID="42")
+    with pytest.raises(V20Error) as excinfo:
+        await client._request(r)
+    assert excinfo.value.code == 404
+    assert r.response == error_body
+
+    # 注文が存在しない場合はキャンセル済みとして扱われる
+    order = await client.cancel_order("42")
+    assert order.order_id == "42"
+    assert order.status == OrderStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_request_5xx_non_json_body():
+    """JSONでない5xxエラーでV20Errorが送出され、r.responseが空になるかのテスト"""
+    def handler(request):
+        return httpx.Response(502, text="<html>Bad Gateway</html>")
+
+    client = make_client(handler)
+    r = orders.OrderDetails(accountID=ACCOUNT_ID, orderID="42")
+    with pytest.raises(V20Error) as excinfo:
+        await client._request(r)
+
+    assert excinfo.value.code == 502
+    assert "Bad Gateway" in str(excinfo.value)
+    assert r.response == {}
+
+
+def mock_close_requests(client, outcomes):
+    """
+    PositionCloseを処理する_requestのモック。outcomesはサイドごとに
+    返す約定ユニット数か送出する例外。送信されたボディを記録して返す。
+    """
+    sent = []
+
+    async def _request(r):
+        side = "long" if "longUnits" in r.data else "short"
+        sent.append(r.data)
+        outcome = outcomes[side]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        r.response = {f"{side}OrderFillTransaction": {
+            "id": f"{side}-fill", "instrument": "EUR_USD", "units": outcome}}
+        return r.response
+
+    client._request = _request
+    return sent
+
+
+def cache_sides(client, long_units, short_units):
+    """get_open_positionsが記録するサイドのキャッシュを設定する"""
+    position = OandaPosition({"instrument": "EUR_USD", "long": {"units": str(long_units)},
+                              "short": {"units": str(short_units)}})
+    client._position_sides = {"EUR_USD": (position.long_units, position.short_units)}
+
+
+@pytest.mark.asyncio
+async def test_close_position_long_only_cache_skips_short_side():
+    """買いのみ保有のキャッシュでは売り側のクローズを送信しないかのテスト"""
+    client = make_client(None)
+    cache_sides(client, 100, 0)
+    sent = mock_close_requests(client, {"long": "-100", "short": AssertionError("short side sent")})
+
+    order = await client.close_position("EUR_USD")
+
+    assert sent == [{"longUnits": "ALL"}]
+    assert order.order_id == "long-fill"
+    assert "EUR_USD" not in client._position_sides
+
+
+@pytest.mark.asyncio
+async def test_close_position_short_only_cache_skips_long_side():
+    """売りのみ保有のキャッシュでは買い側のクローズを送信しないかのテスト"""
+    client = make_client(None)
+    cache_sides(client, 0, -100)
+    sent = mock_close_requests(client, {"long": AssertionError("long side sent"), "short": "100"})
+
+    order = await client.close_position("EUR_USD")
+
+    assert sent == [{"shortUnits": "ALL"}]
+    assert order.order_id == "short-fill"
+
+
+@pytest.mark.asyncio
+async def test_close_position_partial_units():
+    """部分クローズ: 負のユニット数は買い側のみ、正のユニット数は両サイドを対象にするかのテスト"""
+    client = make_client(None)
+    sent = mock_close_requests(client, {"long": "-50", "short": NO_POSITION_ERROR})
+    order = await client.close_position("EUR_USD", units="-50")
+    assert sent == [{"longUnits": "50.0"}]
+    assert order.order_id == "long-fill"
+
+    # 売りのみ保有のキャッシュがあれば、正のユニット数でも買い側は送信しない
+    cache_sides(client, 0, -100)
+    sent = mock_close_requests(client, {"long": AssertionError("long side sent"), "short": "50"})
+    order = await client.close_position("EUR_USD", units="50")
+    assert sent == [{"shortUnits": "50.0"}]
+    assert order.order_id == "short-fill"
+
+
+@pytest.mark.asyncio
+async def test_close_position_empty_cache_tries_both_sides():
+    """キャッシュがない場合は両サイドを送信し、ポジションのない側のエラーを無視するかのテスト"""
+    client = make_client(None)
+    sent = mock_close_requests(client, {"long": NO_POSITION_ERROR, "short": "100"})
+
+    order = await client.close_position("EUR_USD")
+
+    assert sorted(sent, key=list) == [{"longUnits": "ALL"}, {"shortUnits": "ALL"}]
+    assert order.order_id == "short-fill"
+
+    # 全決済済みのキャッシュ(両サイド0)も古い可能性があるため両サイドを送信する
+    cache_sides(client, 0, 0)
+    sent = mock_close_requests(client, {"long": "-100", "short": NO_POSITION_ERROR})
+    order = await client.close_position("EUR_USD")
+    assert len(sent) == 2
+    assert order.order_id == "long-fill"
+
+
+@pytest.mark.asyncio
+async def test_close_position_failing_sides():
+    """片側または両側のクローズが失敗した場合の結果のテスト"""
+    client = make_client(None)
+    server_error = V20Error(503, "Service Unavailable")
+
+    # 買い側が成功すれば売り側のエラーは警告のみ
+    mock_close_requests(client, {"long": "-100", "short": server_error})
+    assert (await client.close_position("EUR_USD")).order_id == "long-fill"
+
+    # 両側ともポジションなし: 何もしなかったことを示す約定を返す
+    mock_close_requests(client, {"long": NO_POSITION_ERROR, "short": NO_POSITION_ERROR})
+    order = await client.close_position("EUR_USD")
+    assert order.order_id == "N/A_NO_POSITION"
+    assert order.units == 0.0
+
+    # 売り側がポジションなし以外のエラーで失敗し、買い側も失敗した場合は送出する
+    # (リトライの待機を避けるため、デコレート前のメソッドを呼ぶ)
+    mock_close_requests(client, {"long": NO_POSITION_ERROR, "short": server_error})
+    with pytest.raises(V20Error) as excinfo:
+        await OandaBrokerClient.close_position.__wrapped__(client, "EUR_USD")
+    assert excinfo.value.code == 503
+
+    # V20Error以外の例外はそのまま送出する
+    mock_close_requests(client, {"long": "-100", "short": RuntimeError("boom")})
+    with pytest.raises(RuntimeError):
+        await OandaBrokerClient.close_position.__wrapped__(client, "EUR_USD")
+
+
+
+def test_released_records_are_recycled():
+    """解放した注文・ポジションが次のacquireで再利用され、前の値を引き継がないかのテスト"""
+    for cls in (OandaTradeOrder, OandaPosition):
+        while cls._pool.get() is not None:  # 他のテストで解放されたレコードを除く
+            pass
+
+    order = OandaTradeOrder.acquire({"orderFillTransaction": {
+        "id": "1", "type": "ORDER_FILL", "instrument": "EUR_USD", "units": "100",
+        "stopLossOnFill": {"price": "1.09"}}})
+    order.release()
+    recycled = OandaTradeOrder.from_order_object({"id": "2", "instrument": "USD_JPY", "state": "PENDING"})
+    assert recycled is order
+    assert (recycled.order_id, recycled.instrument, recycled.units) == ("2", "USD_JPY", 0.0)
+    assert recycled.status == OrderStatus.PENDING
+    assert recycled.stop_loss_on_fill is None
+
+    position = OandaPosition.acquire({"instrument": "EUR_USD", "long": {"units": "100"}, "short": {"units": "0"}})
+    position.release()
+    recycled = OandaPosition.acquire({"instrument": "GBP_USD", "long": {"units": "0"}, "short": {"units": "-50"}})
+    assert recycled is position
+    assert (recycled.instrument, recycled.long_units, recycled.short_units) == ("GBP_USD", 0.0, -50.0)
+
+
+def test_double_release_is_rejected():
+    """同じレコードの二重解放が拒否され、2回のacquireが同じオブジェクトを返さないかのテスト"""
+    position = OandaPosition.acquire({"instrument": "EUR_USD", "long": {"units": "100"}, "short": {"units": "0"}})
+    position.release()
+    with pytest.raises(ValueError):
+        position.release()
+
+    data = {"instrument": "EUR_USD", "long": {"units": "0"}, "short": {"units": "0"}}
+    assert OandaPosition.acquire(data) is not OandaPosition.acquire(data)
+
+
+def test_record_pool_bounded():
+    """上限を超えた解放では最も古いレコードが破棄され、再度解放できるかのテスト"""
+    pool = RecordPool(maxsize=2)
+    first, second, third = object(), object(), object()
+    for record in (first, second, third):
+        pool.put(record)
+
+    assert len(pool) == 2
+    pool.put(first)  # 破棄済みなので再度プールできる
+    assert pool.get() is first
+    assert pool.get() is third
+    assert pool.get() is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
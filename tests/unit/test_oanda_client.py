@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 from datetime import datetime, timedelta
 
-from data_ingest.oanda_client import OandaClient
+from data_ingest.oanda_client import OandaClient, candles_to_frame
 
 class TestOandaClient:
     @pytest.fixture
@@ -153,5 +153,27 @@ class TestOandaClient:
         
         assert "API request failed" in str(excinfo.value)
 
+def test_candles_to_frame_parses_nested_mid_prices():
+    """v20形式(mid入れ子・文字列価格)のローソク足を一括でDataFrameに変換できること"""
+    candles = [
+        {"complete": True, "volume": 1000, "time": "2023-01-01T00:00:00.000000000Z",
+         "mid": {"o": "1.1000", "h": "1.1010", "l": "1.0990", "c": "1.1005"}},
+        {"complete": False, "volume": 1200, "time": "2023-01-02T00:00:00.000000000Z",
+         "mid": {"o": "1.1005", "h": "1.1020", "l": "1.1000", "c": "1.1015"}},
+    ]
+
+    df = candles_to_frame(candles)
+
+    assert list(df.columns) == ["time", "open", "high", "low", "close", "volume", "complete"]
+    assert str(df["time"].dt.tz) == "UTC"
+    assert df["close"].tolist() == [1.1005, 1.1015]
+    assert df["volume"].tolist() == [1000, 1200]
+
+    indexed = candles_to_frame(candles, time_index=True)
+    assert indexed.index.name == "time"
+    assert indexed.index.equals(pd.DatetimeIndex(df["time"]))
+    assert list(indexed.columns) == ["open", "high", "low", "close", "volume", "complete"]
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -1,12 +1,15 @@
 """
 リスク管理モジュールのユニットテスト
 """
+import gc
+import weakref
+
 import pytest
 from unittest.mock import Mock, patch
 import pandas as pd
 import numpy as np
 
-from execution.risk_manager import RiskManager
+from execution.risk_manager import RiskManager, atr_cache_info, clear_atr_cache
 
 class TestRiskManager:
     @pytest.fixture
@@ -83,5 +86,78 @@ class TestRiskManager:
         assert not is_valid
         assert "position size" in reason.lower()
 
+
+def test_calculate_position_size_batch_matches_scalar():
+    """一括ポジションサイズ計算が1件ずつの計算と一致するかのテスト"""
+    risk_manager = RiskManager(account_balance=100000.0)
+    pairs = ["EUR_USD", "USD_JPY", "GBP_USD"]
+    entries = np.array([1.1000, 150.00, 1.2500])
+    stops = np.array([1.0950, 149.50, 1.2500])  # 最後はリスクゼロ
+
+    lots = risk_manager.calculate_position_size_batch(pairs, entries, stops)
+
+    for i, pair in enumerate(pairs):
+        expected = risk_manager.calculate_position_size(pair, entries[i], stops[i])
+        if expected is None:
+            assert np.isnan(lots[i])
+        else:
+            assert lots[i] == pytest.approx(expected)
+
+
+def test_pre_trade_checks_with_open_positions():
+    """保有ポジションのDataFrameを使ったプレトレードチェックのテスト"""
+    risk_manager = RiskManager(account_balance=100000.0)
+    signal = Mock(pair="EUR_USD", action_code=1)  # EUR_USDの買い
+    open_positions = pd.DataFrame({
+        "pair": ["EUR_USD", "GBP_USD"],
+        "notional": [100000.0, 50000.0],
+        "direction": [1, -1],
+        "entry_time": pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True),
+    })
+    corr = pd.DataFrame([[1.0, 0.8], [0.8, 1.0]],
+                        index=["EUR_USD", "GBP_USD"], columns=["EUR_USD", "GBP_USD"])
+
+    # GBP_USDは売り持ちなので相関0.8でも同方向のエクスポージャーではない
+    assert risk_manager.pre_trade_checks(signal, 1.0, open_positions, correlation_matrix=corr) == (True, "")
+
+    # GBP_USDを買い持ちにすると相関チェックで拒否
+    long_gbp = open_positions.assign(direction=[1, 1])
+    passed, reason = risk_manager.pre_trade_checks(signal, 1.0, long_gbp, correlation_matrix=corr)
+    assert not passed and "correlated" in reason
+
+    # 通貨ペアごとの上限(2)に達している
+    passed, reason = risk_manager.pre_trade_checks(
+        signal, 1.0, open_positions.assign(pair=["EUR_USD", "EUR_USD"]))
+    assert not passed and "Max positions for EUR_USD" in reason
+
+    # 最大ドローダウン超過とサイズ不正
+    assert not risk_manager.pre_trade_checks(signal, 1.0, current_portfolio_value=85000.0)[0]
+    assert not risk_manager.pre_trade_checks(signal, 0.0)[0]
+
+
+def test_atr_cache_detects_in_place_update_of_last_bar():
+    """最終バーをインプレース更新した場合にATRのキャッシュが古い値を返さないかのテスト"""
+    clear_atr_cache()
+    risk_manager = RiskManager(account_balance=100000.0)
+    index = pd.date_range("2024-01-01", periods=50, freq="h")
+    close = 1.1 + np.cumsum(np.random.default_rng(0).normal(0, 0.001, len(index)))
+    df = pd.DataFrame({"high": close + 0.001, "low": close - 0.001, "close": close}, index=index)
+
+    first = risk_manager._calculate_atr(df, 14, "EUR_USD")
+    assert risk_manager._calculate_atr(df, 14, "EUR_USD") == first
+    assert atr_cache_info().hits == 1
+
+    # 確定前の最終バーを更新(高値を大きく伸ばす)
+    df.iloc[-1, df.columns.get_loc("high")] += 0.05
+    updated = risk_manager._calculate_atr(df, 14, "EUR_USD")
+    assert updated > first
+
+    # キャッシュは呼び出し元のDataFrameを保持しない
+    ref = weakref.ref(df)
+    del df
+    gc.collect()
+    assert ref() is None
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -0,0 +1,78 @@
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.strategies.ema_crossover_strategy import EMACrossoverStrategy
+from backtest.vectorized.ema_crossover import simulate
+
+
+@pytest.fixture
+def ohlcv_df():
+    """テスト用のOHLCVデータ"""
+    index = pd.date_range("2022-01-01", periods=500, freq="h")
+    rng = np.random.default_rng(42)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, len(index)))
+    return pd.DataFrame({
+        "open": close,
+        "high": close + 0.0005,
+        "low": close - 0.0005,
+        "close": close,
+        "volume": 100,
+    }, index=index)
+
+
+def test_simulate_ema_crossover(ohlcv_df):
+    """ベクトル化EMAクロスオーバーのテスト"""
+    result = simulate(ohlcv_df, short=10, long=30, cash=100000.0)
+
+    assert len(result["equity"]) == len(ohlcv_df)
+    assert "returns" in result
+    assert result["trades"]
+    for trade in result["trades"]:
+        assert trade["entry_time"] < trade["exit_time"]
+        # 手数料込みの損益は常に手数料なしの損益以下
+        assert trade["pnlcomm"] <= trade["pnl"]
+
+
+def test_simulate_without_commission_matches_trade_pnl(ohlcv_df):
+    """手数料なしの場合、最終資産はトレード損益の合計と一致する"""
+    result = simulate(ohlcv_df, cash=100000.0, comm_bps=0.0)
+    total_pnl = sum(t["pnl"] for t in result["trades"])
+    # 未決済ポジションの評価損益を除くため、最後のトレード決済時点で比較
+    last_exit = result["trades"][-1]["exit_time"]
+    assert result["equity"].loc[last_exit] == pytest.approx(100000.0 + total_pnl)
+
+
+class _ClosedTrades(bt.Analyzer):
+    """決済済みトレードの建値と損益を記録する"""
+
+    def start(self):
+        self.trades = []
+
+    def notify_trade(self, trade):
+        if trade.isclosed:
+            self.trades.append((trade.price, trade.pnl, trade.pnlcomm))
+
+    def get_analysis(self):
+        return self.trades
+
+
+def test_simulate_matches_backtrader_trades(ohlcv_df):
+    """ベクトル化シミュレーターのトレードがBacktraderと一致する"""
+    cerebro = bt.Cerebro()
+    cerebro.addstrategy(EMACrossoverStrategy, ema_short_period=10, ema_long_period=30)
+    cerebro.adddata(bt.feeds.PandasData(dataname=ohlcv_df, openinterest=None))
+    cerebro.broker.setcash(100000.0)
+    cerebro.broker.setcommission(commission=2.0 / 10000.0)
+    cerebro.addanalyzer(_ClosedTrades, _name="closed")
+    bt_trades = cerebro.run()[0].analyzers.closed.get_analysis()
+
+    result = simulate(ohlcv_df, short=10, long=30, cash=100000.0, comm_bps=2.0)
+
+    assert len(result["trades"]) == len(bt_trades)
+    for trade, (entry_price, pnl, pnlcomm) in zip(result["trades"], bt_trades):
+        assert trade["entry_price"] == pytest.approx(entry_price)
+        assert trade["pnl"] == pytest.approx(pnl)
+        assert trade["pnlcomm"] == pytest.approx(pnlcomm)
+    assert result["final_value"] == pytest.approx(cerebro.broker.getvalue())
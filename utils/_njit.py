@@ -0,0 +1,23 @@
+"""
+Optional Numba support.
+
+`njit` is numba.njit when numba is installed; otherwise it is a no-op decorator
+so the kernels still run (slowly) as plain Python.
+"""
+from typing import Any, Callable
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+        return decorator
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
@@ -0,0 +1,39 @@
+from typing import Optional
+
+import diskcache
+import orjson
+import pandas as pd
+import pyarrow as pa
+
+# Schema metadata key carrying df.attrs as JSON
+_ATTRS_METADATA_KEY = b"fx_trader.attrs"
+
+
+def store_frame(cache: diskcache.Cache, key: str, df: pd.DataFrame, expire: Optional[float] = None) -> None:
+    """
+    Stores `df` in a diskcache as a single Arrow IPC stream blob. df.attrs must
+    be JSON-serializable and travels in the schema metadata, so neither the key
+    nor the value goes through pickle.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_ATTRS_METADATA_KEY] = orjson.dumps(df.attrs)
+    table = table.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    cache.set(key, sink.getvalue().to_pybytes(), expire=expire)
+
+
+def load_frame(cache: diskcache.Cache, key: str) -> Optional[pd.DataFrame]:
+    """Returns the DataFrame stored by store_frame, or None on a cache miss."""
+    payload = cache.get(key)
+    if payload is None:
+        return None
+    table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    df = table.to_pandas()
+    attrs = (table.schema.metadata or {}).get(_ATTRS_METADATA_KEY)
+    if attrs:
+        df.attrs.update(orjson.loads(attrs))
+    return df
@@ -1,27 +1,51 @@
+import asyncio
 from typing import Any, Dict, Optional
 
 import httpx
-from tenacity import (
-    AsyncRetrying,
-    RetryError,
-    stop_after_attempt,
-    wait_exponential,
-)
+
+try:  # HTTP/2 needs the optional h2 package (httpx[http2])
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HTTP2_AVAILABLE = False
 
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Backoff bounds (seconds) between request attempts
+_RETRY_MIN_WAIT = 2.0
+_RETRY_MAX_WAIT = 10.0
+
+
+def retry_backoff(attempt: int) -> float:
+    """
+    Seconds to wait after failed attempt number `attempt` (1-based): the
+    schedule of tenacity's wait_exponential(multiplier=1, min=2, max=10),
+    i.e. 2s, 2s, 4s, 8s, then 10s.
+    """
+    return min(max(2.0 ** (attempt - 1), _RETRY_MIN_WAIT), _RETRY_MAX_WAIT)
+
+# Connection pool settings for long-lived API clients that poll the same host
+KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+
+
 async def get_async_http_client(
     base_url: Optional[str] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout: float = 30.0,
+    limits: Optional[httpx.Limits] = None,
 ) -> httpx.AsyncClient:
     """
     Creates and returns an asynchronous HTTPX client with default configurations.
+    HTTP/2 is negotiated when h2 is installed, so concurrent requests to one
+    host share a single multiplexed connection.
     """
-    return httpx.AsyncClient(base_url=base_url or "", headers=headers or {}, timeout=timeout)
+    return httpx.AsyncClient(
+        base_url=base_url or "", headers=headers or {}, timeout=timeout,
+        limits=limits or httpx.Limits(), http2=HTTP2_AVAILABLE,
+    )
 
 
 async def make_request_with_retry(
@@ -32,18 +56,19 @@ async def make_request_with_retry(
     **kwargs: Any,
 ) -> httpx.Response:
     """
-    Makes an HTTP request with retries using tenacity.
+    Makes an HTTP request, retrying any failure with exponential backoff
+    (see retry_backoff) and re-raising the last error. A plain loop
+    rather than tenacity, since this runs for every API request.
     """
-    async for attempt in AsyncRetrying(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    ):
-        with attempt:
-            logger.debug(
-                f"Attempt {attempt.retry_state.attempt_number}: {method.upper()} {client.base_url}{url}")
+    for attempt in range(1, max_attempts + 1):
+        logger.debug(
+            f"Attempt {attempt}: {method.upper()} {client.base_url}{url}")
+        try:
             response = await client.request(method, url, **kwargs)
             response.raise_for_status()  # Raise HTTPStatusError for 4xx/5xx responses
             return response
-    # Should not be reached if reraise=True
-    raise RetryError("Failed to make request after multiple retries")
+        except Exception:
+            if attempt >= max_attempts:
+                raise
+            await asyncio.sleep(retry_backoff(attempt))
+    raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")